@@ -21,9 +21,11 @@ try:
     from .ocr import text_detection
     from .ocr import template_matching
     from .ocr import homophones
+    from .ocr import ocr_cache
     from .utils import geometry
     from .utils import action_helpers
     from .cubes import cube_settings
+    from .debug import benchmarks
     print("Pathfinding module loaded: all action classes should now be registered")
 except ImportError as e:
     print(f"Error loading pathfinding modules: {e}")
@@ -7,9 +7,11 @@ Contains the main navigation algorithms, pattern detection, and grid navigation
 from . import settings
 from . import navigation  
 from . import pattern_detection
+from . import cursor_tracking
 
 __all__ = [
     'settings',
     'navigation',
-    'pattern_detection'
+    'pattern_detection',
+    'cursor_tracking'
 ]
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Motion-predicted cursor tracking for pathfinding system.
+
+During continuous navigation the cursor moves at most one menu item per key press,
+so each tick first looks for it in a window around its last position, shifted by
+how far the same key moved it last time. Only a miss falls back to searching the
+whole screen.
+"""
+
+from talon import Module, actions
+from ..ocr.template_matching import find_cursor_in_window, locate_cursor
+from ..utils.screen_capture import main_screen_bounds
+from ..utils.pathfinding_log import log
+from ..utils.worker_pool import setting
+
+mod = Module()
+
+# Unit vectors for the direction keys navigation presses
+DIRECTION_VECTORS = {
+    "up": (0, -1), "w": (0, -1),
+    "down": (0, 1), "s": (0, 1),
+    "left": (-1, 0), "a": (-1, 0),
+    "right": (1, 0), "d": (1, 0),
+}
+
+class CursorTracker:
+    """Last cursor position plus the observed move for each direction key"""
+
+    def __init__(self):
+        self.last_position = None
+        self.step_estimates = {}
+        self.window_hits = 0
+        self.window_misses = 0
+        self.full_searches = 0
+
+    def reset(self):
+        """Forget the position and step sizes (a new navigation run may be on another screen)"""
+        self.last_position = None
+        self.step_estimates = {}
+
+    def predicted_window(self, direction_key: str, size: int):
+        """(left_x, top_y, right_x, bottom_y) to search first, or None to search the full screen"""
+        if self.last_position is None or size <= 0:
+            return None
+
+        last_x, last_y = self.last_position
+        half = size // 2
+        if direction_key in self.step_estimates:
+            step_x, step_y = self.step_estimates[direction_key]
+        else:
+            # Unknown step: stretch the window half a window further in the key's direction
+            unit_x, unit_y = DIRECTION_VECTORS.get(direction_key, (0, 0))
+            step_x, step_y = unit_x * half, unit_y * half
+
+        # Cover both the last and the predicted position, in case the key did nothing
+        predicted_x, predicted_y = last_x + step_x, last_y + step_y
+        screen_left, screen_top, screen_right, screen_bottom = main_screen_bounds()
+        window = (
+            max(screen_left, int(min(last_x, predicted_x) - half)),
+            max(screen_top, int(min(last_y, predicted_y) - half)),
+            min(screen_right, int(max(last_x, predicted_x) + half)),
+            min(screen_bottom, int(max(last_y, predicted_y) + half)),
+        )
+        if window[2] - window[0] < half or window[3] - window[1] < half:
+            return None
+        return window
+
+    def observe(self, position: tuple, direction_key: str):
+        """Record where the cursor was found after direction_key was pressed"""
+        if position is None:
+            return
+        if self.last_position is not None and direction_key:
+            step = (position[0] - self.last_position[0], position[1] - self.last_position[1])
+            if step != (0, 0):
+                self.step_estimates[direction_key] = step
+        self.last_position = position
+
+# Global tracker for continuous navigation
+cursor_tracker = CursorTracker()
+
+def track_cursor(direction_key: str = None, grid: bool = False):
+    """Find the cursor near where direction_key should have moved it, widening to the full screen on a miss"""
+    window = cursor_tracker.predicted_window(direction_key, setting("user.cursor_tracking_window"))
+    position = None
+    if window:
+        position = find_cursor_in_window(window, grid)
+        if position:
+            cursor_tracker.window_hits += 1
+        else:
+            cursor_tracker.window_misses += 1
+            log.debug("Cursor not in predicted window %s, searching full screen", window)
+
+    if not position:
+        cursor_tracker.full_searches += 1
+        position = actions.user.find_grid_cursor() if grid else locate_cursor()
+
+    cursor_tracker.observe(position, direction_key)
+    return position
+
+@mod.action_class
+class CursorTrackingActions:
+    def debug_cursor_tracking() -> None:
+        """Print motion-predicted cursor tracking counters"""
+        print("=== DEBUG: CURSOR TRACKING ===")
+        print(f"Last position: {cursor_tracker.last_position}, steps: {cursor_tracker.step_estimates}")
+        print(f"Window hits: {cursor_tracker.window_hits}, misses: {cursor_tracker.window_misses}, full searches: {cursor_tracker.full_searches}")
+        print("=== END DEBUG CURSOR TRACKING ===")
@@ -9,8 +9,25 @@ from talon import Module, actions, settings, cron, screen
 from talon.canvas import Canvas
 from talon.skia.typeface import Fontstyle, Typeface
 from ..utils.action_helpers import press_action_button_multiple
+from ..ocr.text_detection import (
+    invalidate_ocr_snapshot, peek_ocr_snapshot, set_ocr_region_override,
+    begin_text_lookup, locate_text_coordinates, finish_text_lookup,
+    compile_target, get_hud_log_exclusion_region, TEXT_LOOKUP_SETTINGS,
+)
+from ..ocr.dirty_tiles import set_incremental_ocr_active, DIRTY_TILE_SETTINGS
+from ..ocr.ocr_cache import OCR_CACHE_SETTINGS
+from ..ocr.game_lexicon import get_game_lexicon
+from ..ocr.spatial_index import build_word_index, closest_match
+from ..ocr.template_cache import invalidate_shared_frame, shared_frame
+from ..ocr.template_matching import CURSOR_LOOKUP_SETTINGS
+from .cursor_tracking import cursor_tracker, track_cursor
+from ..utils.integrations import get_gaze_ocr_controller
+from ..utils.screen_capture import main_screen_bounds
+from ..utils.worker_pool import navigation_worker, main_thread_values, setting
+from ..utils.pathfinding_log import log, TRACE
 from . import settings as pathfinding_settings
 import numpy as np
+import math
 
 mod = Module()
 
@@ -19,6 +36,14 @@ navigation_job = None
 navigation_steps_taken = 0
 last_direction_pressed = None
 cursor_position_history = []
+# Bumped on every start/stop so late worker results from an earlier run are ignored
+navigation_run = 0
+
+# Settings locate_navigation_targets reads, looked up on the main thread before each worker job
+NAVIGATION_WORKER_SETTINGS = (
+    ("user.cursor_tracking_window", "user.highlight_proximity_x", "user.highlight_proximity_y")
+    + TEXT_LOOKUP_SETTINGS + CURSOR_LOOKUP_SETTINGS + OCR_CACHE_SETTINGS + DIRTY_TILE_SETTINGS
+)
 
 # Global variables for disambiguation
 disambiguation_canvas = None
@@ -50,18 +75,9 @@ def show_disambiguation():
         if not ambiguous_matches:
             return
             
-        # Get OCR controller for screenshot
-        import sys
-        gaze_ocr_controller = None
-        for module_name, module in sys.modules.items():
-            if 'gaze_ocr' in module_name and hasattr(module, 'gaze_ocr_controller'):
-                gaze_ocr_controller = module.gaze_ocr_controller
-                break
-        
-        if not gaze_ocr_controller:
+        # Numbers are only drawn while the OCR integration is available
+        if not get_gaze_ocr_controller():
             return
-            
-        contents = gaze_ocr_controller.latest_screen_contents()
         
         used_locations = set()
         for i, match in enumerate(ambiguous_matches):
@@ -73,8 +89,7 @@ def show_disambiguation():
             coords = match.get('coords', (0, 0))
             location = (coords[0], coords[1])
             
-            # DEBUG: Log number positioning
-            print(f"DEBUG NUMBER POSITIONING: Option {i+1} text='{match.get('text', 'UNKNOWN')}' original_coords={coords} display_location={location}")
+            log.trace("Number positioning: option %d text='%s' original_coords=%s display_location=%s", i + 1, match.get('text', 'UNKNOWN'), coords, location)
             
             # Avoid overlapping numbers
             original_location = location
@@ -82,9 +97,8 @@ def show_disambiguation():
                 location = (location[0] + 20, location[1])
             used_locations.add(location)
             
-            # DEBUG: Log if location changed due to overlap
             if location != original_location:
-                print(f"DEBUG NUMBER POSITIONING: Option {i+1} moved from {original_location} to {location} due to overlap")
+                log.trace("Number positioning: option %d moved from %s to %s due to overlap", i + 1, original_location, location)
             
             number_text = str(i + 1)
             
@@ -126,63 +140,56 @@ def find_currently_selected_word(cursor_pos):
     """
     try:
         # Get OCR data using same method as get_text_coordinates
-        import sys
-        gaze_ocr_controller = None
-
-        # Find the OCR controller
-        for module_name, module in sys.modules.items():
-            if 'gaze_ocr' in module_name and hasattr(module, 'gaze_ocr_controller'):
-                gaze_ocr_controller = module.gaze_ocr_controller
-                break
+        gaze_ocr_controller = get_gaze_ocr_controller()
 
         if not gaze_ocr_controller:
             print("ERROR: Could not find gaze_ocr_controller for selected word detection")
             return None
 
-        # Get the latest OCR scan (should already be available from recent navigation)
-        contents = gaze_ocr_controller.latest_screen_contents()
+        # Prefer this command's OCR snapshot, otherwise the latest scan from recent navigation
+        snapshot = peek_ocr_snapshot()
+        contents = snapshot.contents if snapshot else gaze_ocr_controller.latest_screen_contents()
         if not contents or not contents.result or not contents.result.lines:
             print("No OCR data available for selected word detection")
             return None
+        word_index = snapshot.word_index if snapshot else build_word_index(contents.result.lines)
 
         cursor_x, cursor_y = cursor_pos
         candidates = []
 
         # Get proximity settings
-        proximity_x = settings.get("user.highlight_proximity_x", 70)
-        proximity_y = settings.get("user.highlight_proximity_y", 50)
-        max_gap = settings.get("user.phrase_adjacency_gap", 80)
-
-        # Search all words for candidates near cursor
-        for line_idx, line in enumerate(contents.result.lines):
-            for word_idx, word in enumerate(line.words):
-                word_left_x = word.left
-                word_center_y = word.top + word.height // 2
-
-                # Word must be within proximity range of cursor
-                if word_left_x > cursor_x - proximity_x:
-                    vertical_distance = abs(word_center_y - cursor_y)
-                    if vertical_distance <= proximity_y:
-                        is_likely_fragment = len(word.text.strip()) <= 1
-
-                        # Calculate distance — use absolute distance for all words
-                        distance_from_cursor = abs(word_left_x - cursor_x)
-
-                        candidates.append({
-                            'text': word.text,
-                            'coords': (word_left_x, word_center_y),
-                            'distance_from_cursor': distance_from_cursor,
-                            'vertical_distance': vertical_distance,
-                            'is_above_cursor': word_center_y < cursor_y,
-                            'is_likely_fragment': is_likely_fragment,
-                            'word_length': len(word.text.strip()),
-                            'is_right_of_cursor': word_left_x >= cursor_x,
-                            'line_idx': line_idx,
-                            'word_idx': word_idx
-                        })
+        proximity_x = setting("user.highlight_proximity_x", 70)
+        proximity_y = setting("user.highlight_proximity_y", 50)
+        max_gap = setting("user.phrase_adjacency_gap", 80)
+
+        # Only visit words within proximity range of cursor (right of cursor_x - proximity_x, any distance)
+        nearby_words = word_index.query_rect(cursor_x - proximity_x, cursor_y - proximity_y, math.inf, cursor_y + proximity_y)
+        for line_idx, word_idx, word in nearby_words:
+            word_left_x = word.left
+            word_center_y = word.top + word.height // 2
+
+            if word_left_x > cursor_x - proximity_x:
+                vertical_distance = abs(word_center_y - cursor_y)
+                is_likely_fragment = len(word.text.strip()) <= 1
+
+                # Calculate distance — use absolute distance for all words
+                distance_from_cursor = abs(word_left_x - cursor_x)
+
+                candidates.append({
+                    'text': word.text,
+                    'coords': (word_left_x, word_center_y),
+                    'distance_from_cursor': distance_from_cursor,
+                    'vertical_distance': vertical_distance,
+                    'is_above_cursor': word_center_y < cursor_y,
+                    'is_likely_fragment': is_likely_fragment,
+                    'word_length': len(word.text.strip()),
+                    'is_right_of_cursor': word_left_x >= cursor_x,
+                    'line_idx': line_idx,
+                    'word_idx': word_idx
+                })
 
         if not candidates:
-            print(f"No words found near cursor at {cursor_pos}")
+            log.debug("No words found near cursor at %s", cursor_pos)
             return None
 
         # Selection logic prioritizing proper menu items
@@ -190,13 +197,13 @@ def find_currently_selected_word(cursor_pos):
         non_fragments = [c for c in candidates if not c['is_likely_fragment']]
         if non_fragments:
             candidates = non_fragments
-            print(f"Filtered out {len([c for c in candidates if c['is_likely_fragment']])} single-character candidates")
+            log.trace("Filtered out single-character candidates, %d remaining", len(candidates))
 
         # 2. Prioritize words ABOVE cursor (typical menu item position)
         words_above = [c for c in candidates if c['is_above_cursor']]
         if words_above:
             candidates = words_above
-            print(f"Prioritizing {len(words_above)} words above cursor position")
+            log.trace("Prioritizing %d words above cursor position", len(words_above))
 
         # 3. Sort by absolute proximity - closest word to cursor
         selected_word = min(candidates, key=lambda w: w['distance_from_cursor'])
@@ -235,32 +242,21 @@ def find_currently_selected_word(cursor_pos):
             'is_right_of_cursor': first_word.left >= cursor_x,
         }
 
-        # Debug logging
-        print(f"=== SELECTED WORD DETECTION RESULTS ===")
-        print(f"Cursor position: {cursor_pos}")
-
-        try:
+        # Debug logging (candidate detail only at trace level)
+        if log.enabled(TRACE):
             from ..ocr.template_matching import last_successful_cursor_file
-            if last_successful_cursor_file:
-                print(f"Cursor detected using: {last_successful_cursor_file}")
-            else:
-                print("Cursor filename: None (no successful cursor detected)")
-        except Exception as e:
-            print(f"Cursor filename: Error accessing ({e})")
-
-        print(f"Final candidates after filtering:")
-        for i, candidate in enumerate(sorted(candidates, key=lambda w: w['distance_from_cursor'])):
-            marker = "← CLOSEST" if candidate == selected_word else ""
-            right_marker = "→" if candidate.get('is_right_of_cursor', False) else "←"
-            print(f"  {i+1}. '{candidate['text']}' at {candidate['coords']} "
-                  f"(horiz_dist: {candidate['distance_from_cursor']:.1f}, "
-                  f"vert_dist: {candidate['vertical_distance']:.1f}, "
-                  f"above: {candidate['is_above_cursor']}, "
-                  f"direction: {right_marker}) {marker}")
+            log.trace("=== SELECTED WORD DETECTION RESULTS ===")
+            log.trace("Cursor position: %s, detected using: %s", cursor_pos, last_successful_cursor_file)
+            for i, candidate in enumerate(sorted(candidates, key=lambda w: w['distance_from_cursor'])):
+                marker = "← CLOSEST" if candidate == selected_word else ""
+                right_marker = "→" if candidate.get('is_right_of_cursor', False) else "←"
+                log.trace("  %d. '%s' at %s (horiz_dist: %.1f, vert_dist: %.1f, above: %s, direction: %s) %s",
+                          i + 1, candidate['text'], candidate['coords'], candidate['distance_from_cursor'],
+                          candidate['vertical_distance'], candidate['is_above_cursor'], right_marker, marker)
         if len(phrase_words) > 1:
-            print(f"EXPANDED to phrase: '{phrase_text}' at {phrase_coords} (from {len(phrase_words)} adjacent words)")
+            log.debug("EXPANDED to phrase: '%s' at %s (from %d adjacent words)", phrase_text, phrase_coords, len(phrase_words))
         else:
-            print(f"SELECTED: '{result['text']}' at {result['coords']}")
+            log.debug("SELECTED: '%s' at %s", result['text'], result['coords'])
 
         return result
 
@@ -268,6 +264,336 @@ def find_currently_selected_word(cursor_pos):
         print(f"Error in find_currently_selected_word: {e}")
         return None
 
+def dump_navigation_failure(reason: str):
+    """Print the recent pathfinding log when navigation gives up"""
+    count = settings.get("user.pathfinding_log_dump_on_failure")
+    if count > 0:
+        log.dump(reason, count)
+
+def follow_target_coords(target_coords: tuple, navigation_mode: str) -> tuple:
+    """Resolve pre-resolved target coordinates, following the mouse when enabled; returns (coords, mode)
+
+    Runs on the main thread: it reads the mouse and draws the target crosshair.
+    """
+    if settings.get("user.mouse_following_navigation"):
+        # Mouse-following mode: continuously track mouse position with hysteresis
+        from talon import ctrl
+        current_mouse_pos = ctrl.mouse_pos()
+
+        # Calculate distance from original target
+        distance_moved = actions.user.calculate_distance(target_coords, current_mouse_pos)
+
+        # Only update target if mouse moved significantly (prevents jitter)
+        if distance_moved > 30:
+            print(f"Mouse moved {distance_moved:.1f}px, updating target: {target_coords} -> {current_mouse_pos}")
+            text_coords = current_mouse_pos
+        else:
+            text_coords = target_coords
+
+        # Override navigation mode to unified for mouse-following (grid allows all directions)
+        navigation_mode = "unified"
+        print(f"Mouse-following mode: overriding navigation mode to 'unified'")
+    else:
+        # Pre-resolved coordinates mode: use fixed target position
+        text_coords = target_coords
+
+    # Show/update target crosshair
+    actions.user.show_target_crosshair(text_coords)
+
+    return text_coords, navigation_mode
+
+def begin_step_text_lookup(target_text: str, text_coords: tuple = None):
+    """HUD and eye tracker bookkeeping around a step's text lookup; returns the function that finishes it
+
+    Nothing is needed when the target coordinates are already resolved. Both the
+    synchronous and the worker step call the returned function once the lookup is over.
+    """
+    if text_coords:
+        return lambda: None
+    begin_text_lookup()
+    return lambda: finish_text_lookup(target_text)
+
+def read_navigation_worker_values() -> dict:
+    """Settings and Talon state locate_navigation_targets needs, read on the main thread for the worker"""
+    values = {name: settings.get(name) for name in NAVIGATION_WORKER_SETTINGS}
+    values.update({
+        "screen_bounds": main_screen_bounds(),
+        "ocr_controller": get_gaze_ocr_controller(),
+        "hud_log_region": get_hud_log_exclusion_region(),
+        "game_lexicon": get_game_lexicon(),
+    })
+    return values
+
+def locate_navigation_targets(target_text: str, text_coords: tuple = None, compiled_target=None, direction_key: str = None) -> dict:
+    """Find the target text (unless already resolved), the cursor highlight and the selected word
+
+    Only captures the screen, runs OCR and matches templates - no keys, canvases, HUD or
+    eye tracker changes, Talon actions or settings reads - so it can run on the navigation
+    worker between begin_step_text_lookup() and its finish, inside main_thread_values.use()
+    with read_navigation_worker_values() and a compiled_target from compile_target().
+    highlight_center is None when no cursor template matched; locate_highlight_fallback()
+    finishes the targets on the main thread. Returns {'error': reason} when navigation
+    cannot continue.
+    """
+    # Every template match of the tick shares one capture, taken fresh for this tick
+    with shared_frame.lookup():
+        if not text_coords:
+            text_coords = locate_text_coordinates(target_text, compiled_target)
+            if not text_coords:
+                return {'error': f"Could not find text: {target_text}"}
+
+        # Try flexible cursor detection first (game-specific cursors), near where the last key moved it
+        highlight_center = track_cursor(direction_key)
+        if not highlight_center:
+            return {'text_coords': text_coords, 'highlight_center': None, 'selected_word': None}
+
+        log.debug("Found highlight using flexible template matching")
+        return {
+            'text_coords': text_coords,
+            'highlight_center': highlight_center,
+            'selected_word': find_currently_selected_word(highlight_center),
+        }
+
+def locate_highlight_fallback(located: dict, highlight_image: str) -> dict:
+    """Find the highlight image through mouse_helper when no cursor template matched; main thread only"""
+    if 'error' in located or located['highlight_center']:
+        return located
+
+    # Fallback to original method
+    images_to_click_location = "/Users/jarrod/.talon/user/jarrod/gaming/images_to_click/"
+    highlight_coords = actions.user.mouse_helper_find_template_relative(
+        f"{images_to_click_location}{highlight_image}"
+    )
+    if not highlight_coords:
+        return {'error': f"Could not find highlight image: {highlight_image} - stopping navigation"}
+
+    log.debug("Found %d highlight matches using standard method", len(highlight_coords))
+    highlight_rect = highlight_coords[0]
+    highlight_center = (highlight_rect.x + highlight_rect.width//2, highlight_rect.y + highlight_rect.height//2)
+    return dict(located, highlight_center=highlight_center, selected_word=find_currently_selected_word(highlight_center))
+
+def apply_navigation_step(located: dict, target_text: str, use_wasd: bool, extra_step: bool, action_button: str, action_count: int, action_interval: float, target_coords: tuple, navigation_mode: str) -> bool:
+    """Arrival check and next key press for one step, from the targets locate_navigation_targets found
+
+    Runs on the main thread. Returns True once the target is reached.
+    """
+    global navigation_steps_taken, last_direction_pressed, cursor_position_history
+
+    if 'error' in located:
+        log.error(located['error'])
+        dump_navigation_failure(located['error'])
+        actions.user.stop_continuous_navigation()
+        return False
+
+    text_coords = located['text_coords']
+    highlight_center = located['highlight_center']
+    selected_word = located['selected_word']
+
+    # Loop detection - check if we've been here before
+    cursor_position_history.append(highlight_center)
+    if len(cursor_position_history) > 12:  # Keep last 12 positions for better pattern detection
+        cursor_position_history.pop(0)
+    
+    navigation_source = highlight_center  # Default fallback to cursor position
+
+    if selected_word:
+        # Use selected word coordinates for direction calculation
+        navigation_source = selected_word['coords']
+        log.debug("=== WORD-TO-WORD NAVIGATION ===")
+        log.debug("Selected word: '%s' at %s", selected_word['text'], navigation_source)
+        log.debug("Target word: '%s' at %s", target_text, text_coords)
+    else:
+        # Fallback to cursor-based navigation
+        log.debug("=== CURSOR-BASED NAVIGATION (fallback) ===")
+        log.debug("Cursor coords: %s", highlight_center)
+        log.debug("Target '%s' coords: %s", target_text, text_coords)
+
+    # Calculate direction using selected word (or cursor fallback) → target
+    x_diff = text_coords[0] - navigation_source[0]
+    y_diff = text_coords[1] - navigation_source[1]
+
+    # But use cursor position for proximity detection (arrival check)
+    cursor_x_diff = text_coords[0] - highlight_center[0]
+    cursor_y_diff = text_coords[1] - highlight_center[1]
+
+    # Get configurable proximity settings
+    proximity_x = settings.get("user.highlight_proximity_x")
+    proximity_y = settings.get("user.highlight_proximity_y")
+
+    # Proximity thresholds no longer need adjustment for disambiguation (coordinate bug fixed)
+    if target_coords:
+        log.debug("Using standard proximity for disambiguation: %sx%spx", proximity_x, proximity_y)
+    
+    log.debug("Direction calculation - X diff: %.1f, Y diff: %.1f", x_diff, y_diff)
+    log.debug("Proximity check (cursor) - X diff: %.1f, Y diff: %.1f", cursor_x_diff, cursor_y_diff)
+    log.debug("Mode: %s", navigation_mode)
+    
+    if navigation_mode == "vertical":
+        # Vertical mode - Y check only (use cursor position for proximity)
+        is_on_target = abs(cursor_y_diff) <= proximity_y
+        log.debug("Vertical mode - Y close: %s <= %s, On target: %s", abs(cursor_y_diff), proximity_y, is_on_target)
+    elif navigation_mode == "horizontal":
+        # Horizontal mode - X check only (use cursor position for proximity)
+        is_on_target = abs(cursor_x_diff) <= proximity_x
+        log.debug("Horizontal mode - X close: %s <= %s, On target: %s", abs(cursor_x_diff), proximity_x, is_on_target)
+    else:
+        # Unified mode - use configurable X/Y proximity (use cursor position for proximity)
+        is_on_target = abs(cursor_x_diff) <= proximity_x and abs(cursor_y_diff) <= proximity_y
+        log.debug("Unified mode - X close: %s <= %s, Y close: %s <= %s, On target: %s", abs(cursor_x_diff), proximity_x, abs(cursor_y_diff), proximity_y, is_on_target)
+    
+    if is_on_target:
+        # Any key sent from here changes the screen, so the OCR snapshot is stale
+        invalidate_ocr_snapshot("navigation target reached")
+        invalidate_shared_frame()
+        if action_button:
+            print(f"Reached target! Pressing action button: {action_button}")
+            press_action_button_multiple(action_button, action_count, action_interval)
+            actions.user.stop_continuous_navigation()
+            return True
+        elif extra_step and last_direction_pressed:
+            print(f"Reached target! Taking extra step with {last_direction_pressed}")
+            actions.key(last_direction_pressed)
+            actions.user.stop_continuous_navigation()
+            return True
+        else:
+            print(f"Reached target!")
+            actions.user.stop_continuous_navigation()
+            return True
+
+    # Calculate direction and move
+    log.debug("Continuing navigation - X diff: %.1f, Y diff: %.1f", x_diff, y_diff)
+    
+    if navigation_mode == "vertical":
+        # Vertical mode - prioritize vertical movement
+        if abs(y_diff) > 10:
+            if y_diff > 0:
+                key_to_press = "s" if use_wasd else "down"
+                log.debug("Pressing %s (down)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+            else:
+                key_to_press = "w" if use_wasd else "up"
+                log.debug("Pressing %s (up)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+        else:
+            # Move horizontally when vertically aligned
+            if x_diff > 0:
+                key_to_press = "d" if use_wasd else "right"
+                log.debug("Pressing %s (right)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+            else:
+                key_to_press = "a" if use_wasd else "left"
+                log.debug("Pressing %s (left)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+    elif navigation_mode == "horizontal":
+        # Horizontal mode - prioritize horizontal movement
+        if abs(x_diff) > proximity_x:
+            if x_diff > 0:
+                key_to_press = "d" if use_wasd else "right"
+                log.debug("Pressing %s (right)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+            else:
+                key_to_press = "a" if use_wasd else "left"
+                log.debug("Pressing %s (left)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+        else:
+            # Move vertically when horizontally aligned
+            if y_diff > 0:
+                key_to_press = "s" if use_wasd else "down"
+                log.debug("Pressing %s (down)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+            else:
+                key_to_press = "w" if use_wasd else "up"
+                log.debug("Pressing %s (up)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+    else:
+        # Unified mode - move in direction with larger difference
+        if abs(x_diff) > abs(y_diff):
+            if x_diff > 0:
+                key_to_press = "d" if use_wasd else "right"
+                log.debug("Pressing %s (right)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+            else:
+                key_to_press = "a" if use_wasd else "left"
+                log.debug("Pressing %s (left)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+        else:
+            if y_diff > 0:
+                key_to_press = "s" if use_wasd else "down"
+                log.debug("Pressing %s (down)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+            else:
+                key_to_press = "w" if use_wasd else "up"
+                log.debug("Pressing %s (up)", key_to_press)
+                actions.key(key_to_press)
+                last_direction_pressed = key_to_press
+    
+    # The direction key moved the highlight, so the OCR snapshot and shared capture are stale
+    invalidate_ocr_snapshot(f"pressed {last_direction_pressed}")
+    invalidate_shared_frame()
+
+    # Increment step counter
+    navigation_steps_taken += 1        
+    return False  # Continue navigation
+
+def submit_navigation_step(run: int, target_text: str, highlight_image: str, use_wasd: bool, max_steps: int, extra_step: bool, action_button: str, action_count: int, action_interval: float, target_coords: tuple):
+    """Async navigation tick: locate targets on the worker, then apply the step on the main thread
+
+    The tick is dropped when the previous one is still being located.
+    """
+    log.refresh()
+    navigation_mode = settings.get("user.navigation_mode")
+    if navigation_mode == "grid":
+        # Grid navigation has its own step logic and stays synchronous
+        actions.user.navigate_step(target_text, highlight_image, use_wasd, max_steps, extra_step, action_button, action_count, action_interval, target_coords)
+        return
+    if navigation_worker.busy:
+        navigation_worker.dropped += 1
+        return
+
+    text_coords = None
+    if target_coords:
+        text_coords, navigation_mode = follow_target_coords(target_coords, navigation_mode)
+    # Everything the worker would otherwise ask Talon for is read here, on the main thread
+    compiled_target = None if text_coords else compile_target(target_text)
+    worker_values = read_navigation_worker_values()
+    direction_key = last_direction_pressed
+    finish_lookup = begin_step_text_lookup(target_text, text_coords)
+
+    def locate():
+        with main_thread_values.use(worker_values):
+            return locate_navigation_targets(target_text, text_coords, compiled_target, direction_key)
+
+    def step_located(located):
+        finish_lookup()
+        if run != navigation_run or navigation_job is None:
+            return  # Navigation stopped or restarted while the worker was busy
+        try:
+            located = locate_highlight_fallback(located, highlight_image)
+            apply_navigation_step(located, target_text, use_wasd, extra_step, action_button, action_count, action_interval, target_coords, navigation_mode)
+        except Exception as e:
+            log.error("Navigation step error: %s", e)
+            dump_navigation_failure(f"navigation step error: {e}")
+            actions.user.stop_continuous_navigation()
+
+    def step_failed(error):
+        finish_lookup()
+        if run == navigation_run and navigation_job is not None:
+            dump_navigation_failure(f"navigation worker error: {error}")
+            actions.user.stop_continuous_navigation()
+
+    navigation_worker.submit_if_idle(locate, step_located, step_failed)
+
 @mod.action_class
 class CoreNavigationActions:
     def navigate_step(target_text: str, highlight_image: str, use_wasd: bool, max_steps: int = None, extra_step: bool = False, action_button: str = None, action_count: int = 1, action_interval: float = 0.1, target_coords: tuple = None) -> bool:
@@ -276,8 +602,8 @@ class CoreNavigationActions:
         Args:
             target_coords: Optional pre-resolved coordinates (x, y). If provided, skips text detection.
         """
-        global navigation_steps_taken, last_direction_pressed, cursor_position_history
-        
+        log.refresh()
+
         # Check navigation mode - use grid navigation if enabled
         navigation_mode = settings.get("user.navigation_mode")
         if navigation_mode == "grid":
@@ -287,211 +613,21 @@ class CoreNavigationActions:
 
         try:
             # Get current coordinates - use pre-resolved coordinates if provided
+            text_coords = None
             if target_coords:
-                if settings.get("user.mouse_following_navigation"):
-                    # Mouse-following mode: continuously track mouse position with hysteresis
-                    from talon import ctrl
-                    current_mouse_pos = ctrl.mouse_pos()
-
-                    # Calculate distance from original target
-                    distance_moved = actions.user.calculate_distance(target_coords, current_mouse_pos)
-
-                    # Only update target if mouse moved significantly (prevents jitter)
-                    if distance_moved > 30:
-                        print(f"Mouse moved {distance_moved:.1f}px, updating target: {target_coords} -> {current_mouse_pos}")
-                        text_coords = current_mouse_pos
-                    else:
-                        text_coords = target_coords
-
-                    # Override navigation mode to unified for mouse-following (grid allows all directions)
-                    navigation_mode = "unified"
-                    print(f"Mouse-following mode: overriding navigation mode to 'unified'")
-                else:
-                    # Pre-resolved coordinates mode: use fixed target position
-                    text_coords = target_coords
-
-                # Show/update target crosshair
-                actions.user.show_target_crosshair(text_coords)
-            else:
-                text_coords = actions.user.get_text_coordinates(target_text)
-                if not text_coords:
-                    print(f"Could not find text: {target_text}")
-                    actions.user.stop_continuous_navigation()
-                    return False
-
-            # Try flexible cursor detection first (game-specific cursors), fall back to standard method
-            highlight_center = actions.user.find_cursor_flexible()
-            if not highlight_center:
-                # Fallback to original method
-                images_to_click_location = "/Users/jarrod/.talon/user/jarrod/gaming/images_to_click/"
-                highlight_coords = actions.user.mouse_helper_find_template_relative(
-                    f"{images_to_click_location}{highlight_image}"
-                )
-                if not highlight_coords:
-                    print(f"Could not find highlight image: {highlight_image} - stopping navigation")
-                    actions.user.stop_continuous_navigation()
-                    return False
-                
-                print(f"Found {len(highlight_coords)} highlight matches using standard method")
-                highlight_rect = highlight_coords[0]
-                highlight_center = (highlight_rect.x + highlight_rect.width//2, highlight_rect.y + highlight_rect.height//2)
-            else:
-                print(f"Found highlight using flexible template matching")
-            
-            # Loop detection - check if we've been here before
-            cursor_position_history.append(highlight_center)
-            if len(cursor_position_history) > 12:  # Keep last 12 positions for better pattern detection
-                cursor_position_history.pop(0)
-            
-            # NEW: Find currently selected word for direction calculation
-            selected_word = find_currently_selected_word(highlight_center)
-            navigation_source = highlight_center  # Default fallback to cursor position
-
-            if selected_word:
-                # Use selected word coordinates for direction calculation
-                navigation_source = selected_word['coords']
-                print(f"=== WORD-TO-WORD NAVIGATION ===")
-                print(f"Selected word: '{selected_word['text']}' at {navigation_source}")
-                print(f"Target word: '{target_text}' at {text_coords}")
-            else:
-                # Fallback to cursor-based navigation
-                print(f"=== CURSOR-BASED NAVIGATION (fallback) ===")
-                print(f"Cursor coords: {highlight_center}")
-                print(f"Target '{target_text}' coords: {text_coords}")
+                text_coords, navigation_mode = follow_target_coords(target_coords, navigation_mode)
 
-            # Calculate direction using selected word (or cursor fallback) → target
-            x_diff = text_coords[0] - navigation_source[0]
-            y_diff = text_coords[1] - navigation_source[1]
-
-            # But use cursor position for proximity detection (arrival check)
-            cursor_x_diff = text_coords[0] - highlight_center[0]
-            cursor_y_diff = text_coords[1] - highlight_center[1]
-
-            # Get configurable proximity settings
-            proximity_x = settings.get("user.highlight_proximity_x")
-            proximity_y = settings.get("user.highlight_proximity_y")
-
-            # Proximity thresholds no longer need adjustment for disambiguation (coordinate bug fixed)
-            if target_coords:
-                print(f"Using standard proximity for disambiguation: {proximity_x}x{proximity_y}px")
-            
-            print(f"Direction calculation - X diff: {x_diff:.1f}, Y diff: {y_diff:.1f}")
-            print(f"Proximity check (cursor) - X diff: {cursor_x_diff:.1f}, Y diff: {cursor_y_diff:.1f}")
-            print(f"Mode: {navigation_mode}")
-            
-            if navigation_mode == "vertical":
-                # Vertical mode - Y check only (use cursor position for proximity)
-                is_on_target = abs(cursor_y_diff) <= proximity_y
-                print(f"Vertical mode - Y close: {abs(cursor_y_diff)} <= {proximity_y}, On target: {is_on_target}")
-            elif navigation_mode == "horizontal":
-                # Horizontal mode - X check only (use cursor position for proximity)
-                is_on_target = abs(cursor_x_diff) <= proximity_x
-                print(f"Horizontal mode - X close: {abs(cursor_x_diff)} <= {proximity_x}, On target: {is_on_target}")
-            else:
-                # Unified mode - use configurable X/Y proximity (use cursor position for proximity)
-                is_on_target = abs(cursor_x_diff) <= proximity_x and abs(cursor_y_diff) <= proximity_y
-                print(f"Unified mode - X close: {abs(cursor_x_diff)} <= {proximity_x}, Y close: {abs(cursor_y_diff)} <= {proximity_y}, On target: {is_on_target}")
-            
-            if is_on_target:
-                if action_button:
-                    print(f"Reached target! Pressing action button: {action_button}")
-                    press_action_button_multiple(action_button, action_count, action_interval)
-                    actions.user.stop_continuous_navigation()
-                    return True
-                elif extra_step and last_direction_pressed:
-                    print(f"Reached target! Taking extra step with {last_direction_pressed}")
-                    actions.key(last_direction_pressed)
-                    actions.user.stop_continuous_navigation()
-                    return True
-                else:
-                    print(f"Reached target!")
-                    actions.user.stop_continuous_navigation()
-                    return True
+            finish_lookup = begin_step_text_lookup(target_text, text_coords)
+            try:
+                located = locate_navigation_targets(target_text, text_coords, direction_key=last_direction_pressed)
+                located = locate_highlight_fallback(located, highlight_image)
+            finally:
+                finish_lookup()
+            return apply_navigation_step(located, target_text, use_wasd, extra_step, action_button, action_count, action_interval, target_coords, navigation_mode)
 
-            # Calculate direction and move
-            print(f"Continuing navigation - X diff: {x_diff:.1f}, Y diff: {y_diff:.1f}")
-            
-            if navigation_mode == "vertical":
-                # Vertical mode - prioritize vertical movement
-                if abs(y_diff) > 10:
-                    if y_diff > 0:
-                        key_to_press = "s" if use_wasd else "down"
-                        print(f"Pressing {key_to_press} (down)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-                    else:
-                        key_to_press = "w" if use_wasd else "up"
-                        print(f"Pressing {key_to_press} (up)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-                else:
-                    # Move horizontally when vertically aligned
-                    if x_diff > 0:
-                        key_to_press = "d" if use_wasd else "right"
-                        print(f"Pressing {key_to_press} (right)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-                    else:
-                        key_to_press = "a" if use_wasd else "left"
-                        print(f"Pressing {key_to_press} (left)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-            elif navigation_mode == "horizontal":
-                # Horizontal mode - prioritize horizontal movement
-                if abs(x_diff) > proximity_x:
-                    if x_diff > 0:
-                        key_to_press = "d" if use_wasd else "right"
-                        print(f"Pressing {key_to_press} (right)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-                    else:
-                        key_to_press = "a" if use_wasd else "left"
-                        print(f"Pressing {key_to_press} (left)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-                else:
-                    # Move vertically when horizontally aligned
-                    if y_diff > 0:
-                        key_to_press = "s" if use_wasd else "down"
-                        print(f"Pressing {key_to_press} (down)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-                    else:
-                        key_to_press = "w" if use_wasd else "up"
-                        print(f"Pressing {key_to_press} (up)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-            else:
-                # Unified mode - move in direction with larger difference
-                if abs(x_diff) > abs(y_diff):
-                    if x_diff > 0:
-                        key_to_press = "d" if use_wasd else "right"
-                        print(f"Pressing {key_to_press} (right)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-                    else:
-                        key_to_press = "a" if use_wasd else "left"
-                        print(f"Pressing {key_to_press} (left)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-                else:
-                    if y_diff > 0:
-                        key_to_press = "s" if use_wasd else "down"
-                        print(f"Pressing {key_to_press} (down)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-                    else:
-                        key_to_press = "w" if use_wasd else "up"
-                        print(f"Pressing {key_to_press} (up)")
-                        actions.key(key_to_press)
-                        last_direction_pressed = key_to_press
-            
-            # Increment step counter
-            navigation_steps_taken += 1        
-            return False  # Continue navigation
-            
         except Exception as e:
-            print(f"Navigation step error: {str(e)}")
+            log.error("Navigation step error: %s", e)
+            dump_navigation_failure(f"navigation step error: {e}")
             actions.user.stop_continuous_navigation()
             return False
 
@@ -501,7 +637,7 @@ class CoreNavigationActions:
         Args:
             target_coords: Optional pre-resolved coordinates (x, y). If provided, skips text detection.
         """
-        global navigation_job, navigation_steps_taken, last_direction_pressed, cursor_position_history
+        global navigation_job, navigation_steps_taken, last_direction_pressed, cursor_position_history, navigation_run
         
         # Stop any existing navigation
         if navigation_job:
@@ -512,6 +648,12 @@ class CoreNavigationActions:
         navigation_steps_taken = 0
         last_direction_pressed = None
         cursor_position_history = []
+        navigation_run += 1
+        run = navigation_run
+        cursor_tracker.reset()
+        
+        # Re-read only changed tiles between ticks of this run
+        set_incremental_ocr_active(True)
         
         navigation_interval = settings.get("user.navigation_interval")
         
@@ -522,22 +664,46 @@ class CoreNavigationActions:
                 print(f"Navigation step error (continuing): {str(e)}")
                 return False  # Continue navigation despite errors
         
-        navigation_job = cron.interval(f"{navigation_interval}ms", safe_navigate_step)
+        def safe_submit_navigation_step():
+            try:
+                submit_navigation_step(run, target_text, highlight_image, use_wasd, max_steps, extra_step, action_button, action_count, action_interval, target_coords)
+            except Exception as e:
+                print(f"Navigation step error (continuing): {str(e)}")
+
+        # Async mode keeps OCR and template matching off Talon's main thread
+        if settings.get("user.navigation_async"):
+            navigation_job = cron.interval(f"{navigation_interval}ms", safe_submit_navigation_step)
+        else:
+            navigation_job = cron.interval(f"{navigation_interval}ms", safe_navigate_step)
         max_steps_text = f" (max {max_steps} steps)" if max_steps else ""
         action_text = f" (will press '{action_button}')" if action_button else ""
         print(f"Started continuous navigation to '{target_text}'{action_text} every {navigation_interval}ms{max_steps_text}")
 
     def stop_continuous_navigation() -> None:
         """Stop the continuous navigation job"""
-        global navigation_job
+        global navigation_job, navigation_run
+        navigation_run += 1
         if navigation_job:
             cron.cancel(navigation_job)
             navigation_job = None
             print("Stopped continuous navigation")
 
+        set_incremental_ocr_active(False)
+
+        # Region overrides only last for the command that set them
+        set_ocr_region_override(None)
+
         # Hide target crosshair when navigation stops
         actions.user.hide_target_crosshair()
 
+    def debug_navigation_worker() -> None:
+        """Print async navigation worker counters"""
+        print("=== DEBUG: NAVIGATION WORKER ===")
+        print(f"Async: {settings.get('user.navigation_async')}, busy: {navigation_worker.busy}")
+        print(f"Submitted: {navigation_worker.submitted}, dropped ticks: {navigation_worker.dropped}, failed: {navigation_worker.failed}")
+        print(f"Last job: {navigation_worker.last_job_ms:.0f}ms")
+        print("=== END DEBUG NAVIGATION WORKER ===")
+
     def navigate_continuously(target_text: str, highlight_image: str, use_wasd: bool = True, max_steps: int = None, extra_step: bool = False, action_button: str = None, action_count: int = 1, action_interval: float = 0.1) -> None:
         """Start continuous navigation with configurable input method and behavior"""
         actions.user.start_continuous_navigation(target_text, highlight_image, use_wasd, max_steps, extra_step, action_button, action_count, action_interval)
@@ -596,6 +762,11 @@ class CoreNavigationActions:
             # Use original flow for single matches (no disambiguation needed)
             actions.user.start_continuous_navigation(target_text, highlight_image, use_wasd, max_steps, False, action_button, action_count, action_interval)
 
+    def navigate_to_word_in_region(word: object, region_names: str, use_configured_action: bool = False) -> None:
+        """Navigate to a word found via OCR inside named regions from user.ocr_regions only"""
+        set_ocr_region_override(region_names)
+        actions.user.navigate_to_word(word, None, None, None, use_configured_action)
+
     def navigate_to_word_with_action(word: object):
         """Navigate to word using configured input method and press configured action button"""
         actions.user.navigate_to_word(word, None, None, None, True)
@@ -991,6 +1162,8 @@ class CoreNavigationActions:
                 time.sleep(key_hold_sec)
                 actions.key(f"{key}:up")
                 time.sleep(key_interval_sec)
+            invalidate_ocr_snapshot("grid navigation keys sent")
+            invalidate_shared_frame()
 
         # Press action button
         action_button = settings.get("user.game_action_button")
@@ -1007,9 +1180,9 @@ class CoreNavigationActions:
 
     def navigate_to_word_generator(word: str, use_wasd: bool = None, max_steps: int = None, action_button: str = None, use_configured_action: bool = False, action_count: int = None, action_interval: float = None):
         """Generator version of navigate_to_word that supports disambiguation"""
-        print(f"STACK_TRACE: navigate_to_word_generator ENTERED with word='{word}'")
-        import traceback
-        print(f"STACK_TRACE: Call stack:\n{''.join(traceback.format_stack()[-3:-1])}")
+        if log.enabled(TRACE):
+            import traceback
+            log.trace("navigate_to_word_generator entered with word='%s', call stack:\n%s", word, ''.join(traceback.format_stack()[-3:-1]))
         
         highlight_image = settings.get("user.highlight_image")
         action_count = int(pathfinding_settings.default_action_button_count) if isinstance(pathfinding_settings.default_action_button_count, str) else pathfinding_settings.default_action_button_count
@@ -1088,18 +1261,7 @@ class CoreNavigationActions:
         print(f"COORDINATE_FIX: Selected number at {selected_number_coords}, finding closest '{target_text}' word")
         
         # Find closest target word to the selected number among all available matches
-        closest_word = None
-        min_distance = float('inf')
-        
-        for match_option in ambiguous_matches:
-            # Calculate distance from number position to this word instance
-            word_coords = match_option.get('coords')
-            distance = actions.user.calculate_distance(selected_number_coords, word_coords)
-            print(f"  Distance from selected number {selected_number_coords} to '{match_option.get('text')}' at {word_coords}: {distance:.1f}px")
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_word = match_option
+        closest_word, min_distance = closest_match(ambiguous_matches, selected_number_coords)
         
         # Use the closest word's coordinates instead of the number's coordinates
         if closest_word and min_distance > 10:  # Only fix if there's a meaningful difference
@@ -1125,6 +1287,7 @@ class CoreNavigationActions:
         """Hide the disambiguation UI"""
         actions.mode.disable("user.gaming_pathfinding_disambiguation")
         reset_disambiguation()
+        set_ocr_region_override(None)
 
 
     def get_disambiguation_state():
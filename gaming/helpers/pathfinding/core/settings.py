@@ -41,6 +41,13 @@ mod.setting(
     desc="Interval in milliseconds between navigation steps"
 )
 
+mod.setting(
+    "navigation_async",
+    type=bool,
+    default=False,
+    desc="Run continuous navigation's OCR and cursor detection on a worker thread, dropping ticks while it is busy"
+)
+
 mod.setting(
     "navigation_mode",
     type=str,
@@ -93,6 +100,27 @@ mod.setting(
     desc="Name of cursor directory under cursors/ containing game-specific cursor templates (e.g., 'chained_echoes')"
 )
 
+mod.setting(
+    "cursor_tracking_window",
+    type=int,
+    default=360,
+    desc="Size in pixels of the window around the predicted cursor position searched before the full screen during navigation (0 = always search the full screen)"
+)
+
+mod.setting(
+    "template_matcher",
+    type=str,
+    default="locate",
+    desc="Template matcher: 'locate' (the default: Talon's locate, one call per threshold), 'numpy' (opt-in: one greyscale correlation per template, every threshold answered from its peaks) or 'pyramid' (opt-in: as 'numpy', correlating at 1/4 size and refining the best peaks at full size). Only 'numpy' and 'pyramid' mask transparent template pixels. Check user.benchmark_template_matching on recorded frames of the game before switching"
+)
+
+mod.setting(
+    "template_sweep_workers",
+    type=int,
+    default=0,
+    desc="Threads matching the remaining cursor templates in parallel when the expected one misses, keeping the first match (opt-in: the default 0, like 1, matches them one at a time)"
+)
+
 # OCR and text matching settings
 mod.setting(
     "menu_enable_fuzzy_matching",
@@ -129,6 +157,146 @@ mod.setting(
     desc="Disable HUD log exclusion zone filtering for OCR results (useful for games with UI in the bottom-right)"
 )
 
+mod.setting(
+    "ocr_snapshot_ttl",
+    type=int,
+    default=1500,
+    desc="Time in milliseconds an OCR snapshot is reused across phases of one command before rescanning (0 = always rescan). Each new phrase starts a new snapshot, and sending a navigation key always invalidates it"
+)
+
+mod.setting(
+    "ocr_regions",
+    type=str,
+    default="",
+    desc="Named OCR regions for this game as 'name:left,top,right,bottom' separated by ';' (e.g., 'battle_menu:0,600,400,900')"
+)
+
+mod.setting(
+    "ocr_active_regions",
+    type=str,
+    default="",
+    desc="Comma-separated names from user.ocr_regions that OCR and text matching are limited to (empty = full screen)"
+)
+
+mod.setting(
+    "ocr_cache_size",
+    type=int,
+    default=16,
+    desc="Number of OCR results kept in the frame-hash cache for unchanged screens (0 = disabled)"
+)
+
+mod.setting(
+    "ocr_cache_hash_block",
+    type=int,
+    default=4,
+    desc="Pixel block size averaged when hashing frames for the OCR cache (smaller = more sensitive to small changes)"
+)
+
+mod.setting(
+    "ocr_dirty_tiles",
+    type=bool,
+    default=True,
+    desc="During continuous navigation, re-OCR only the screen tiles that changed since the previous tick"
+)
+
+mod.setting(
+    "ocr_tile_size",
+    type=int,
+    default=128,
+    desc="Tile size in pixels for dirty-tile OCR (smaller = fewer pixels re-read per change, more OCR calls)"
+)
+
+mod.setting(
+    "ocr_dirty_tile_max_fraction",
+    type=float,
+    default=0.4,
+    desc="Fraction of changed tiles above which dirty-tile OCR falls back to a full-screen read"
+)
+
+mod.setting(
+    "ocr_prefetch",
+    type=bool,
+    default=False,
+    desc="Keep an OCR snapshot fresh in the background while game mode is active in a pathfinding game"
+)
+
+mod.setting(
+    "ocr_prefetch_interval",
+    type=int,
+    default=500,
+    desc="Milliseconds between background checks for screen changes while the screen is changing"
+)
+
+mod.setting(
+    "ocr_prefetch_idle_interval",
+    type=int,
+    default=2000,
+    desc="Milliseconds between background checks once the screen has been idle for user.ocr_prefetch_idle_checks checks"
+)
+
+mod.setting(
+    "ocr_prefetch_idle_checks",
+    type=int,
+    default=4,
+    desc="Consecutive unchanged checks after which background OCR slows to the idle interval"
+)
+
+mod.setting(
+    "ocr_prefetch_cpu_budget",
+    type=float,
+    default=0.25,
+    desc="Maximum fraction of wall time background OCR may spend reading the screen (0 = no limit)"
+)
+
+mod.setting(
+    "game_lexicon_enabled",
+    type=bool,
+    default=True,
+    desc="Resolve targets through the active game's game_disambiguation list (spoken form -> on-screen term) before fuzzy matching"
+)
+
+mod.setting(
+    "phonetic_shortlist_enabled",
+    type=bool,
+    default=True,
+    desc="When fuzzy scoring finds nothing, accept words sharing a phonetic key with the target at the Jaro-Winkler phonetic threshold (file -> Fire)"
+)
+
+mod.setting(
+    "ocr_backend",
+    type=str,
+    default="gaze",
+    desc="OCR engine for pathfinding: 'gaze' (talon-gaze-ocr), 'fixture' (replay user.ocr_fixture_path) or 'tesseract' (needs pytesseract)"
+)
+
+mod.setting(
+    "ocr_fixture_path",
+    type=str,
+    default="",
+    desc="Recorded OCR JSON replayed when user.ocr_backend is 'fixture' (see user.record_ocr_fixture)"
+)
+
+mod.setting(
+    "pathfinding_log_level",
+    type=str,
+    default="info",
+    desc="Pathfinding log level: 'error', 'warn', 'info', 'debug' or 'trace' (per-word and per-candidate detail)"
+)
+
+mod.setting(
+    "pathfinding_log_buffer_size",
+    type=int,
+    default=500,
+    desc="Number of recent pathfinding log events kept in memory for user.dump_pathfinding_log"
+)
+
+mod.setting(
+    "pathfinding_log_dump_on_failure",
+    type=int,
+    default=40,
+    desc="Recent log events printed when navigation gives up (0 = none)"
+)
+
 mod.setting(
     "phrase_adjacency_gap",
     type=int,
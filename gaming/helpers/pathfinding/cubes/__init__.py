@@ -7,11 +7,11 @@ Provides visual grid overlays with numbered cubes for navigating to non-text UI
 from talon import Module, actions, settings, canvas, ui, cron
 from talon.types import Rect as TalonRect
 from talon.skia import Paint
-import sys
 import io
 import json
 import re
 from contextlib import redirect_stdout
+from ..utils.integrations import get_flex_grid_controller
 
 mod = Module()
 
@@ -101,11 +101,7 @@ class CubeActions:
             print("=== DETECTING UI CUBES ===")
             
             # Access the flex-mouse-grid controller 
-            flex_grid_controller = None
-            for module_name, module in sys.modules.items():
-                if 'flex_mouse_grid' in module_name and hasattr(module, 'mg'):
-                    flex_grid_controller = module.mg
-                    break
+            flex_grid_controller = get_flex_grid_controller()
             
             if not flex_grid_controller:
                 print("ERROR: Could not find flex-mouse-grid controller")
@@ -6,7 +6,7 @@ Provides debug markers, coordinate logging, state inspection, and test functions
 
 from talon import Module, actions, settings, canvas, ui
 from talon.types import Rect as TalonRect
-import sys
+from ..utils.integrations import get_gaze_ocr_controller
 import os
 
 mod = Module()
@@ -155,11 +155,7 @@ class DebugActions:
         
         try:
             # Find OCR controller
-            gaze_ocr_controller = None
-            for module_name, module in sys.modules.items():
-                if 'gaze_ocr' in module_name and hasattr(module, 'gaze_ocr_controller'):
-                    gaze_ocr_controller = module.gaze_ocr_controller
-                    break
+            gaze_ocr_controller = get_gaze_ocr_controller()
             
             if not gaze_ocr_controller:
                 print("ERROR: Could not find gaze_ocr_controller")
@@ -256,6 +252,14 @@ class DebugActions:
         # First get cursor position - try multiple thresholds
         cursor_coords = None
         try:
+            # With the NumPy matcher one correlation answers all three thresholds
+            from ..ocr.template_matching import numpy_matcher_enabled, template_score_map
+            if numpy_matcher_enabled():
+                print("Score map peaks (thresholds cleared):")
+                for match, score, cleared in template_score_map(image_path).thresholds_cleared([0.7, 0.8, 0.9])[:5]:
+                    center = (match.x + match.width // 2, match.y + match.height // 2)
+                    print(f"  {center}: score {score:.3f}, clears {cleared}")
+
             # Test different thresholds and show cursor count
             for threshold in [0.7, 0.8, 0.9]:
                 print(f"Testing threshold {threshold}:")
@@ -288,11 +292,7 @@ class DebugActions:
         # Get all text coordinates  
         actions.user.disconnect_ocr_eye_tracker()
         try:
-            gaze_ocr_controller = None
-            for module_name, module in sys.modules.items():
-                if 'gaze_ocr' in module_name and hasattr(module, 'gaze_ocr_controller'):
-                    gaze_ocr_controller = module.gaze_ocr_controller
-                    break
+            gaze_ocr_controller = get_gaze_ocr_controller()
             
             if not gaze_ocr_controller:
                 print("ERROR: Could not find gaze_ocr_controller")
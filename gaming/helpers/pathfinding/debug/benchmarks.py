@@ -0,0 +1,368 @@
+"""
+Benchmarks for pathfinding hot paths.
+
+Each benchmark checks that the optimized path returns the same results as the
+original one before reporting timings, so they double as parity checks.
+"""
+
+from talon import Module, settings
+from contextlib import redirect_stdout
+import io
+import random
+import time
+
+mod = Module()
+
+# Typical RPG menu vocabulary used to build synthetic OCR screens
+MENU_VOCABULARY = [
+    "Attack", "Skills", "Items", "Defend", "Flee", "Fire", "Thrust", "Cleanse",
+    "Earth", "Water", "Valor", "Pressure", "Save", "Close", "Equipment", "Journal",
+    "Quests", "Helper", "Analyze", "Handaxe", "Olive", "Boost", "Party", "Options",
+    "Defense", "Curl", "Night", "Right", "Cross", "South", "Iaijutsu", "Gear",
+]
+
+# Chained Echoes battle menu from claude_tests/jaro_winkler_progress.md
+PHONETIC_CORPUS_SCREEN = [
+    ["Attack", "Skills", "Items", "Defend"],
+    ["Fire", "Thrust", "Cleanse", "Earth"],
+    ["Water", "Valor", "Pressure", "Save"],
+    ["Close", "Cross", "South", "Flee", "Olive"],
+]
+
+# (spoken target, word that must match, words that must never match) at the default threshold
+PHONETIC_REGRESSION_CORPUS = [
+    ("skills", "Skills", ["Fire"]),
+    ("fire", "Fire", ["Flee"]),
+    ("flee", "Flee", ["Fire"]),
+    ("save", "Save", ["Valor"]),
+    ("cleanse", "Cleanse", ["Close"]),
+    # Misrecognitions full scoring rejects at 0.9; the phonetic key must resolve them
+    ("file", "Fire", ["Skills"]),
+    ("clems", "Cleanse", ["Close"]),
+    ("safe", "Save", ["Valor"]),
+    ("chris", "Cross", ["Close"]),
+    ("quick", None, ["Skills", "Cross"]),
+]
+
+# Tiers in the order iter_text_matches may yield them
+MATCH_TIER_ORDER = ["phrase", "exact", "lexicon", "relaxed_phrase", "fuzzy", "phonetic"]
+
+# (spoken target, screen rows, gap between words, tiers that may resolve it first, first match) at the default threshold
+TIER_ORDER_CASES = [
+    ("attack", [["Attack", "Skills"], ["Atack", "Items"]], 40, ["exact"], "Attack"),
+    ("cleans", [["Cleanse", "Close"]], 40, ["exact"], "Cleanse"),
+    ("skils", [["Attack", "Skills", "Items"]], 40, ["fuzzy"], "Skills"),
+    ("file", [["Attack", "Skills"], ["Fire", "Thrust"]], 40, ["phonetic"], "Fire"),
+    ("defense curl", [["Defense", "Curl"], ["Defend", "Cure"]], 40, ["phrase"], "Defense Curl"),
+    # Too far apart for a phrase, close enough for the relaxed adjacency gap
+    ("defense curl", [["Defense", "Curl"]], 120, ["relaxed_phrase"], "Defense Curl"),
+    ("thrust valor", [["Valor", "Thrust"]], 40, [], None),
+]
+
+# Phrase planted by benchmark_phrase_search with its first and rarest words misread;
+# the whole phrase still scores above 0.8, so only its middle words can seed it
+GARBLED_PHRASE_TARGET = "Iron Equipment Journal Helm"
+GARBLED_PHRASE_READ = "1r0n Equipment Journal h3lw"
+
+def build_synthetic_screen_words(word_count: int, seed: int = 7) -> list:
+    """Build a deterministic list of menu words with OCR-style misreads mixed in"""
+    rng = random.Random(seed)
+    words = []
+    for _ in range(word_count):
+        word = rng.choice(MENU_VOCABULARY)
+        mutation = rng.random()
+        if mutation < 0.2 and len(word) > 3:
+            # Substitute one character, like a misread glyph
+            index = rng.randrange(len(word))
+            word = word[:index] + rng.choice("il1oO0rn") + word[index + 1:]
+        elif mutation < 0.3:
+            # Trailing punctuation or counters picked up with the word
+            word = word + rng.choice([":", "x2", "!", "."])
+        words.append(word)
+    return words
+
+def build_synthetic_screen_lines(line_count: int, words_per_line: int = 8, seed: int = 11) -> list:
+    """Lay synthetic menu words out as OCR lines, with wide gaps between some columns"""
+    from ..ocr.ocr_types import OcrWord, OcrLine
+    rng = random.Random(seed)
+    texts = build_synthetic_screen_words(line_count * words_per_line, seed)
+    lines = []
+    for line_idx in range(line_count):
+        words = []
+        left = 10
+        for text in texts[line_idx * words_per_line:(line_idx + 1) * words_per_line]:
+            width = len(text) * 12
+            words.append(OcrWord(text, left, 20 + line_idx * 30, width, 20))
+            left += width + rng.choice([10, 10, 10, 120])
+        lines.append(OcrLine(words))
+    return lines
+
+def build_corpus_screen_lines(rows: list, gap: int = 40) -> list:
+    """Lay fixed menu rows out as OCR lines, gap pixels between words"""
+    from ..ocr.ocr_types import OcrWord, OcrLine
+    lines = []
+    for line_idx, row in enumerate(rows):
+        words = []
+        left = 10
+        for text in row:
+            words.append(OcrWord(text, left, 20 + line_idx * 30, len(text) * 12, 20))
+            left += len(text) * 12 + gap
+        lines.append(OcrLine(words))
+    return lines
+
+# Screenshots saved by user.capture_claude_screenshot, replayed as recorded frames
+RECORDED_FRAMES_LOCATION = "/Users/jarrod/.talon/user/jarrod/claude_helpers/screenshots/"
+
+def same_peak_positions(peaks_a: list, peaks_b: list, threshold: float, tolerance: int = 1) -> bool:
+    """True when both peak lists have the same positions (within tolerance) at threshold"""
+    positions_a = sorted((x, y) for score, x, y in peaks_a if score >= threshold)
+    positions_b = sorted((x, y) for score, x, y in peaks_b if score >= threshold)
+    return len(positions_a) == len(positions_b) and all(
+        abs(ax - bx) <= tolerance and abs(ay - by) <= tolerance
+        for (ax, ay), (bx, by) in zip(positions_a, positions_b)
+    )
+
+def sliding_window_phrase_sequences(target_text: str, ocr_lines, fuzzy_threshold: float, max_gap: int) -> list:
+    """Reference phrase search scoring every adjacent window on every line"""
+    from rapidfuzz import fuzz
+    target_words = target_text.lower().split()
+    matches = []
+    for line_idx, line in enumerate(ocr_lines):
+        for start_idx in range(len(line.words) - len(target_words) + 1):
+            candidate_words = line.words[start_idx:start_idx + len(target_words)]
+            if any(
+                candidate_words[i + 1].left - (candidate_words[i].left + candidate_words[i].width) > max_gap
+                for i in range(len(candidate_words) - 1)
+            ):
+                continue
+            candidate_phrase = ' '.join(w.text for w in candidate_words)
+            score = fuzz.ratio(target_text.lower(), candidate_phrase.lower()) / 100.0
+            if score >= fuzzy_threshold:
+                matches.append((line_idx, start_idx, score))
+    return matches
+
+def time_call(function, repeats: int) -> tuple:
+    """Return (average milliseconds, last result) of function() with its output suppressed"""
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            result = function()
+        elapsed = time.perf_counter() - start
+    return elapsed * 1000 / repeats, result
+
+@mod.action_class
+class BenchmarkActions:
+    def benchmark_fuzzy_scoring(word_count: int = 200, target_text: str = "file", repeats: int = 5) -> None:
+        """Compare per-word fuzzy scoring with batch scoring for parity and speed"""
+        from ..ocr.text_detection import CompiledTarget, BATCH_SCORING_AVAILABLE
+
+        print(f"=== BENCHMARK: FUZZY SCORING ({word_count} words, target '{target_text}') ===")
+        if not BATCH_SCORING_AVAILABLE:
+            print("Batch scoring unavailable (needs RapidFuzz process and NumPy)")
+            return
+
+        words = build_synthetic_screen_words(word_count)
+        compiled_target = CompiledTarget(target_text, 0.9)
+        threshold = compiled_target.fuzzy_threshold
+
+        sequential_ms, sequential_scores = time_call(
+            lambda: [compiled_target.score(word, threshold) for word in words], repeats
+        )
+        batch_ms, batch_results = time_call(
+            lambda: compiled_target.score_batch(words, threshold), repeats
+        )
+
+        mismatches = [
+            (word, sequential, batch[0])
+            for word, sequential, batch in zip(words, sequential_scores, batch_results)
+            if abs(sequential - batch[0]) > 1e-9
+        ]
+        if mismatches:
+            print(f"PARITY FAILED: {len(mismatches)} of {len(words)} words scored differently")
+            for word, sequential, batch in mismatches[:10]:
+                print(f"  '{word}': sequential={sequential:.4f} batch={batch:.4f}")
+        else:
+            print(f"Parity OK: all {len(words)} scores identical")
+
+        speedup = sequential_ms / batch_ms if batch_ms else float('inf')
+        print(f"Sequential: {sequential_ms:.2f}ms, batch: {batch_ms:.2f}ms, speedup: {speedup:.1f}x")
+        print("=== END BENCHMARK ===")
+
+    def benchmark_phrase_search(line_count: int = 200, target_text: str = "Defense Curl", repeats: int = 5) -> None:
+        """Compare sliding-window phrase search with token-indexed search for parity and speed"""
+        from ..ocr.text_detection import find_phrase_sequences, RAPIDFUZZ_AVAILABLE
+
+        print(f"=== BENCHMARK: PHRASE SEARCH ({line_count} lines, target '{target_text}') ===")
+        if not RAPIDFUZZ_AVAILABLE:
+            print("Phrase search unavailable (needs RapidFuzz)")
+            return
+
+        lines = build_synthetic_screen_lines(line_count)
+        # Plant the phrase (and a misread copy) so there is something to find
+        lines[line_count // 2].words[2].text, lines[line_count // 2].words[3].text = target_text.split()[0], target_text.split()[-1]
+        lines[-1].words[0].text = target_text.split()[0][:-1] + "l"
+        # A phrase whose first and rarest words are both misread below the seed cutoff
+        for word, text in zip(lines[line_count // 3].words, GARBLED_PHRASE_READ.split()):
+            word.text = text
+
+        for search_target, threshold, max_gap in ((target_text, 0.8, 80), (target_text, 0.8, 160), (GARBLED_PHRASE_TARGET, 0.8, 160)):
+            sliding_ms, sliding_matches = time_call(
+                lambda: sliding_window_phrase_sequences(search_target, lines, threshold, max_gap), repeats
+            )
+            indexed_ms, indexed_matches = time_call(
+                lambda: find_phrase_sequences(search_target, lines, threshold, max_gap), repeats
+            )
+            indexed_keys = [(m['line'], m['word_start'], m['fuzzy_score']) for m in indexed_matches]
+            if indexed_keys == sliding_matches:
+                print(f"Parity OK ('{search_target}', gap {max_gap}): {len(sliding_matches)} identical matches")
+            else:
+                print(f"PARITY FAILED ('{search_target}', gap {max_gap}): sliding={sliding_matches} indexed={indexed_keys}")
+            speedup = sliding_ms / indexed_ms if indexed_ms else float('inf')
+            print(f"Sliding: {sliding_ms:.2f}ms, indexed: {indexed_ms:.2f}ms, speedup: {speedup:.1f}x")
+        print("=== END BENCHMARK ===")
+
+    def verify_phonetic_corpus(fuzzy_threshold: float = 0.9, repeats: int = 20) -> None:
+        """Check the phonetic tier against the regression corpus and time it against full scoring"""
+        from ..ocr.text_detection import (
+            CompiledTarget, build_word_infos, phonetic_word_matches, score_word_infos, RAPIDFUZZ_AVAILABLE
+        )
+
+        print(f"=== VERIFY: PHONETIC CORPUS (threshold {fuzzy_threshold}) ===")
+        if not RAPIDFUZZ_AVAILABLE:
+            print("Fuzzy matching unavailable (needs RapidFuzz)")
+            return
+
+        word_infos = build_word_infos(build_corpus_screen_lines(PHONETIC_CORPUS_SCREEN))
+        failures = 0
+        for target_text, expected, forbidden in PHONETIC_REGRESSION_CORPUS:
+            compiled_target = CompiledTarget(target_text, fuzzy_threshold)
+            # Same fallback order as the match engine: exact, then every word, then sounds-alike
+            with redirect_stdout(io.StringIO()):
+                matches = [info for info in word_infos if compiled_target.is_exact_word_match(info['text'])]
+                matches = (
+                    matches
+                    or score_word_infos(compiled_target, word_infos)
+                    or phonetic_word_matches(compiled_target, word_infos)
+                )
+            matched = [match['text'] for match in matches]
+            problems = []
+            if expected and (not matched or matched[0] != expected):
+                problems.append(f"best match is not '{expected}'")
+            problems.extend(f"matched '{word}'" for word in forbidden if word in matched)
+            failures += bool(problems)
+            status = "FAIL" if problems else "ok"
+            print(f"  {status:4} '{target_text}' -> {matched or 'no match'} {'; '.join(problems)}")
+
+        # The phonetic tier only runs after full scoring misses, so its cost is added on top
+        compiled_target = CompiledTarget("file", fuzzy_threshold)
+        phonetic_ms, _ = time_call(lambda: phonetic_word_matches(compiled_target, word_infos), repeats)
+        full_ms, _ = time_call(lambda: score_word_infos(compiled_target, word_infos), repeats)
+        print(f"{len(PHONETIC_REGRESSION_CORPUS) - failures}/{len(PHONETIC_REGRESSION_CORPUS)} cases passed")
+        print(f"Full scoring: {full_ms:.2f}ms, phonetic fallback: {phonetic_ms:.2f}ms")
+        print("=== END VERIFY ===")
+
+    def verify_match_tier_order(fuzzy_threshold: float = 0.9) -> None:
+        """Check on fixed OCR fixtures that iter_text_matches yields tiers best first and resolves each case in the expected tier"""
+        from ..ocr.ocr_types import OcrContents
+        from ..ocr.text_detection import CompiledTarget, iter_text_matches
+
+        print(f"=== VERIFY: MATCH TIER ORDER (threshold {fuzzy_threshold}) ===")
+        failures = 0
+        for target_text, rows, gap, expected_tiers, expected in TIER_ORDER_CASES:
+            contents = OcrContents(build_corpus_screen_lines(rows, gap))
+            with redirect_stdout(io.StringIO()):
+                tiers = list(iter_text_matches(contents.result.lines, CompiledTarget(target_text, fuzzy_threshold)))
+            yielded = [tier for tier, _ in tiers]
+            problems = []
+            if yielded != sorted(yielded, key=MATCH_TIER_ORDER.index):
+                problems.append(f"tiers out of order {yielded}")
+            first_tier, first_matches = tiers[0] if tiers else (None, [])
+            if expected_tiers and first_tier not in expected_tiers:
+                problems.append(f"resolved by '{first_tier}', expected {expected_tiers}")
+            if expected is None and tiers:
+                problems.append(f"unexpected '{first_tier}' match")
+            if expected is not None and (not first_matches or first_matches[0]['text'] != expected):
+                problems.append(f"best match {first_matches[0]['text'] if first_matches else None}, expected '{expected}'")
+            failures += bool(problems)
+            status = "FAIL" if problems else "ok"
+            print(f"  {status:4} '{target_text}' (gap {gap}) -> {yielded or 'no match'} {'; '.join(problems)}")
+        print(f"{len(TIER_ORDER_CASES) - failures}/{len(TIER_ORDER_CASES)} cases passed")
+        print("=== END VERIFY ===")
+
+    def benchmark_fixture_lookup(fixture_path: str, target_text: str, repeats: int = 20) -> None:
+        """Time the text match engine on a recorded OCR fixture and report the tier that resolved it"""
+        from ..ocr.backend_types import FixtureOcrBackend
+        from ..ocr.text_detection import CompiledTarget, iter_text_matches
+
+        print(f"=== BENCHMARK: FIXTURE LOOKUP ('{target_text}' in {fixture_path}) ===")
+        lines = FixtureOcrBackend.from_file(fixture_path).read_lines()
+        compiled_target = CompiledTarget(target_text, settings.get("user.menu_fuzzy_threshold"))
+        lookup_ms, (tier, matches) = time_call(
+            lambda: next(iter_text_matches(lines, compiled_target), (None, [])), repeats
+        )
+        print(f"{len(lines)} lines, tier: {tier or 'none'}, matches: {[m['text'] for m in matches]}")
+        print(f"Lookup: {lookup_ms:.2f}ms")
+        print("=== END BENCHMARK ===")
+
+    def benchmark_template_matching(template_name: str, frames_directory: str = RECORDED_FRAMES_LOCATION, threshold: float = 0.9, repeats: int = 3, max_frames: int = 10) -> None:
+        """Compare locate, full-size NumPy and coarse-to-fine template matching on recorded frames"""
+        import os
+        import talon.experimental.locate as locate
+        from talon.skia import Image
+        from ..ocr.template_cache import template_cache, cursor_template_directory
+        from ..ocr.template_matching import (
+            PreparedFrame, PYRAMID_SCALE, block_mean, ncc_score_map, score_map_peaks, pyramid_score_map_peaks
+        )
+        from ..utils.screen_capture import load_png_as_array, to_gray
+
+        template_path = template_name
+        if not os.path.isabs(template_path):
+            template_path = cursor_template_directory(settings.get("user.cursor_directory")) + template_name
+        frame_files = sorted(name for name in os.listdir(frames_directory) if name.lower().endswith(".png"))[:max_frames]
+
+        print(f"=== BENCHMARK: TEMPLATE MATCHING ({template_name}, {len(frame_files)} frames, threshold {threshold}) ===")
+        template = to_gray(template_cache.array(template_path))
+        template_h, template_w = template.shape
+        totals = {"locate": 0.0, "prepare": 0.0, "numpy": 0.0, "pyramid": 0.0}
+        mismatches = 0
+        for frame_file in frame_files:
+            frame_path = os.path.join(frames_directory, frame_file)
+            pixels = to_gray(load_png_as_array(frame_path))
+
+            # Once per capture: both matchers reuse these for every template
+            prepare_ms, (frame, coarse_frame) = time_call(
+                lambda: (PreparedFrame(pixels).freeze(), PreparedFrame(block_mean(pixels, PYRAMID_SCALE)).freeze()), repeats
+            )
+            full_ms, full_peaks = time_call(
+                lambda: score_map_peaks(ncc_score_map(frame, template), template_w, template_h), repeats
+            )
+            pyramid_ms, pyramid_peaks = time_call(
+                lambda: pyramid_score_map_peaks(frame, template, coarse_frame=coarse_frame), repeats
+            )
+            totals["prepare"] += prepare_ms
+            totals["numpy"] += full_ms
+            totals["pyramid"] += pyramid_ms
+
+            locate_report = "locate_in_image unavailable"
+            if hasattr(locate, "locate_in_image"):
+                image = Image.from_file(frame_path)
+                template_image = template_cache.image(template_path)
+                locate_ms, located = time_call(
+                    lambda: locate.locate_in_image(image, template_image, threshold=threshold), repeats
+                )
+                totals["locate"] += locate_ms
+                locate_report = f"locate {locate_ms:.1f}ms ({len(located)} matches)"
+
+            parity = same_peak_positions(full_peaks, pyramid_peaks, threshold)
+            mismatches += not parity
+            full_count = sum(1 for score, _, _ in full_peaks if score >= threshold)
+            print(f"{frame_file} {pixels.shape[1]}x{pixels.shape[0]}: {locate_report}, prepare {prepare_ms:.1f}ms, "
+                  f"per template: numpy {full_ms:.1f}ms ({full_count} matches), pyramid {pyramid_ms:.1f}ms"
+                  f"{'' if parity else ' MISMATCH'}")
+
+        frame_count = max(1, len(frame_files))
+        print(f"Mean per frame: locate {totals['locate'] / frame_count:.1f}ms per template; "
+              f"NumPy frame preparation {totals['prepare'] / frame_count:.1f}ms once, then per template "
+              f"numpy {totals['numpy'] / frame_count:.1f}ms, pyramid {totals['pyramid'] / frame_count:.1f}ms")
+        print(f"Pyramid matches full-size positions on {len(frame_files) - mismatches}/{len(frame_files)} frames")
+        print("=== END BENCHMARK ===")
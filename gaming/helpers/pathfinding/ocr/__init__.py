@@ -7,9 +7,33 @@ Handles text detection, template matching, cursor detection, and fuzzy text matc
 from . import text_detection
 from . import template_matching
 from . import homophones
+from . import ocr_types
+from . import ocr_cache
+from . import dirty_tiles
+from . import prefetch
+from . import spatial_index
+from . import token_index
+from . import game_lexicon
+from . import phonetic_index
+from . import backend_types
+from . import backends
+from . import template_cache
+from . import cursor_stats
 
 __all__ = [
     'text_detection',
     'template_matching', 
-    'homophones'
+    'homophones',
+    'ocr_types',
+    'ocr_cache',
+    'dirty_tiles',
+    'prefetch',
+    'spatial_index',
+    'token_index',
+    'game_lexicon',
+    'phonetic_index',
+    'backend_types',
+    'backends',
+    'template_cache',
+    'cursor_stats'
 ]
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""
+Talon-free OCR backend seam for pathfinding system.
+
+An OcrBackend only has to return OCR lines for the screen or a rectangle;
+BackendOcrController wraps it in the gaze-ocr controller surface (read_nearby,
+latest_screen_contents, ocr_reader.read_screen) every OCR consumer talks to.
+Fixture backends replay recorded lines from JSON. Nothing here imports Talon, so
+backends and fixtures can be built and replayed outside it.
+"""
+
+from typing import Protocol
+from .ocr_types import OcrWord, OcrLine, OcrContents, filter_lines_to_rects
+import json
+import os
+
+class OcrBackend(Protocol):
+    """Interface for OCR engines: return OCR lines for the screen or a rectangle"""
+
+    name: str
+
+    def available(self) -> bool:
+        """True when the engine can read right now"""
+        ...
+
+    def read_lines(self, bounding_box: tuple = None) -> list:
+        """OCR lines for (left_x, top_y, right_x, bottom_y), or the whole screen when None"""
+        ...
+
+# Backends may also define read_frame(array, bounds) -> lines to OCR a frame that was
+# already captured (for the OCR cache hash) instead of grabbing the screen again
+
+def lines_to_json(lines) -> dict:
+    """Serialise OCR lines (gaze-ocr or pathfinding types) as {'lines': [{'words': [...]}]}"""
+    return {
+        'lines': [
+            {'words': [
+                {'text': word.text, 'left': word.left, 'top': word.top, 'width': word.width, 'height': word.height}
+                for word in line.words
+            ]}
+            for line in lines
+        ]
+    }
+
+def lines_from_json(data: dict) -> list:
+    """OCR lines from the lines_to_json format"""
+    return [
+        OcrLine([
+            OcrWord(word['text'], word['left'], word['top'], word['width'], word['height'])
+            for word in line['words']
+        ])
+        for line in data.get('lines', [])
+    ]
+
+class FixtureOcrBackend:
+    """Replays recorded OCR frames, one per full-screen read, repeating the last frame
+
+    The fixture is either one recording ({'lines': [...]}) or a sequence of them
+    ({'frames': [{'lines': [...]}, ...]}) for replaying a navigation run.
+    """
+
+    name = "fixture"
+
+    def __init__(self, frames: list, path: str = None):
+        self.frames = frames
+        self.path = path
+        self.frame_index = 0
+
+    @classmethod
+    def from_file(cls, path: str):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        frames = data['frames'] if 'frames' in data else [data]
+        return cls([lines_from_json(frame) for frame in frames], path)
+
+    @classmethod
+    def from_lines(cls, lines: list):
+        return cls([lines])
+
+    def available(self) -> bool:
+        return True
+
+    def current_lines(self) -> list:
+        return self.frames[min(self.frame_index, len(self.frames) - 1)] if self.frames else []
+
+    def read_lines(self, bounding_box: tuple = None) -> list:
+        if bounding_box is not None:
+            # Region reads look at the frame the last full read returned
+            return filter_lines_to_rects(self.current_lines(), [bounding_box])
+        lines = self.current_lines()
+        self.frame_index += 1
+        return lines
+
+class BackendOcrReader:
+    """gaze-ocr screen reader surface over a backend"""
+
+    def __init__(self, backend: OcrBackend):
+        self.backend = backend
+
+    def read_screen(self, bounding_box: tuple = None):
+        return OcrContents(self.backend.read_lines(bounding_box))
+
+    def read_frame(self, array, bounds: tuple):
+        """OCR an already captured frame, or None when the backend can only capture itself"""
+        read_frame = getattr(self.backend, "read_frame", None)
+        return OcrContents(read_frame(array, bounds)) if read_frame is not None else None
+
+class BackendOcrController:
+    """gaze_ocr_controller surface over a backend, so every OCR consumer can use it unchanged"""
+
+    def __init__(self, backend: OcrBackend):
+        self.backend = backend
+        self.ocr_reader = BackendOcrReader(backend)
+        self.contents = OcrContents([])
+        self.read_count = 0
+
+    def read_nearby(self):
+        """Read the whole screen; the eye tracker plays no part"""
+        self.read_count += 1
+        self.contents = OcrContents(self.backend.read_lines())
+
+    def latest_screen_contents(self):
+        return self.contents
+
+def save_ocr_fixture(path: str, frames: list):
+    """Write OCR frames as a fixture file (a single frame is stored without the frames list)"""
+    data = lines_to_json(frames[0]) if len(frames) == 1 else {'frames': [lines_to_json(lines) for lines in frames]}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
@@ -0,0 +1,136 @@
+"""
+Pluggable OCR backends for pathfinding system.
+
+Every OCR consumer talks to a gaze-ocr style controller (read_nearby,
+latest_screen_contents, ocr_reader.read_screen). The backend interface, fixture
+replay and controller wrapper live in backend_types, which does not import Talon.
+user.ocr_backend picks the backend: talon-gaze-ocr itself, a fixture that replays
+recorded lines from JSON, or a local Tesseract engine.
+"""
+
+from talon import Module, settings
+from .ocr_types import OcrWord, OcrLine, filter_lines_to_rects
+from .backend_types import OcrBackend, FixtureOcrBackend, BackendOcrController, save_ocr_fixture
+from ..utils.integrations import gaze_ocr, get_gaze_ocr_controller
+import os
+import time
+
+try:
+    import pytesseract
+    TESSERACT_AVAILABLE = True
+except ImportError:
+    TESSERACT_AVAILABLE = False
+
+mod = Module()
+
+# Recorded OCR fixtures (record_ocr_fixture writes here when no path is given)
+ocr_fixture_location = "/Users/jarrod/.talon/user/jarrod/gaming/ocr_fixtures/"
+
+class GazeOcrBackend:
+    """talon-gaze-ocr's controller as a backend"""
+
+    name = "gaze"
+
+    def available(self) -> bool:
+        return gaze_ocr.get() is not None
+
+    def read_lines(self, bounding_box: tuple = None) -> list:
+        controller = gaze_ocr.get()
+        ocr_reader = getattr(controller, "ocr_reader", None)
+        if bounding_box is not None and ocr_reader is not None and hasattr(ocr_reader, "read_screen"):
+            return ocr_reader.read_screen(bounding_box).result.lines
+        controller.read_nearby()
+        lines = controller.latest_screen_contents().result.lines
+        return filter_lines_to_rects(lines, [bounding_box]) if bounding_box else lines
+
+class TesseractOcrBackend:
+    """Local Tesseract via pytesseract, reading Talon screen captures"""
+
+    name = "tesseract"
+
+    def available(self) -> bool:
+        return TESSERACT_AVAILABLE
+
+    def read_lines(self, bounding_box: tuple = None) -> list:
+        from ..utils.screen_capture import capture_screen_array, main_screen_bounds
+        bounds = bounding_box or main_screen_bounds()
+        return self.read_frame(capture_screen_array(bounds), bounds)
+
+    def read_frame(self, array, bounds: tuple) -> list:
+        """OCR lines for a captured array of bounds"""
+        # Retina captures are in physical pixels; OCR boxes must be in screen points
+        scale = array.shape[1] / max(1, bounds[2] - bounds[0])
+        data = pytesseract.image_to_data(array[:, :, :3], output_type=pytesseract.Output.DICT)
+
+        lines = {}
+        for idx, text in enumerate(data['text']):
+            if not text.strip() or float(data['conf'][idx]) < 0:
+                continue
+            key = (data['block_num'][idx], data['par_num'][idx], data['line_num'][idx])
+            lines.setdefault(key, []).append(OcrWord(
+                text,
+                bounds[0] + int(data['left'][idx] / scale),
+                bounds[1] + int(data['top'][idx] / scale),
+                int(data['width'][idx] / scale),
+                int(data['height'][idx] / scale),
+            ))
+        return [OcrLine(sorted(words, key=lambda w: w.left)) for _, words in sorted(lines.items())]
+
+def create_ocr_backend(name: str) -> OcrBackend:
+    """Build the backend called name ('gaze', 'fixture' or 'tesseract')"""
+    if name == "fixture":
+        path = settings.get("user.ocr_fixture_path")
+        if not path:
+            raise ValueError("user.ocr_backend is 'fixture' but user.ocr_fixture_path is not set")
+        return FixtureOcrBackend.from_file(path)
+    if name == "tesseract":
+        if not TESSERACT_AVAILABLE:
+            raise ValueError("user.ocr_backend is 'tesseract' but pytesseract is not installed")
+        return TesseractOcrBackend()
+    if name == "gaze":
+        return GazeOcrBackend()
+    raise ValueError(f"Unknown OCR backend '{name}'")
+
+# Controller for the configured non-gaze backend, rebuilt when the settings change
+backend_controller = None
+backend_controller_key = None
+
+def get_backend_controller():
+    """Controller for user.ocr_backend, or None when it cannot be built"""
+    global backend_controller, backend_controller_key
+    key = (settings.get("user.ocr_backend"), settings.get("user.ocr_fixture_path"))
+    if key != backend_controller_key:
+        backend_controller_key = key
+        try:
+            backend_controller = BackendOcrController(create_ocr_backend(key[0]))
+            print(f"OCR backend: {key[0]}")
+        except Exception as e:
+            print(f"OCR backend error: {e}")
+            backend_controller = None
+    return backend_controller
+
+def install_ocr_backend(backend: OcrBackend) -> BackendOcrController:
+    """Serve every pathfinding OCR read from backend until remove_ocr_backend() is called"""
+    controller = BackendOcrController(backend)
+    gaze_ocr.install_override(controller)
+    return controller
+
+def remove_ocr_backend():
+    """Go back to the backend chosen by user.ocr_backend"""
+    gaze_ocr.install_override(None)
+
+@mod.action_class
+class OcrBackendActions:
+    def record_ocr_fixture(path: str = None) -> str:
+        """Read the screen with the active OCR backend and save the lines as a fixture file"""
+        controller = get_gaze_ocr_controller()
+        if controller is None:
+            print("Could not record OCR fixture: no OCR controller")
+            return None
+
+        controller.read_nearby()
+        lines = controller.latest_screen_contents().result.lines
+        path = path or os.path.join(ocr_fixture_location, time.strftime("ocr_%Y%m%d_%H%M%S.json"))
+        save_ocr_fixture(path, [lines])
+        print(f"Recorded OCR fixture with {len(lines)} lines to {path}")
+        return path
@@ -0,0 +1,162 @@
+"""
+Cursor template hit statistics for pathfinding system.
+
+Counts, per game and per context (cursor or grid cursor, plus the active OCR
+regions), how often each cursor template was tried and how often it matched.
+Templates are tried in expected-hit order: the most recent hit first, then by
+hit rate, with templates that keep missing demoted to the end. Statistics are
+saved to JSON a few seconds after they change, so they survive reloads.
+"""
+
+from talon import Module, cron, settings
+from .template_cache import cursors_location
+from ..utils.worker_pool import setting
+import json
+import os
+import threading
+import time
+
+mod = Module()
+
+cursor_stats_path = cursors_location + "cursor_hit_stats.json"
+
+# Seconds to wait after a change before writing the stats file
+SAVE_DELAY_SECONDS = 10
+
+# Templates tried this often without a single hit are moved to the end of the order
+DEMOTE_AFTER_TRIES = 50
+
+def cursor_context(grid: bool = False) -> str:
+    """'cursor' or 'grid', plus the active OCR regions when they narrow the screen to one menu"""
+    context = "grid" if grid else "cursor"
+    active_regions = setting("user.ocr_active_regions")
+    return f"{context}:{active_regions}" if active_regions else context
+
+class CursorStats:
+    """Hits, tries and last hit time per game, context and template file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.games = None
+        self.save_pending = False
+        # Per session: (game, context) -> [lookups, templates tried]
+        self.lookups = {}
+
+    def load(self):
+        if self.games is not None:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.games = json.load(f)
+        except FileNotFoundError:
+            self.games = {}
+        except Exception as e:
+            print(f"Cursor stats: could not read {self.path}: {e}")
+            self.games = {}
+
+    def templates(self, game: str, context: str) -> dict:
+        self.load()
+        return self.games.setdefault(game, {}).setdefault(context, {})
+
+    def ordered(self, game: str, context: str, cursor_files: list) -> list:
+        """cursor_files in expected-hit order"""
+        with self.lock:
+            stats = self.templates(game, context)
+
+            def demoted(name):
+                entry = stats.get(name, {})
+                return entry.get("hits", 0) == 0 and entry.get("tries", 0) >= DEMOTE_AFTER_TRIES
+
+            def expected_hit_rate(name):
+                # Laplace-smoothed, so untried templates sit between reliable and failing ones
+                entry = stats.get(name, {})
+                return (entry.get("hits", 0) + 1) / (entry.get("tries", 0) + 2)
+
+            order = sorted(cursor_files, key=lambda name: (demoted(name), -expected_hit_rate(name)))
+
+            # The cursor rarely changes shape between ticks, so the most recent hit leads
+            hit_times = {name: stats[name]["last_hit"] for name in cursor_files if stats.get(name, {}).get("hits")}
+            if hit_times:
+                recent = max(hit_times, key=hit_times.get)
+                order.remove(recent)
+                order.insert(0, recent)
+            return order
+
+    def record(self, game: str, context: str, tried_files: list, hit_file: str = None):
+        """Count one lookup: every file in tried_files was tried, hit_file (the last of them, if any) matched"""
+        with self.lock:
+            stats = self.templates(game, context)
+            for name in tried_files:
+                entry = stats.setdefault(name, {"hits": 0, "tries": 0, "last_hit": 0.0})
+                entry["tries"] += 1
+            if hit_file:
+                entry = stats[hit_file]
+                entry["hits"] += 1
+                entry["last_hit"] = time.time()
+            session = self.lookups.setdefault((game, context), [0, 0])
+            session[0] += 1
+            session[1] += len(tried_files)
+        self.schedule_save()
+
+    def schedule_save(self):
+        """Write the stats file SAVE_DELAY_SECONDS after the first unsaved change"""
+        with self.lock:
+            if self.save_pending:
+                return
+            self.save_pending = True
+        cron.after(f"{SAVE_DELAY_SECONDS}s", self.save)
+
+    def save(self):
+        with self.lock:
+            self.save_pending = False
+            if self.games is None:
+                return
+            data = json.dumps(self.games, indent=1, sort_keys=True)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Cursor stats: could not save {self.path}: {e}")
+
+    def reset(self, game: str = None):
+        with self.lock:
+            self.load()
+            if game:
+                self.games.pop(game, None)
+            else:
+                self.games = {}
+            self.lookups = {}
+        self.schedule_save()
+
+# Global cursor statistics
+cursor_stats = CursorStats(cursor_stats_path)
+
+@mod.action_class
+class CursorStatsActions:
+    def debug_cursor_stats(cursor_directory: str = None) -> None:
+        """Print cursor template hit statistics and templates tried per lookup for a game"""
+        game = cursor_directory or settings.get("user.cursor_directory")
+        print(f"=== DEBUG: CURSOR STATS ({game}) ===")
+        with cursor_stats.lock:
+            cursor_stats.load()
+            contexts = dict(cursor_stats.games.get(game, {}))
+            lookups = dict(cursor_stats.lookups)
+        for context, stats in contexts.items():
+            session = lookups.get((game, context))
+            if session and session[0]:
+                print(f"{context}: {session[1] / session[0]:.2f} templates tried per lookup ({session[0]} lookups this session)")
+            else:
+                print(f"{context}:")
+            for name in cursor_stats.ordered(game, context, list(stats)):
+                entry = stats[name]
+                print(f"  {name}: {entry['hits']}/{entry['tries']} hits")
+        print("=== END DEBUG CURSOR STATS ===")
+
+    def reset_cursor_stats(cursor_directory: str = None) -> None:
+        """Forget cursor template hit statistics for a game (or every game when none is given)"""
+        cursor_stats.reset(cursor_directory)
+        print(f"Cursor stats reset for {cursor_directory or 'all games'}")
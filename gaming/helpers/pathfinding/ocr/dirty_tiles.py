@@ -0,0 +1,169 @@
+"""
+Incremental dirty-tile OCR for pathfinding system.
+
+During continuous navigation only the highlight moves between ticks. The screen
+is split into tiles and diffed against the previous frame; only changed tiles are
+re-OCR'd and their words merged into the previous word list.
+"""
+
+from .ocr_types import OcrLine, word_in_rect
+from ..utils.screen_capture import capture_screen_array, main_screen_bounds, quantized_thumbnail, NUMPY_AVAILABLE
+from ..utils.pathfinding_log import log
+from ..utils.worker_pool import setting
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+# Extra pixels read around each dirty run so words crossing a tile edge are read whole
+TILE_READ_MARGIN = 24
+
+# Settings a dirty-tile read uses, for worker jobs to read on the main thread
+DIRTY_TILE_SETTINGS = ("user.ocr_cache_hash_block", "user.ocr_tile_size", "user.ocr_dirty_tile_max_fraction")
+
+def find_dirty_tiles(previous, current, tile_cells: int):
+    """Return a (rows, cols) boolean array of tiles whose quantized thumbnail changed"""
+    rows = -(-current.shape[0] // tile_cells)
+    cols = -(-current.shape[1] // tile_cells)
+    changed = previous != current
+    padded = np.zeros((rows * tile_cells, cols * tile_cells), dtype=bool)
+    padded[:changed.shape[0], :changed.shape[1]] = changed
+    return padded.reshape(rows, tile_cells, cols, tile_cells).any(axis=(1, 3))
+
+def dirty_tile_runs(dirty, tile_size: int, screen_bounds: tuple) -> list:
+    """Group dirty tiles into horizontal runs per tile row, as screen rectangles"""
+    left_x, top_y, right_x, bottom_y = screen_bounds
+    runs = []
+    for row in range(dirty.shape[0]):
+        col = 0
+        while col < dirty.shape[1]:
+            if not dirty[row, col]:
+                col += 1
+                continue
+            start = col
+            while col < dirty.shape[1] and dirty[row, col]:
+                col += 1
+            runs.append((
+                left_x + start * tile_size,
+                top_y + row * tile_size,
+                min(left_x + col * tile_size, right_x),
+                min(top_y + (row + 1) * tile_size, bottom_y),
+            ))
+    return runs
+
+def expand_rect(rect: tuple, margin: int, screen_bounds: tuple) -> tuple:
+    """Grow a rectangle by margin pixels on each side, clipped to the screen"""
+    left_x, top_y, right_x, bottom_y = rect
+    return (
+        max(left_x - margin, screen_bounds[0]),
+        max(top_y - margin, screen_bounds[1]),
+        min(right_x + margin, screen_bounds[2]),
+        min(bottom_y + margin, screen_bounds[3]),
+    )
+
+def merge_words_into_lines(lines, words) -> list:
+    """Insert words into the line they vertically overlap, starting new lines as needed"""
+    merged = [OcrLine(list(line.words)) for line in lines if line.words]
+    for word in words:
+        center_y = word.top + word.height / 2
+        for line in merged:
+            reference = line.words[0]
+            if abs(reference.top + reference.height / 2 - center_y) <= max(reference.height, word.height) / 2:
+                line.words.append(word)
+                break
+        else:
+            merged.append(OcrLine([word]))
+
+    for line in merged:
+        line.words.sort(key=lambda w: w.left)
+    merged.sort(key=lambda line: (line.words[0].top, line.words[0].left))
+    return merged
+
+class IncrementalOcr:
+    """Previous frame and word list for re-reading only the tiles that changed"""
+
+    def __init__(self):
+        self.previous_frame = None
+        self.previous_lines = None
+        self.screen_bounds = None
+        self.full_reads = 0
+        self.tile_reads = 0
+        self.skipped_reads = 0
+
+    def reset(self):
+        """Forget the previous frame so the next read is a full read"""
+        self.previous_frame = None
+        self.previous_lines = None
+        self.screen_bounds = None
+
+    def read_full(self, gaze_ocr_controller, frame, screen_bounds):
+        """Full-screen OCR, remembered as the baseline for later tile diffs"""
+        gaze_ocr_controller.read_nearby()
+        lines = gaze_ocr_controller.latest_screen_contents().result.lines
+        self.previous_frame = frame
+        self.previous_lines = lines
+        self.screen_bounds = screen_bounds
+        self.full_reads += 1
+        return lines
+
+    def read(self, gaze_ocr_controller):
+        """Return OCR lines for the current screen, re-reading only dirty tiles when possible"""
+        ocr_reader = getattr(gaze_ocr_controller, "ocr_reader", None)
+        if not NUMPY_AVAILABLE or ocr_reader is None or not hasattr(ocr_reader, "read_screen"):
+            gaze_ocr_controller.read_nearby()
+            return gaze_ocr_controller.latest_screen_contents().result.lines
+
+        block = setting("user.ocr_cache_hash_block")
+        tile_size = max(block, setting("user.ocr_tile_size") // block * block)
+        screen_bounds = main_screen_bounds()
+        frame = quantized_thumbnail(capture_screen_array(screen_bounds), block)
+
+        if (self.previous_frame is None or self.previous_frame.shape != frame.shape
+                or self.screen_bounds != screen_bounds):
+            log.debug("Dirty-tile OCR: no baseline frame, running full read")
+            return self.read_full(gaze_ocr_controller, frame, screen_bounds)
+
+        dirty = find_dirty_tiles(self.previous_frame, frame, tile_size // block)
+        dirty_count = int(dirty.sum())
+        if dirty_count == 0:
+            self.skipped_reads += 1
+            log.trace("Dirty-tile OCR: frame unchanged, reusing previous words")
+            return self.previous_lines
+
+        dirty_fraction = dirty_count / dirty.size
+        if dirty_fraction > setting("user.ocr_dirty_tile_max_fraction"):
+            log.debug("Dirty-tile OCR: %.0f%% of tiles changed, running full read", dirty_fraction * 100)
+            return self.read_full(gaze_ocr_controller, frame, screen_bounds)
+
+        runs = dirty_tile_runs(dirty, tile_size, screen_bounds)
+        fresh_words = []
+        for run in runs:
+            contents = ocr_reader.read_screen(expand_rect(run, TILE_READ_MARGIN, screen_bounds))
+            for line in contents.result.lines:
+                fresh_words.extend(word for word in line.words if word_in_rect(word, run))
+
+        # Words anchored in a dirty run are replaced by the fresh read
+        kept_lines = [
+            OcrLine([word for word in line.words if not any(word_in_rect(word, run) for run in runs)])
+            for line in self.previous_lines
+        ]
+        lines = merge_words_into_lines(kept_lines, fresh_words)
+
+        self.previous_frame = frame
+        self.previous_lines = lines
+        self.tile_reads += 1
+        log.debug("Dirty-tile OCR: re-read %d/%d tiles in %d run(s), %d fresh words", dirty_count, dirty.size, len(runs), len(fresh_words))
+        return lines
+
+# Global incremental OCR state, active only during continuous navigation
+incremental_ocr = IncrementalOcr()
+incremental_ocr_active = False
+
+def set_incremental_ocr_active(active: bool):
+    """Enable dirty-tile OCR for the current navigation run and drop any previous baseline"""
+    global incremental_ocr_active
+    incremental_ocr_active = active and setting("user.ocr_dirty_tiles")
+    incremental_ocr.reset()
+
+def is_incremental_ocr_active() -> bool:
+    """True while a continuous navigation run is using dirty-tile OCR"""
+    return incremental_ocr_active
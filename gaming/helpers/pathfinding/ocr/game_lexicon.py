@@ -0,0 +1,178 @@
+"""
+Per-game lexicon for pathfinding text matching.
+
+Built from the gaming/game_disambiguation/*.talon-list vocabulary corrections
+(e.g. 'file: fire', 'clems: cleanse') for the active manual game. Spoken forms and
+known menu terms map to canonical on-screen tokens, which are looked up exactly
+in the OCR word set before any fuzzy scoring runs.
+"""
+
+from talon import Module, storage
+from .token_index import normalize_token as normalize_lexicon_token
+from .template_cache import file_mtime
+from ..utils.worker_pool import main_thread_value
+import os
+import time
+
+mod = Module()
+
+# Per-game vocabulary lists (list: user.vocabulary, scoped by user.active_manual_game),
+# resolved once from this file's place in gaming/helpers/pathfinding/ocr/
+game_disambiguation_location = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "game_disambiguation")
+)
+
+# How long the list files are trusted before their mtimes are checked again
+LEXICON_RECHECK_SECONDS = 2.0
+
+def parse_talon_list(filepath: str) -> tuple:
+    """Parse a .talon-list file into (header dict, {spoken: written})"""
+    headers = {}
+    entries = {}
+    in_body = False
+    with open(filepath, "r", encoding="utf-8") as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if not in_body:
+                if line == "-":
+                    in_body = True
+                elif ":" in line:
+                    key, value = line.split(":", 1)
+                    headers[key.strip()] = value.strip()
+                continue
+            if ":" in line:
+                spoken, written = line.split(":", 1)
+                entries[spoken.strip().lower()] = written.strip().strip("'\"")
+            else:
+                entries[line.lower()] = line
+    return headers, entries
+
+class GameLexicon:
+    """Spoken form / menu term -> canonical on-screen phrase for one game"""
+
+    def __init__(self, game: str, entries: dict):
+        self.game = game
+        self.terms = {}
+        for spoken, written in entries.items():
+            canonical = tuple(normalize_lexicon_token(token) for token in written.split())
+            if not canonical:
+                continue
+            spoken_key = tuple(normalize_lexicon_token(token) for token in spoken.split())
+            self.terms.setdefault(spoken_key, set()).add(canonical)
+            # Canonical terms map to themselves so known menu words resolve too
+            self.terms.setdefault(canonical, set()).add(canonical)
+
+    def canonical_forms(self, target_text: str) -> list:
+        """Canonical token tuples for target_text, or [] when it is not a game term"""
+        key = tuple(normalize_lexicon_token(token) for token in target_text.split())
+        return sorted(self.terms.get(key, ()))
+
+def list_file_mtimes() -> tuple:
+    """((path, mtime), ...) for every .talon-list file in the game disambiguation directory"""
+    if not os.path.isdir(game_disambiguation_location):
+        return ()
+    return tuple(
+        (path, file_mtime(path))
+        for path in sorted(
+            os.path.join(game_disambiguation_location, name)
+            for name in os.listdir(game_disambiguation_location)
+            if name.endswith(".talon-list")
+        )
+    )
+
+class LexiconCache:
+    """Lexicon for the active game, rebuilt when the game or its list files change
+
+    A change of user.manual_game rebuilds on the next lookup. Otherwise the list
+    files are only re-stat'ed every LEXICON_RECHECK_SECONDS, so lookups in between
+    never touch the filesystem.
+    """
+
+    def __init__(self):
+        self.game = None
+        self.mtimes = None
+        self.checked_at = 0.0
+        self.lexicon = None
+
+    def get(self):
+        """Return the active game's lexicon, or None when no game list applies"""
+        game = (storage.get("user.manual_game") or "").lower()
+        if not game:
+            return None
+
+        now = time.monotonic()
+        if game == self.game and now - self.checked_at < LEXICON_RECHECK_SECONDS:
+            return self.lexicon
+        self.checked_at = now
+        mtimes = list_file_mtimes()
+        if game == self.game and mtimes == self.mtimes:
+            return self.lexicon
+        list_files = [path for path, _ in mtimes]
+
+        entries = {}
+        for path in list_files:
+            try:
+                headers, file_entries = parse_talon_list(path)
+            except Exception as e:
+                print(f"Game lexicon: could not read {path}: {e}")
+                continue
+            if headers.get("user.active_manual_game", "").lower() == game:
+                entries.update(file_entries)
+
+        self.game = game
+        self.mtimes = mtimes
+        self.lexicon = GameLexicon(game, entries) if entries else None
+        if self.lexicon:
+            print(f"Game lexicon: built {len(self.lexicon.terms)} terms for '{game}'")
+        return self.lexicon
+
+# Global lexicon cache
+game_lexicon_cache = LexiconCache()
+
+def get_game_lexicon():
+    """Lexicon for the active manual game, or None"""
+    return main_thread_value("game_lexicon", game_lexicon_cache.get)
+
+def find_lexicon_matches(lines, canonical_forms: list, token_index) -> list:
+    """Exact on-screen occurrences of any canonical form, as word or phrase match dictionaries"""
+    matches = []
+    for canonical in canonical_forms:
+        for line_idx, word_idx in token_index.normalized_positions(canonical[0]):
+            words = lines[line_idx].words[word_idx:word_idx + len(canonical)]
+            if len(words) < len(canonical):
+                continue
+            if any(normalize_lexicon_token(word.text) != token for word, token in zip(words[1:], canonical[1:])):
+                continue
+
+            first_word, last_word = words[0], words[-1]
+            match = {
+                'coords': (first_word.left, first_word.top + first_word.height // 2),
+                'text': ' '.join(word.text for word in words),
+                'width': (last_word.left + last_word.width) - first_word.left,
+                'height': max(word.height for word in words),
+                'line': line_idx,
+                'fuzzy_score': 1.0,
+            }
+            if len(canonical) > 1:
+                match.update({'word_start': word_idx, 'word_count': len(canonical), 'is_phrase': True})
+            else:
+                match['word'] = word_idx
+            matches.append(match)
+    matches.sort(key=lambda m: (m['line'], m.get('word', m.get('word_start'))))
+    return matches
+
+@mod.action_class
+class GameLexiconActions:
+    def debug_game_lexicon() -> None:
+        """Print the lexicon built for the active manual game"""
+        lexicon = get_game_lexicon()
+        print("=== DEBUG: GAME LEXICON ===")
+        if not lexicon:
+            print(f"No lexicon for game '{storage.get('user.manual_game')}'")
+        else:
+            print(f"Game: {lexicon.game}, {len(lexicon.terms)} terms")
+            for spoken, canonical_forms in sorted(lexicon.terms.items()):
+                print(f"  {' '.join(spoken)} -> {', '.join(' '.join(c) for c in sorted(canonical_forms))}")
+        print("=== END DEBUG GAME LEXICON ===")
@@ -0,0 +1,156 @@
+"""
+Frame-hash keyed OCR result cache for pathfinding system.
+
+Static menus produce the same frame again and again (repeated commands, a pick
+after disambiguation). The cache hashes a downsampled capture of the OCR area
+and returns the previous OCR lines when the hash matches instead of re-running OCR.
+On a miss the same capture is handed to the OCR reader when it can read a given
+frame, so the screen is only grabbed once per read.
+"""
+
+from talon import Module, settings
+from collections import OrderedDict
+from ..utils.screen_capture import (
+    capture_screen_array, frame_hash, main_screen_bounds, array_to_pil_image, NUMPY_AVAILABLE, PIL_AVAILABLE,
+)
+from .ocr_types import filter_lines_to_rects
+from ..utils.pathfinding_log import log
+from ..utils.worker_pool import setting
+
+mod = Module()
+
+# Settings the cache reads, for worker jobs to read on the main thread
+OCR_CACHE_SETTINGS = ("user.ocr_cache_size", "user.ocr_cache_hash_block")
+
+class OcrResultCache:
+    """LRU-bounded map of frame hash -> OCR lines with hit/miss counters"""
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return cached OCR lines for key, counting the hit or miss"""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, lines, max_entries: int):
+        """Store OCR lines for key, evicting the least recently used entries"""
+        self.entries[key] = lines
+        self.entries.move_to_end(key)
+        while len(self.entries) > max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset counters"""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Global cache instance
+ocr_result_cache = OcrResultCache()
+
+class OcrFrame:
+    """One capture of an OCR region (name None for the full screen) with its screen bounds"""
+
+    def __init__(self, name, bounds: tuple, array):
+        self.name = name
+        self.bounds = bounds
+        self.array = array
+
+def capture_cache_frames(regions: tuple):
+    """Capture the OCR area for the cache, or None if the cache is disabled or capture fails"""
+    if setting("user.ocr_cache_size") <= 0:
+        return None
+    return capture_ocr_frames(regions)
+
+def capture_ocr_frames(regions: tuple):
+    """Capture the OCR regions (or full screen) once for hashing and OCR, or None if capture fails"""
+    if not NUMPY_AVAILABLE:
+        return None
+    try:
+        if regions:
+            return tuple(OcrFrame(name, rect, capture_screen_array(rect)) for name, rect in regions)
+        bounds = main_screen_bounds()
+        return (OcrFrame(None, bounds, capture_screen_array(bounds)),)
+    except Exception as e:
+        log.warn("OCR cache: frame capture failed, bypassing cache (%s)", e)
+        return None
+
+def hash_ocr_frames(frames):
+    """Cache key for captured frames, or None when there are none"""
+    if not frames:
+        return None
+    block = setting("user.ocr_cache_hash_block")
+    return (
+        tuple(frame.name for frame in frames if frame.name is not None),
+        tuple(frame_hash(frame.array, block) for frame in frames),
+    )
+
+def read_frame_lines(ocr_reader, frame):
+    """OCR lines for an already captured frame, or None when the reader can only capture itself"""
+    try:
+        read_frame = getattr(ocr_reader, "read_frame", None)
+        if read_frame is not None:
+            contents = read_frame(frame.array, frame.bounds)
+            return contents.result.lines if contents is not None else None
+        read_image = getattr(ocr_reader, "read_image", None)
+        if read_image is not None and PIL_AVAILABLE:
+            # gaze-ocr's screen reader takes images in screen points plus their offset
+            image = array_to_pil_image(frame.array, frame.bounds)
+            return read_image(image, offset=frame.bounds[:2]).result.lines
+    except Exception as e:
+        log.warn("OCR cache: reader could not OCR the captured frame, re-reading the screen (%s)", e)
+    return None
+
+def read_captured_lines(ocr_reader, frames, read_lines):
+    """OCR the frames captured for the cache key, or fall back to read_lines() when the reader cannot"""
+    if not frames or ocr_reader is None:
+        return read_lines()
+    lines = []
+    for frame in frames:
+        frame_lines = read_frame_lines(ocr_reader, frame)
+        if frame_lines is None:
+            return read_lines()
+        if frame.name is not None:
+            # Region reads may include margin text
+            frame_lines = filter_lines_to_rects(frame_lines, [frame.bounds])
+        lines.extend(frame_lines)
+    log.debug("OCR read %d captured frame(s) without a second capture", len(frames))
+    return lines
+
+def read_through_ocr_cache(frame_key, read_lines):
+    """Return cached lines for frame_key, or call read_lines() and cache its result"""
+    if frame_key is None:
+        return read_lines()
+
+    cached_lines = ocr_result_cache.get(frame_key)
+    if cached_lines is not None:
+        log.debug("OCR cache HIT: frame unchanged, reusing %d lines", len(cached_lines))
+        return cached_lines
+
+    lines = read_lines()
+    ocr_result_cache.put(frame_key, lines, setting("user.ocr_cache_size"))
+    log.debug("OCR cache MISS: stored %d lines (%d cached frames)", len(lines), len(ocr_result_cache.entries))
+    return lines
+
+@mod.action_class
+class OcrCacheActions:
+    def debug_ocr_cache_stats() -> None:
+        """Print OCR result cache hit/miss counters"""
+        total = ocr_result_cache.hits + ocr_result_cache.misses
+        hit_rate = (ocr_result_cache.hits / total * 100) if total else 0.0
+        print("=== DEBUG: OCR CACHE ===")
+        print(f"Hits: {ocr_result_cache.hits}, misses: {ocr_result_cache.misses}, hit rate: {hit_rate:.1f}%")
+        print(f"Cached frames: {len(ocr_result_cache.entries)} / {settings.get('user.ocr_cache_size')}")
+        print("=== END DEBUG OCR CACHE ===")
+
+    def clear_ocr_cache() -> None:
+        """Drop all cached OCR results and reset counters"""
+        ocr_result_cache.clear()
+        print("OCR cache cleared")
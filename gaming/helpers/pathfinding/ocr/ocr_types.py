@@ -0,0 +1,53 @@
+"""
+Lightweight OCR result types for pathfinding system.
+
+Mirror the shape of talon-gaze-ocr screen contents (contents.result.lines[i].words[j])
+so results that are filtered, merged or replayed can be used anywhere gaze-ocr
+contents are expected.
+"""
+
+class OcrWord:
+    """A single OCR word with its screen bounding box"""
+
+    def __init__(self, text: str, left: int, top: int, width: int, height: int):
+        self.text = text
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+
+    def __repr__(self):
+        return f"OcrWord({self.text!r}, {self.left}, {self.top}, {self.width}, {self.height})"
+
+class OcrLine:
+    """A line of OCR words ordered left to right"""
+
+    def __init__(self, words: list):
+        self.words = words
+
+class OcrResult:
+    """OCR lines for one read"""
+
+    def __init__(self, lines: list):
+        self.lines = lines
+
+class OcrContents:
+    """Screen contents wrapper exposing .result.lines like gaze-ocr"""
+
+    def __init__(self, lines: list):
+        self.result = OcrResult(lines)
+
+def word_in_rect(word, rect: tuple) -> bool:
+    """Check whether a word's left-centre anchor lies inside (left_x, top_y, right_x, bottom_y)"""
+    left_x, top_y, right_x, bottom_y = rect
+    anchor_y = word.top + word.height // 2
+    return left_x <= word.left <= right_x and top_y <= anchor_y <= bottom_y
+
+def filter_lines_to_rects(lines, rects: list) -> list:
+    """Keep only words inside any of the rectangles, dropping lines left empty"""
+    filtered_lines = []
+    for line in lines:
+        words = [word for word in line.words if any(word_in_rect(word, rect) for rect in rects)]
+        if words:
+            filtered_lines.append(OcrLine(words))
+    return filtered_lines
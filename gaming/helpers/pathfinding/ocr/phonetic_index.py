@@ -0,0 +1,76 @@
+"""
+Phonetic key index over OCR words for pathfinding system.
+
+Speech recognition swaps words that sound alike (file/fire, clems/cleanse). Each
+OCR word gets a coarse phonetic key that merges sounds recognition confuses. When
+full fuzzy scoring finds nothing, words sharing the target's key are accepted at the
+looser Jaro-Winkler threshold, so "file" reaches "Fire" but never "Skills".
+"""
+
+# Consonant classes: letters speech recognition commonly swaps share a code
+PHONETIC_CLASSES = {
+    "b": "P", "p": "P",
+    "f": "F", "v": "F",
+    "c": "K", "g": "K", "k": "K", "q": "K",
+    "s": "S", "z": "S", "x": "S",
+    "d": "T", "t": "T",
+    # Liquids merge: fire/file, clems/cleanse
+    "l": "R", "r": "R",
+    # Nasals merge
+    "m": "N", "n": "N",
+    "j": "J",
+}
+
+VOWELS = set("aeiouy")
+
+SILENT_PREFIXES = (("kn", "n"), ("wr", "r"), ("gn", "n"), ("ps", "s"))
+
+def phonetic_key(text: str) -> str:
+    """Coarse sounds-like key: leading vowel marker plus merged consonant classes, repeats collapsed"""
+    word = "".join(ch for ch in text.lower() if ch.isalpha())
+    # Silent and doubled spellings: knight/night, write/right, phase/faze
+    for prefix, replacement in SILENT_PREFIXES:
+        if word.startswith(prefix):
+            word = replacement + word[len(prefix):]
+    word = word[:1] + word[1:].replace("gh", "")
+    letters = list(word.replace("ph", "f").replace("ck", "k"))
+    if not letters:
+        return ""
+
+    codes = ["A"] if letters[0] in VOWELS else []
+    for idx, ch in enumerate(letters):
+        if ch == "c" and idx + 1 < len(letters) and letters[idx + 1] in "eiy":
+            code = "S"  # soft c
+        else:
+            code = PHONETIC_CLASSES.get(ch)
+        if code and (not codes or codes[-1] != code):
+            codes.append(code)
+    return "".join(codes)
+
+class PhoneticIndex:
+    """Phonetic key -> word indices for one flat list of OCR word texts"""
+
+    def __init__(self, texts: list):
+        self.texts = texts
+        self.buckets = {}
+        for idx, text in enumerate(texts):
+            self.buckets.setdefault(phonetic_key(text), []).append(idx)
+
+    def shortlist(self, spoken_forms: list) -> list:
+        """Sorted indices of words sharing a phonetic key with any of the spoken forms"""
+        indices = set()
+        for form in spoken_forms:
+            key = phonetic_key(form)
+            if key:
+                indices.update(self.buckets.get(key, ()))
+        return sorted(indices)
+
+# Index for the most recently scored word list, reused while the OCR snapshot is unchanged
+cached_phonetic_index = None
+
+def get_phonetic_index(texts: list) -> PhoneticIndex:
+    """Return the phonetic index for these word texts, rebuilding only when they change"""
+    global cached_phonetic_index
+    if cached_phonetic_index is None or cached_phonetic_index.texts != texts:
+        cached_phonetic_index = PhoneticIndex(texts)
+    return cached_phonetic_index
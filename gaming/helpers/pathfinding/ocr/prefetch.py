@@ -0,0 +1,167 @@
+"""
+Background OCR prefetch for pathfinding system.
+
+While game mode is active in a pathfinding game, a cron tick keeps the shared OCR
+snapshot fresh so navigation commands can match text without waiting for OCR.
+Hashing and OCR run on a background worker; the result is installed on the main
+thread. The screen is only re-read when its frame hash changes, checks slow down
+while the screen is idle, and OCR time is held to a CPU budget.
+"""
+
+from talon import Module, app, cron, scope, settings
+from . import text_detection
+from .ocr_cache import OCR_CACHE_SETTINGS, capture_ocr_frames, hash_ocr_frames, read_captured_lines, read_through_ocr_cache
+from .dirty_tiles import is_incremental_ocr_active
+from ..utils.integrations import get_gaze_ocr_controller
+from ..utils.screen_capture import main_screen_bounds
+from ..utils.worker_pool import prefetch_worker, main_thread_values
+from ..utils.pathfinding_log import log
+import time
+
+mod = Module()
+
+# Base tick for the prefetch job; actual checks are spaced by the settings below
+PREFETCH_TICK_MS = 100
+
+class PrefetchState:
+    """Timing and counters for the background OCR prefetch"""
+
+    def __init__(self):
+        self.last_frame_key = None
+        self.unchanged_checks = 0
+        self.next_check_at = 0.0
+        self.last_ocr_ms = 0.0
+        self.refreshes = 0
+        self.confirmations = 0
+
+# Global prefetch state
+prefetch_state = PrefetchState()
+prefetch_job = None
+
+def prefetch_context_active() -> bool:
+    """True while game mode is active in a game that uses pathfinding"""
+    if not settings.get("user.ocr_prefetch") or not settings.get("user.uses_pathfinding"):
+        return False
+    return "user.game" in (scope.get("mode") or ())
+
+def find_ocr_reader():
+    """Return gaze-ocr's screen reader, which can read the full screen without moving the eye tracker"""
+    ocr_reader = getattr(get_gaze_ocr_controller(), "ocr_reader", None)
+    if ocr_reader is not None and hasattr(ocr_reader, "read_screen"):
+        return ocr_reader
+    return None
+
+def read_prefetch_lines(ocr_reader, regions: tuple):
+    """OCR the active regions, or the whole screen, through the screen reader"""
+    if regions:
+        return text_detection.filter_lines_to_rects(
+            [line for _, rect in regions for line in ocr_reader.read_screen(rect).result.lines],
+            [rect for _, rect in regions],
+        )
+    return ocr_reader.read_screen().result.lines
+
+def schedule_next_check(now: float):
+    """Space the next check by the active or idle interval and the CPU budget"""
+    if prefetch_state.unchanged_checks >= settings.get("user.ocr_prefetch_idle_checks"):
+        interval_ms = settings.get("user.ocr_prefetch_idle_interval")
+    else:
+        interval_ms = settings.get("user.ocr_prefetch_interval")
+
+    # Keep OCR time under the budgeted fraction of wall time
+    budget = settings.get("user.ocr_prefetch_cpu_budget")
+    if budget > 0:
+        interval_ms = max(interval_ms, prefetch_state.last_ocr_ms / budget)
+    prefetch_state.next_check_at = now + interval_ms / 1000
+
+def read_prefetch(ocr_reader, regions: tuple, last_frame_key):
+    """Worker half of a tick: (frame key, lines or None when the frame is unchanged, OCR milliseconds)"""
+    frames = capture_ocr_frames(regions)
+    frame_key = hash_ocr_frames(frames)
+    if frame_key is not None and frame_key == last_frame_key:
+        return frame_key, None, 0.0
+    start = time.perf_counter()
+    lines = read_through_ocr_cache(
+        frame_key, lambda: read_captured_lines(ocr_reader, frames, lambda: read_prefetch_lines(ocr_reader, regions))
+    )
+    return frame_key, lines, (time.perf_counter() - start) * 1000
+
+def prefetch_tick():
+    """Refresh the shared OCR snapshot on the prefetch worker if the screen changed since the last check"""
+    if not prefetch_context_active() or is_incremental_ocr_active():
+        # Continuous navigation reads its own dirty tiles
+        return
+
+    now = time.monotonic()
+    if now < prefetch_state.next_check_at:
+        return
+
+    ocr_reader = find_ocr_reader()
+    if ocr_reader is None:
+        prefetch_state.next_check_at = now + settings.get("user.ocr_prefetch_idle_interval") / 1000
+        return
+
+    regions = text_detection.get_active_ocr_regions()
+    snapshot = text_detection.current_ocr_snapshot
+    # An unchanged frame only counts when it was read into the current snapshot
+    last_frame_key = prefetch_state.last_frame_key if snapshot and snapshot.regions == regions else None
+    invalidations = text_detection.ocr_snapshot_invalidations
+
+    def prefetch_read(result):
+        frame_key, lines, ocr_ms = result
+        if text_detection.ocr_snapshot_invalidations != invalidations:
+            # A key was sent while the worker read the screen, so the read may predate it
+            schedule_next_check(time.monotonic())
+            return
+        current = text_detection.current_ocr_snapshot
+        if lines is None:
+            if current and not current.invalidated:
+                # Screen idle: keep the snapshot alive without re-reading
+                current.confirm_unchanged()
+                prefetch_state.unchanged_checks += 1
+                prefetch_state.confirmations += 1
+            # An invalidated snapshot waits for the screen to redraw after the key press
+            # rather than being replaced by the cached lines of the frame before it
+            prefetch_state.last_ocr_ms = 0.0
+        else:
+            text_detection.install_ocr_snapshot(lines, regions)
+            prefetch_state.last_ocr_ms = ocr_ms
+            prefetch_state.last_frame_key = frame_key
+            prefetch_state.unchanged_checks = 0
+            prefetch_state.refreshes += 1
+            log.debug("OCR prefetch: refreshed snapshot (%d lines) in %.0fms", len(lines), prefetch_state.last_ocr_ms)
+        schedule_next_check(time.monotonic())
+
+    def prefetch_failed(error):
+        print(f"OCR prefetch error: {error}")
+        prefetch_state.last_frame_key = None
+        schedule_next_check(time.monotonic())
+
+    worker_values = {name: settings.get(name) for name in OCR_CACHE_SETTINGS}
+    worker_values["screen_bounds"] = main_screen_bounds()
+
+    def read_on_worker():
+        with main_thread_values.use(worker_values):
+            return read_prefetch(ocr_reader, regions, last_frame_key)
+
+    if prefetch_worker.submit_if_idle(read_on_worker, prefetch_read, prefetch_failed):
+        # The next check is scheduled once this read lands
+        prefetch_state.next_check_at = float("inf")
+
+def start_prefetch_job():
+    """Start the prefetch tick; it stays inactive until game mode and user.ocr_prefetch are on"""
+    global prefetch_job
+    if prefetch_job is None:
+        prefetch_job = cron.interval(f"{PREFETCH_TICK_MS}ms", prefetch_tick)
+
+app.register("ready", start_prefetch_job)
+
+@mod.action_class
+class OcrPrefetchActions:
+    def debug_ocr_prefetch_stats() -> None:
+        """Print background OCR prefetch counters"""
+        print("=== DEBUG: OCR PREFETCH ===")
+        print(f"Active: {prefetch_context_active()}")
+        print(f"Refreshes: {prefetch_state.refreshes}, unchanged checks: {prefetch_state.confirmations}")
+        print(f"Idle streak: {prefetch_state.unchanged_checks}, last OCR: {prefetch_state.last_ocr_ms:.0f}ms")
+        print(f"Worker: busy {prefetch_worker.busy}, failed: {prefetch_worker.failed}, last job: {prefetch_worker.last_job_ms:.0f}ms")
+        print("=== END DEBUG OCR PREFETCH ===")
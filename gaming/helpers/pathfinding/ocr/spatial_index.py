@@ -0,0 +1,125 @@
+"""
+Spatial index over OCR words for pathfinding system.
+
+A uniform grid of buckets built once per OCR snapshot, so "words near the cursor"
+and "nearest match" queries only visit the cells around the query point instead
+of every word on screen.
+"""
+
+import math
+
+# Bucket size in pixels; roughly one menu item tall and a short word wide
+DEFAULT_CELL_SIZE = 96
+
+class PointGrid:
+    """Uniform grid of (x, y, item) points supporting rectangle and nearest-point queries"""
+
+    def __init__(self, points, cell_size: int = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.buckets = {}
+        self.count = 0
+        min_cell_x = min_cell_y = max_cell_x = max_cell_y = 0
+        for order, (x, y, item) in enumerate(points):
+            cell = (int(x // cell_size), int(y // cell_size))
+            # Insertion order breaks ties so results match a linear scan
+            self.buckets.setdefault(cell, []).append((x, y, order, item))
+            if self.count == 0:
+                min_cell_x, min_cell_y, max_cell_x, max_cell_y = cell[0], cell[1], cell[0], cell[1]
+            else:
+                min_cell_x = min(min_cell_x, cell[0])
+                min_cell_y = min(min_cell_y, cell[1])
+                max_cell_x = max(max_cell_x, cell[0])
+                max_cell_y = max(max_cell_y, cell[1])
+            self.count += 1
+        self.cell_bounds = (min_cell_x, min_cell_y, max_cell_x, max_cell_y)
+
+    def __len__(self):
+        return self.count
+
+    def query_rect(self, left_x: float, top_y: float, right_x: float, bottom_y: float) -> list:
+        """Return items whose point lies inside the rectangle (inclusive), in insertion order"""
+        if not self.count:
+            return []
+        min_cell_x, min_cell_y, max_cell_x, max_cell_y = self.cell_bounds
+        # Clamp to occupied cells so unbounded (infinite) edges stay cheap
+        first_x = max(min_cell_x, math.floor(left_x / self.cell_size)) if left_x != -math.inf else min_cell_x
+        last_x = min(max_cell_x, math.floor(right_x / self.cell_size)) if right_x != math.inf else max_cell_x
+        first_y = max(min_cell_y, math.floor(top_y / self.cell_size)) if top_y != -math.inf else min_cell_y
+        last_y = min(max_cell_y, math.floor(bottom_y / self.cell_size)) if bottom_y != math.inf else max_cell_y
+
+        found = []
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                for x, y, order, item in self.buckets.get((cell_x, cell_y), ()):
+                    if left_x <= x <= right_x and top_y <= y <= bottom_y:
+                        found.append((order, item))
+        found.sort(key=lambda entry: entry[0])
+        return [item for _, item in found]
+
+    def nearest(self, point: tuple, accept=None):
+        """Return (item, distance) of the closest point by Euclidean distance, or (None, inf)"""
+        if not self.count:
+            return None, math.inf
+        px, py = point
+        center_x = math.floor(px / self.cell_size)
+        center_y = math.floor(py / self.cell_size)
+        min_cell_x, min_cell_y, max_cell_x, max_cell_y = self.cell_bounds
+        max_ring = max(
+            abs(center_x - min_cell_x), abs(center_x - max_cell_x),
+            abs(center_y - min_cell_y), abs(center_y - max_cell_y),
+        )
+
+        best = None
+        for ring in range(max_ring + 1):
+            for cell in ring_cells(center_x, center_y, ring):
+                for x, y, order, item in self.buckets.get(cell, ()):
+                    if accept is not None and not accept(item):
+                        continue
+                    distance = math.hypot(x - px, y - py)
+                    if best is None or (distance, order) < (best[0], best[1]):
+                        best = (distance, order, item)
+            # Points in the next ring lie beyond ring * cell_size; stop only when the best
+            # is strictly inside that bound so boundary ties never depend on float edges
+            if best is not None and best[0] < ring * self.cell_size:
+                break
+
+        if best is None:
+            return None, math.inf
+        return best[2], best[0]
+
+def ring_cells(center_x: int, center_y: int, ring: int):
+    """Yield the cells on the square ring at Chebyshev distance ring from the centre cell"""
+    if ring == 0:
+        yield (center_x, center_y)
+        return
+    for cell_x in range(center_x - ring, center_x + ring + 1):
+        yield (cell_x, center_y - ring)
+        yield (cell_x, center_y + ring)
+    for cell_y in range(center_y - ring + 1, center_y + ring):
+        yield (center_x - ring, cell_y)
+        yield (center_x + ring, cell_y)
+
+def build_word_index(lines, cell_size: int = DEFAULT_CELL_SIZE) -> PointGrid:
+    """Index OCR words by their left-centre anchor; items are (line_idx, word_idx, word)"""
+    return PointGrid(
+        (
+            (word.left, word.top + word.height // 2, (line_idx, word_idx, word))
+            for line_idx, line in enumerate(lines)
+            for word_idx, word in enumerate(line.words)
+        ),
+        cell_size,
+    )
+
+def closest_match(matches: list, point: tuple):
+    """Return (match, distance) of the match dict whose 'coords' are closest to point
+
+    Match lists hold a handful of candidates, so a linear scan beats building a grid
+    per query; the first of equally close matches wins, as with PointGrid.nearest.
+    """
+    px, py = point
+    best_match, best_distance = None, math.inf
+    for match in matches:
+        distance = math.hypot(match['coords'][0] - px, match['coords'][1] - py)
+        if distance < best_distance:
+            best_match, best_distance = match, distance
+    return best_match, best_distance
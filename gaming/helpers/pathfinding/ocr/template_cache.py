@@ -0,0 +1,299 @@
+"""
+Template image cache for pathfinding system.
+
+Cursor and click templates (gaming/cursors/<game>, gaming/grid_cursors/<game>,
+gaming/images_to_click) are listed and decoded once and kept in memory instead of
+being re-read from disk by every locate call. Directory and file mtimes are
+re-checked at most every TEMPLATE_RECHECK_SECONDS, so edited or added templates are
+picked up without a reload. The game's cursor directories are preloaded when
+user.cursor_directory changes. Templates are matched against one shared screen
+capture per lookup or navigation tick rather than a fresh capture per locate call.
+"""
+
+from talon import Module, app, settings
+from contextlib import contextmanager
+import os
+import threading
+import time
+
+mod = Module()
+
+gaming_location = "/Users/jarrod/.talon/user/jarrod/gaming/"
+cursors_location = gaming_location + "cursors/"
+grid_cursors_location = gaming_location + "grid_cursors/"
+images_to_click_location = gaming_location + "images_to_click/"
+
+TEMPLATE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# How long a directory listing or decoded template is trusted before its mtime is checked again
+TEMPLATE_RECHECK_SECONDS = 2.0
+
+def file_mtime(path: str):
+    """Modification time of path, or None when it does not exist"""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+class CachedEntry:
+    """A cached value with the mtime it was built from and when that was last confirmed"""
+
+    def __init__(self, mtime, value):
+        self.mtime = mtime
+        self.value = value
+        self.checked_at = time.monotonic()
+
+class TemplateCache:
+    """Directory listings and decoded templates, invalidated by mtime"""
+
+    def __init__(self):
+        self.listings = {}
+        self.images = {}
+        self.arrays = {}
+        self.hits = 0
+        self.loads = 0
+
+    def fresh_entry(self, entries: dict, path: str):
+        """Cached entry for path if its mtime is unchanged (checked at most every TEMPLATE_RECHECK_SECONDS)"""
+        entry = entries.get(path)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if now - entry.checked_at < TEMPLATE_RECHECK_SECONDS:
+            return entry
+        if file_mtime(path) != entry.mtime:
+            del entries[path]
+            return None
+        entry.checked_at = now
+        return entry
+
+    def list_templates(self, directory: str):
+        """Sorted template file names in directory, or None when it does not exist"""
+        entry = self.fresh_entry(self.listings, directory)
+        if entry is not None:
+            return entry.value
+
+        mtime = file_mtime(directory)
+        if mtime is None or not os.path.isdir(directory):
+            return None
+        files = sorted(name for name in os.listdir(directory) if name.lower().endswith(TEMPLATE_EXTENSIONS))
+        self.listings[directory] = CachedEntry(mtime, files)
+        return files
+
+    def image(self, path: str):
+        """Decoded Talon image for a template file"""
+        entry = self.fresh_entry(self.images, path)
+        if entry is not None:
+            self.hits += 1
+            return entry.value
+
+        from talon.skia import Image
+        mtime = file_mtime(path)
+        image = Image.from_file(path)
+        self.images[path] = CachedEntry(mtime, image)
+        self.loads += 1
+        return image
+
+    def array(self, path: str):
+        """Template pixels as an (height, width, channels) uint8 NumPy array"""
+        entry = self.fresh_entry(self.arrays, path)
+        if entry is not None:
+            self.hits += 1
+            return entry.value
+
+        from ..utils.screen_capture import load_png_as_array
+        mtime = file_mtime(path)
+        array = load_png_as_array(path)
+        self.arrays[path] = CachedEntry(mtime, array)
+        self.loads += 1
+        return array
+
+    def preload(self, directory: str) -> int:
+        """List and decode every template in directory; returns how many were loaded"""
+        files = self.list_templates(directory) or []
+        for name in files:
+            try:
+                self.image(os.path.join(directory, name))
+            except Exception as e:
+                print(f"Template cache: could not decode {name}: {e}")
+        return len(files)
+
+    def clear(self):
+        self.listings.clear()
+        self.images.clear()
+        self.arrays.clear()
+
+# Global template cache
+template_cache = TemplateCache()
+
+def cursor_template_directory(cursor_directory: str, grid: bool = False) -> str:
+    """gaming/cursors/<game>/ or gaming/grid_cursors/<game>/"""
+    return f"{grid_cursors_location if grid else cursors_location}{cursor_directory}/"
+
+# Whether locate.locate accepts decoded images; falls back to file paths if not
+image_templates_supported = True
+
+# Screen captures taken and reused from shared frames, for debug output
+frame_captures = 0
+frame_reuses = 0
+
+class SharedFrame(threading.local):
+    """Screen captures reused by all template matches of one lookup or navigation tick
+
+    Captures are only kept inside lookup(): the outermost lookup starts from an
+    empty frame and drops it when it ends, and invalidate() drops it in between
+    when a key press moves the cursor. Outside a lookup every capture is fresh.
+    Each thread has its own frame, so a navigation tick on the worker and a voice
+    command on the main thread never see each other's captures.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        # bounds (None = full screen) -> captured image
+        self.images = {}
+        # (bounds, template path, threshold) -> matches found in that capture
+        self.results = {}
+        # (bounds, kind) -> prepared pixels, and (bounds, template path) -> score map, for the NumPy matchers
+        self.arrays = {}
+        self.score_maps = {}
+
+    @contextmanager
+    def lookup(self):
+        """Share captures until the outermost lookup ends"""
+        if self.depth == 0:
+            self.invalidate()
+        self.depth += 1
+        try:
+            yield self
+        finally:
+            self.depth -= 1
+            if self.depth == 0:
+                self.invalidate()
+
+    def keeping(self) -> bool:
+        """True inside a lookup, where captures and results are kept for reuse"""
+        return self.depth > 0
+
+    def get(self, bounds: tuple = None):
+        """The capture of bounds (or the full screen), reused within the current lookup"""
+        global frame_captures, frame_reuses
+        if bounds in self.images:
+            frame_reuses += 1
+            return self.images[bounds]
+        from ..utils.screen_capture import capture_screen_image
+        image = capture_screen_image(bounds)
+        frame_captures += 1
+        if self.keeping():
+            self.images[bounds] = image
+        return image
+
+    def invalidate(self):
+        """Drop the captures, e.g. after a key press moved the cursor"""
+        self.images = {}
+        self.results = {}
+        self.arrays = {}
+        self.score_maps = {}
+
+# Shared capture (one per thread)
+shared_frame = SharedFrame()
+
+def invalidate_shared_frame():
+    shared_frame.invalidate()
+
+def offset_matches(matches, bounds: tuple, image) -> list:
+    """Map matches found in a window capture back to screen coordinates"""
+    from talon.types import Rect
+    left_x, top_y, right_x, _ = bounds
+    # Retina captures hold more pixels than the window has points
+    scale = getattr(image, "width", right_x - left_x) / max(1, right_x - left_x)
+    return [
+        Rect(left_x + match.x / scale, top_y + match.y / scale, match.width / scale, match.height / scale)
+        for match in matches
+    ]
+
+def images_locatable() -> bool:
+    """True when templates can be matched against an already captured image"""
+    import talon.experimental.locate as locate
+    return image_templates_supported and hasattr(locate, "locate_in_image")
+
+def locate_in_capture(image, path: str, threshold: float, search_window: tuple = None) -> list:
+    """Locate a cached template in a captured image of search_window (or the full screen)
+
+    Touches no shared state besides the template cache, so sweep workers can call it
+    with a capture taken on the calling thread.
+    """
+    import talon.experimental.locate as locate
+    matches = locate.locate_in_image(image, template_cache.image(path), threshold=threshold)
+    if search_window:
+        matches = offset_matches(matches, search_window, image)
+    return matches
+
+def locate_template(path: str, threshold: float, search_window: tuple = None):
+    """Locate a cached template in the lookup's shared capture (one capture for all templates)
+
+    With search_window (left_x, top_y, right_x, bottom_y) only that part of the
+    screen is captured and correlated; matches are returned in screen coordinates.
+    """
+    global image_templates_supported
+    import talon.experimental.locate as locate
+    from ..utils.screen_capture import rect_from_bounds
+    if image_templates_supported:
+        try:
+            if hasattr(locate, "locate_in_image"):
+                # Later lookups in the same tick (e.g. text disambiguation, then the step) reuse the result
+                key = (search_window, path, threshold)
+                if key in shared_frame.results:
+                    return shared_frame.results[key]
+                matches = locate_in_capture(shared_frame.get(search_window), path, threshold, search_window)
+                if shared_frame.keeping():
+                    shared_frame.results[key] = matches
+                return matches
+            template = template_cache.image(path)
+            if search_window:
+                return locate.locate(template, rect=rect_from_bounds(search_window), threshold=threshold)
+            return locate.locate(template, threshold=threshold)
+        except TypeError:
+            image_templates_supported = False
+            print("Template cache: locate only accepts file paths, passing paths")
+    if search_window:
+        return locate.locate(path, rect=rect_from_bounds(search_window), threshold=threshold)
+    return locate.locate(path, threshold=threshold)
+
+def preload_cursor_templates(cursor_directory: str):
+    """Decode the cursor and grid cursor templates for a game ahead of navigation"""
+    if not cursor_directory:
+        return
+    start = time.perf_counter()
+    count = sum(
+        template_cache.preload(cursor_template_directory(cursor_directory, grid))
+        for grid in (False, True)
+    )
+    print(f"Template cache: preloaded {count} cursor templates for '{cursor_directory}' in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+def on_cursor_directory_change(cursor_directory):
+    preload_cursor_templates(cursor_directory)
+
+def on_ready():
+    preload_cursor_templates(settings.get("user.cursor_directory"))
+    settings.register("user.cursor_directory", on_cursor_directory_change)
+
+app.register("ready", on_ready)
+
+@mod.action_class
+class TemplateCacheActions:
+    def debug_template_cache() -> None:
+        """Print template cache contents and counters"""
+        print("=== DEBUG: TEMPLATE CACHE ===")
+        print(f"Directories: {len(template_cache.listings)}, images: {len(template_cache.images)}, arrays: {len(template_cache.arrays)}")
+        print(f"Hits: {template_cache.hits}, loads from disk: {template_cache.loads}")
+        print(f"Screen captures: {frame_captures}, reused: {frame_reuses}")
+        from ..utils.worker_pool import template_sweep_pool
+        print(f"Parallel sweeps: {template_sweep_pool.runs}, templates cancelled: {template_sweep_pool.cancelled}, last sweep: {template_sweep_pool.last_run_ms:.0f}ms")
+        for directory, entry in template_cache.listings.items():
+            print(f"  {directory}: {len(entry.value)} templates")
+        print("=== END DEBUG TEMPLATE CACHE ===")
+
+    def clear_template_cache() -> None:
+        """Drop all cached templates so they are read from disk again"""
+        template_cache.clear()
+        print("Template cache cleared")
@@ -6,77 +6,550 @@ Handles cursor detection using game-specific templates and flexible threshold ma
 
 from talon import Module, actions, settings
 import os
-from .text_detection import get_hud_log_exclusion_region
+from .text_detection import points_in_hud_region, parse_ocr_regions
+from .cursor_stats import cursor_stats, cursor_context
+from .template_cache import template_cache, cursor_template_directory, locate_template, images_to_click_location, shared_frame
+from ..utils.pathfinding_log import log
+from ..utils.worker_pool import template_sweep_pool, setting
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    print("NumPy not available - template matching uses locate only")
+    NUMPY_AVAILABLE = False
 
 mod = Module()
 
-# Path to images for template matching
-images_to_click_location = "/Users/jarrod/.talon/user/jarrod/gaming/images_to_click/"
-
-# Global variable for optimization
+# Template that matched most recently, for debug output (ordering comes from cursor_stats)
 last_successful_cursor_file = None
 
-@mod.action_class
-class TemplateMatchingActions:
-    def find_cursor_flexible(cursor_directory: str = None, thresholds: list = None, search_region: tuple = None) -> tuple:
-        """Find cursor using game-specific cursor directory with multiple cursor variations"""
-        global last_successful_cursor_file
-        
+# Screen window cursor lookups are limited to while find_cursor_in_window runs (None = full screen)
+cursor_search_window = None
+
+# Settings a cursor lookup reads, for worker jobs to read on the main thread
+CURSOR_LOOKUP_SETTINGS = (
+    "user.cursor_directory",
+    "user.highlight_image",
+    "user.disable_hud_log_exclusion",
+    "user.template_matcher",
+    "user.template_sweep_workers",
+    "user.ocr_active_regions",
+)
+
+def find_cursor_in_window(window: tuple, grid: bool = False):
+    """Run the cursor lookup against only (left_x, top_y, right_x, bottom_y) of the screen"""
+    global cursor_search_window
+    cursor_search_window = window
+    try:
+        # Grid navigation is synchronous, so only the grid lookup goes through the action
+        return actions.user.find_grid_cursor() if grid else locate_cursor()
+    finally:
+        cursor_search_window = None
+
+# Battle menu area used when the game defines no battle_menu in user.ocr_regions
+DEFAULT_MENU_REGION = (0, 600, 400, 900)
+
+# Correlation peaks below this are dropped from score maps; no threshold ladder goes lower
+SCORE_MAP_FLOOR = 0.6
+
+# At most this many peaks are kept per template and capture, best first
+SCORE_MAP_MAX_PEAKS = 32
+
+def fast_fft_size(n: int) -> int:
+    """Smallest size >= n with no prime factor above 5, which the FFT handles quickly"""
+    size = n
+    while True:
+        remainder = size
+        for factor in (2, 3, 5):
+            while remainder % factor == 0:
+                remainder //= factor
+        if remainder == 1:
+            return size
+        size += 1
+
+class PreparedFrame:
+    """A greyscale frame plus the FFT and integral images every template correlation needs
+
+    Built once per capture and shared by all templates matched against it. Pixels
+    are float32 with the frame mean subtracted, which keeps the float32 FFTs
+    accurate; the integral images are float64 because they sum the whole frame.
+    freeze() computes everything up front so sweep workers only read it.
+    """
+
+    def __init__(self, pixels):
+        pixels = np.asarray(pixels, dtype=np.float32)
+        self.pixels = pixels - pixels.mean(dtype=np.float64).astype(np.float32)
+        self.shape = self.pixels.shape
+        # Zero padding to a fast size; correlation stays exact for the valid positions
+        self.fft_shape = tuple(fast_fft_size(size) for size in self.shape)
+        self.spectrum_cache = None
+        self.squared_spectrum_cache = None
+        self.integral_cache = None
+
+    def spectrum(self):
+        if self.spectrum_cache is None:
+            self.spectrum_cache = np.fft.rfft2(self.pixels, s=self.fft_shape)
+        return self.spectrum_cache
+
+    def squared_spectrum(self):
+        """Spectrum of the squared pixels, for masked window statistics"""
+        if self.squared_spectrum_cache is None:
+            self.squared_spectrum_cache = np.fft.rfft2(self.pixels * self.pixels, s=self.fft_shape)
+        return self.squared_spectrum_cache
+
+    def integrals(self) -> tuple:
+        """Integral images of the pixels and of their squares"""
+        if self.integral_cache is None:
+            height, width = self.shape
+            pixels = self.pixels.astype(np.float64)
+            integral = np.zeros((height + 1, width + 1))
+            integral[1:, 1:] = pixels.cumsum(axis=0).cumsum(axis=1)
+            squared_integral = np.zeros((height + 1, width + 1))
+            squared_integral[1:, 1:] = (pixels * pixels).cumsum(axis=0).cumsum(axis=1)
+            self.integral_cache = (integral, squared_integral)
+        return self.integral_cache
+
+    def window_sums(self, template_h: int, template_w: int) -> tuple:
+        """Sum and sum of squares of the pixels under every template position"""
+        out_h, out_w = self.shape[0] - template_h + 1, self.shape[1] - template_w + 1
+
+        def box(integral):
+            return (integral[template_h:, template_w:] - integral[:out_h, template_w:]
+                    - integral[template_h:, :out_w] + integral[:out_h, :out_w])
+
+        integral, squared_integral = self.integrals()
+        return box(integral), box(squared_integral)
+
+    def freeze(self, masked: bool = False):
+        """Compute the spectra and integral images now; returns self"""
+        self.spectrum()
+        self.integrals()
+        if masked:
+            self.squared_spectrum()
+        return self
+
+def ncc_score_map(frame, template, mask=None):
+    """Normalized cross-correlation of a greyscale template at every position of a greyscale frame
+
+    frame is a PreparedFrame (or a plain array, prepared on the spot). Returns a
+    (frame_h - template_h + 1, frame_w - template_w + 1) float32 array of scores in
+    [-1, 1]. Each template costs one FFT and one inverse FFT at the padded frame size; the
+    frame's own FFT and window statistics come from the PreparedFrame. With a mask
+    (template-shaped weights in [0, 1]) pixels are weighted by it, so transparent
+    pixels match any background.
+    """
+    if not isinstance(frame, PreparedFrame):
+        frame = PreparedFrame(frame)
+    frame_h, frame_w = frame.shape
+    template_h, template_w = template.shape
+    if template_h > frame_h or template_w > frame_w:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    template = template.astype(np.float64)
+    out_h, out_w = frame_h - template_h + 1, frame_w - template_w + 1
+    weights = np.ones(template.shape) if mask is None else mask.astype(np.float64)
+    count = weights.sum()
+    if count < 1:
+        return np.zeros((out_h, out_w), dtype=np.float32)
+    deviation = template - (weights * template).sum() / count
+    centered = weights * deviation
+    template_norm = np.sqrt((centered * deviation).sum())
+    if template_norm == 0:
+        return np.zeros((out_h, out_w), dtype=np.float32)
+
+    # Circular correlation at (at least) the frame size never wraps for the valid positions
+    def correlate(spectrum, kernel):
+        product = spectrum * np.conj(np.fft.rfft2(kernel.astype(np.float32), s=frame.fft_shape))
+        return np.fft.irfft2(product, s=frame.fft_shape)[:out_h, :out_w]
+
+    correlation = correlate(frame.spectrum(), centered)
+    if mask is None:
+        sums, squares = frame.window_sums(template_h, template_w)
+    else:
+        # Weighted window statistics need the mask correlated like the template
+        sums = correlate(frame.spectrum(), weights)
+        squares = correlate(frame.squared_spectrum(), weights)
+    variance = squares - sums * sums / count
+    # Flat windows (below a tenth of a grey level) have no pattern to correlate with
+    textured = variance > count * 0.01
+    denominator = np.sqrt(np.where(textured, variance, 1.0)) * template_norm
+    scores = np.where(textured, correlation / denominator, 0.0)
+    return np.clip(scores, -1.0, 1.0).astype(np.float32)
+
+def template_alpha_mask(array):
+    """Alpha channel of a template as weights in [0, 1], or None when it is fully opaque"""
+    if array.ndim != 3 or array.shape[2] != 4:
+        return None
+    alpha = array[:, :, 3]
+    if alpha.min() == 255:
+        return None
+    return alpha.astype(np.float32) / 255.0
+
+# Transparent templates with fewer opaque pixels than this are too weak to replace their opaque sibling
+MIN_MASKED_PIXELS = 64
+
+def masked_variant_files(cursor_files: list, base_path: str) -> list:
+    """cursor_files without opaque templates whose '_transparent' sibling is present
+
+    A masked transparent template matches the cursor on any background, so the
+    opaque copy is redundant under the NumPy matchers.
+    """
+    names = set(cursor_files)
+    kept = []
+    for name in cursor_files:
+        stem, extension = os.path.splitext(name)
+        transparent_name = stem + "_transparent" + extension
+        if transparent_name in names:
+            try:
+                mask = template_alpha_mask(template_cache.array(base_path + transparent_name))
+            except Exception as e:
+                log.debug("Could not read %s: %s", transparent_name, e)
+                mask = None
+            if mask is not None and mask.sum() >= MIN_MASKED_PIXELS:
+                log.trace("Skipping %s, masked %s covers it", name, transparent_name)
+                continue
+        kept.append(name)
+    return kept
+
+def score_map_peaks(scores, template_w: int, template_h: int, floor: float = SCORE_MAP_FLOOR,
+                    max_peaks: int = SCORE_MAP_MAX_PEAKS) -> list:
+    """(score, x, y) local maxima at or above floor, best first, at least a template apart"""
+    if scores.size == 0:
+        return []
+    # 3x3 local maxima, so a strong match contributes one candidate rather than a blob;
+    # only positions at or above the floor are compared with their neighbours
+    ys, xs = np.nonzero(scores >= floor)
+    padded = np.pad(scores, 1, mode="constant", constant_values=-1.0)
+    local_max = np.ones(len(ys), dtype=bool)
+    for dy in range(3):
+        for dx in range(3):
+            local_max &= scores[ys, xs] >= padded[ys + dy, xs + dx]
+    ys, xs = ys[local_max], xs[local_max]
+    order = np.argsort(-scores[ys, xs], kind="stable")
+
+    peaks = []
+    for index in order:
+        x, y = int(xs[index]), int(ys[index])
+        if any(abs(x - peak_x) < template_w and abs(y - peak_y) < template_h for _, peak_x, peak_y in peaks):
+            continue
+        peaks.append((float(scores[y, x]), x, y))
+        if len(peaks) >= max_peaks:
+            break
+    return peaks
+
+# Coarse-to-fine matching correlates at 1/PYRAMID_SCALE size first
+PYRAMID_SCALE = 4
+
+# Coarse peaks refined at full size, and how far below the floor a coarse peak may score
+PYRAMID_COARSE_PEAKS = 16
+PYRAMID_COARSE_MARGIN = 0.25
+
+# Templates smaller than this (in coarse pixels) lose too much detail to match coarsely
+PYRAMID_MIN_COARSE_SIZE = 6
+
+def block_mean(array, block: int):
+    """Average (block x block) pixel blocks of a greyscale array"""
+    height = array.shape[0] // block * block
+    width = array.shape[1] // block * block
+    return array[:height, :width].reshape(height // block, block, width // block, block).mean(axis=(1, 3))
+
+def pyramid_score_map_peaks(frame, template, floor: float = SCORE_MAP_FLOOR, mask=None, coarse_frame=None) -> list:
+    """score_map_peaks computed coarse-to-fine
+
+    Correlates at 1/PYRAMID_SCALE size, then rescans only a few pixels around the
+    best coarse peaks at full size. Returned scores are full-size scores, so the
+    same thresholds apply. Small templates are matched at full size. frame is a
+    PreparedFrame; coarse_frame, its prepared 1/PYRAMID_SCALE copy, is built when
+    not given.
+    """
+    if not isinstance(frame, PreparedFrame):
+        frame = PreparedFrame(frame)
+    template_h, template_w = template.shape
+    if min(template_h, template_w) < PYRAMID_SCALE * PYRAMID_MIN_COARSE_SIZE:
+        return score_map_peaks(ncc_score_map(frame, template, mask), template_w, template_h, floor)
+
+    if coarse_frame is None:
+        coarse_frame = PreparedFrame(block_mean(frame.pixels, PYRAMID_SCALE))
+    coarse_template = block_mean(template, PYRAMID_SCALE)
+    coarse_mask = None if mask is None else block_mean(mask, PYRAMID_SCALE)
+    coarse_scores = ncc_score_map(coarse_frame, coarse_template, coarse_mask)
+    coarse_peaks = score_map_peaks(
+        coarse_scores, coarse_template.shape[1], coarse_template.shape[0],
+        floor - PYRAMID_COARSE_MARGIN, PYRAMID_COARSE_PEAKS
+    )
+
+    frame_h, frame_w = frame.shape
+    margin = PYRAMID_SCALE * 2
+    refined = []
+    for _, coarse_x, coarse_y in coarse_peaks:
+        left_x = max(0, coarse_x * PYRAMID_SCALE - margin)
+        top_y = max(0, coarse_y * PYRAMID_SCALE - margin)
+        right_x = min(frame_w, coarse_x * PYRAMID_SCALE + template_w + margin)
+        bottom_y = min(frame_h, coarse_y * PYRAMID_SCALE + template_h + margin)
+        local_scores = ncc_score_map(frame.pixels[top_y:bottom_y, left_x:right_x], template, mask)
+        if local_scores.size == 0:
+            continue
+        local_y, local_x = np.unravel_index(np.argmax(local_scores), local_scores.shape)
+        score = float(local_scores[local_y, local_x])
+        if score >= floor:
+            refined.append((score, left_x + int(local_x), top_y + int(local_y)))
+
+    # Neighbouring coarse peaks can refine to the same match
+    refined.sort(key=lambda peak: -peak[0])
+    peaks = []
+    for score, x, y in refined:
+        if not any(abs(x - peak_x) < template_w and abs(y - peak_y) < template_h for _, peak_x, peak_y in peaks):
+            peaks.append((score, x, y))
+    return peaks
+
+class ScoreMap:
+    """Correlation peaks of one template in one capture; every threshold is answered from them"""
+
+    def __init__(self, peaks: list, bounds: tuple, scale: float, template_w: int, template_h: int):
+        self.peaks = peaks
+        self.bounds = bounds
+        self.scale = scale
+        self.template_w = template_w
+        self.template_h = template_h
+
+    def peak_rect(self, x: int, y: int):
+        """Screen Rect of the template placed at capture pixel (x, y)"""
+        from talon.types import Rect
+        left_x, top_y = self.bounds[0], self.bounds[1]
+        return Rect(left_x + x / self.scale, top_y + y / self.scale,
+                    self.template_w / self.scale, self.template_h / self.scale)
+
+    def matches(self, threshold: float) -> list:
+        """Rects of the peaks clearing threshold, best first (like locate at that threshold)"""
+        return [self.peak_rect(x, y) for score, x, y in self.peaks if score >= threshold]
+
+    def thresholds_cleared(self, thresholds: list) -> list:
+        """(rect, score, thresholds that peak clears) for every peak"""
+        return [
+            (self.peak_rect(x, y), score, [threshold for threshold in thresholds if score >= threshold])
+            for score, x, y in self.peaks
+        ]
+
+def prepared_frames(search_window: tuple = None) -> tuple:
+    """(frame, coarse frame or None) for the lookup's capture of search_window, prepared once per lookup"""
+    key = (search_window, "prepared")
+    if key in shared_frame.arrays:
+        return shared_frame.arrays[key]
+    from ..utils.screen_capture import image_to_array, to_gray
+    frame = PreparedFrame(to_gray(image_to_array(shared_frame.get(search_window))))
+    coarse_frame = None
+    if setting("user.template_matcher") == "pyramid":
+        coarse_frame = PreparedFrame(block_mean(frame.pixels, PYRAMID_SCALE))
+    if shared_frame.keeping():
+        shared_frame.arrays[key] = (frame, coarse_frame)
+    return frame, coarse_frame
+
+def compute_score_map(frame, coarse_frame, path: str, bounds: tuple) -> ScoreMap:
+    """Score map of a cached template in prepared frames of bounds; reads no shared state but the template cache"""
+    from ..utils.screen_capture import to_gray
+    template_array = template_cache.array(path)
+    template = to_gray(template_array)
+    mask = template_alpha_mask(template_array)
+    # Retina captures hold more pixels than the screen has points
+    scale = frame.shape[1] / max(1, bounds[2] - bounds[0])
+    template_h, template_w = template.shape
+    if coarse_frame is not None:
+        peaks = pyramid_score_map_peaks(frame, template, mask=mask, coarse_frame=coarse_frame)
+    else:
+        peaks = score_map_peaks(ncc_score_map(frame, template, mask), template_w, template_h)
+    log.trace("Score map for %s: %d peaks %s", path, len(peaks), [round(score, 3) for score, _, _ in peaks[:5]])
+    return ScoreMap(peaks, bounds, scale, template_w, template_h)
+
+def template_score_map(path: str, search_window: tuple = None) -> ScoreMap:
+    """Score map of a cached template in the lookup's shared capture, computed once per lookup"""
+    from ..utils.screen_capture import main_screen_bounds
+    key = (search_window, path)
+    if key in shared_frame.score_maps:
+        return shared_frame.score_maps[key]
+    frame, coarse_frame = prepared_frames(search_window)
+    score_map = compute_score_map(frame, coarse_frame, path, search_window or main_screen_bounds())
+    if shared_frame.keeping():
+        shared_frame.score_maps[key] = score_map
+    return score_map
+
+def numpy_matcher_enabled() -> bool:
+    return NUMPY_AVAILABLE and setting("user.template_matcher") in ("numpy", "pyramid")
+
+def match_template(path: str, threshold: float, search_window: tuple = None) -> list:
+    """Template matches at threshold, from a NumPy score map or Talon's locate per user.template_matcher"""
+    if numpy_matcher_enabled():
+        return template_score_map(path, search_window).matches(threshold)
+    return locate_template(path, threshold, search_window)
+
+# Points captured beyond a search_region, so templates centred near its edge are captured whole
+SEARCH_REGION_MARGIN = 150
+
+def lookup_window(search_region: tuple = None):
+    """Screen area a lookup captures: the tracking window, else search_region plus a margin, else None (full screen)"""
+    if cursor_search_window or not search_region:
+        return cursor_search_window
+    from ..utils.screen_capture import main_screen_bounds
+    screen_left, screen_top, screen_right, screen_bottom = main_screen_bounds()
+    left_x, top_y, right_x, bottom_y = search_region
+    return (
+        max(screen_left, int(left_x - SEARCH_REGION_MARGIN)),
+        max(screen_top, int(top_y - SEARCH_REGION_MARGIN)),
+        min(screen_right, int(right_x + SEARCH_REGION_MARGIN)),
+        min(screen_bottom, int(bottom_y + SEARCH_REGION_MARGIN)),
+    )
+
+def sweep_templates(cursors_base_path: str, cursor_files: list, thresholds: list, search_window: tuple, workers: int):
+    """Match cursor_files on the sweep pool; returns the first file that matched, or None
+
+    The capture is taken (and for the NumPy matchers prepared) on this thread and
+    handed to the workers frozen; workers only read it and the template cache.
+    Results of every template that finished are cached on this thread's shared frame.
+    """
+    from ..utils.screen_capture import main_screen_bounds
+    from .template_cache import images_locatable, locate_in_capture
+    paths = {cursor_file: cursors_base_path + cursor_file for cursor_file in cursor_files}
+
+    if numpy_matcher_enabled():
+        bounds = search_window or main_screen_bounds()
+        frame, coarse_frame = prepared_frames(search_window)
+        frame.freeze(masked=True)
+        if coarse_frame is not None:
+            coarse_frame.freeze(masked=True)
+        for path in paths.values():
+            template_cache.array(path)
+
+        def match_one(cursor_file, stop):
+            return compute_score_map(frame, coarse_frame, paths[cursor_file], bounds)
+
+        def accept(score_map):
+            return bool(score_map.matches(min(thresholds)))
+
+        def keep(cursor_file, score_map):
+            shared_frame.score_maps[(search_window, paths[cursor_file])] = score_map
+    elif images_locatable():
+        image = shared_frame.get(search_window)
+        for path in paths.values():
+            template_cache.image(path)
+
+        def match_one(cursor_file, stop):
+            results = {}
+            for threshold in thresholds:
+                if stop.is_set():
+                    break
+                results[threshold] = locate_in_capture(image, paths[cursor_file], threshold, search_window)
+                if results[threshold]:
+                    break
+            return results
+
+        def accept(results):
+            return any(results.values())
+
+        def keep(cursor_file, results):
+            for threshold, matches in results.items():
+                shared_frame.results[(search_window, paths[cursor_file], threshold)] = matches
+    else:
+        # locate.locate captures the screen itself, so there is no frame to share
+        def match_one(cursor_file, stop):
+            return any(
+                locate_template(paths[cursor_file], threshold, search_window)
+                for threshold in thresholds if not stop.is_set()
+            )
+
+        def accept(matched):
+            return matched
+
+        def keep(cursor_file, matched):
+            pass
+
+    matched_file, _, completed = template_sweep_pool.first_result(cursor_files, match_one, workers, accept)
+    if shared_frame.keeping():
+        for cursor_file, result in completed.items():
+            keep(cursor_file, result)
+    log.debug("Parallel sweep of %d templates: first match %s after %.0fms",
+              len(cursor_files), matched_file, template_sweep_pool.last_run_ms)
+    return matched_file
+
+def cursor_sweep_order(cursors_base_path: str, cursor_files: list, thresholds: list, search_window: tuple = None):
+    """Yield cursor_files in order; once the first one is passed over, match the rest in parallel
+
+    With user.template_sweep_workers above 1 the remaining templates are matched
+    on the sweep pool against the lookup's capture. The first to match is yielded
+    next and the others are cancelled; the results already computed stay cached on
+    the shared frame for the caller's own checks.
+    """
+    if not cursor_files:
+        return
+    yield cursor_files[0]
+
+    remaining = cursor_files[1:]
+    workers = setting("user.template_sweep_workers")
+    if workers > 1 and len(remaining) > 1:
+        matched_file = sweep_templates(cursors_base_path, remaining, thresholds, search_window, min(workers, len(remaining)))
+        if matched_file:
+            remaining = [matched_file] + [name for name in remaining if name != matched_file]
+    yield from remaining
+
+def record_cursor_hit(cursor_directory: str, stats_context: str, tried_files: list):
+    """Count a lookup that matched the last of tried_files"""
+    global last_successful_cursor_file
+    last_successful_cursor_file = tried_files[-1]
+    cursor_stats.record(cursor_directory, stats_context, tried_files, tried_files[-1])
+
+def locate_cursor(cursor_directory: str = None, thresholds: list = None, search_region: tuple = None) -> tuple:
+    """Find cursor using game-specific cursor directory with multiple cursor variations
+
+    Runs on navigation workers given the main-thread values they install (see utils/worker_pool.py).
+    """
+    # One capture (per search window) serves every template and threshold of this lookup
+    with shared_frame.lookup():
+        search_window = lookup_window(search_region)
         if thresholds is None:
             thresholds = [0.95, 0.9]
-            
+        
         # Determine cursor directory and path
         if not cursor_directory:
-            cursor_directory = settings.get("user.cursor_directory")
-            
+            cursor_directory = setting("user.cursor_directory")
+        
         if cursor_directory:
             # Use game-specific cursor directory
-            cursors_base_path = f"/Users/jarrod/.talon/user/jarrod/gaming/cursors/{cursor_directory}/"
-            
-            if not os.path.exists(cursors_base_path):
-                print(f"ERROR: Cursor directory not found: {cursors_base_path}")
+            cursors_base_path = cursor_template_directory(cursor_directory)
+        
+            # Image files in the cursor directory (listing cached until the directory changes)
+            cursor_files = template_cache.list_templates(cursors_base_path)
+            if cursor_files is None:
+                log.error("Cursor directory not found: %s", cursors_base_path)
                 return None
                 
-            # Get all image files in the cursor directory
-            cursor_files = []
-            for file in os.listdir(cursors_base_path):
-                if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    cursor_files.append(file)
-                    
             if not cursor_files:
-                print(f"ERROR: No cursor images found in {cursors_base_path}")
+                log.error("No cursor images found in %s", cursors_base_path)
                 return None
-                
-            print(f"Trying {len(cursor_files)} cursor variations from {cursor_directory}/")
-            
-            # Optimization: Try last successful cursor first if it exists
-            cursor_files_to_try = []
-            
-            if last_successful_cursor_file and last_successful_cursor_file in cursor_files:
-                # Try last successful cursor first
-                cursor_files_to_try.append(last_successful_cursor_file)
-                print(f"OPTIMIZATION: Trying last successful cursor first: {last_successful_cursor_file}")
-                
-                # Add remaining cursor files (excluding the last successful one)
-                remaining_files = [f for f in cursor_files if f != last_successful_cursor_file]
-                cursor_files_to_try.extend(remaining_files)
-            else:
-                # No previous successful cursor or it's not in current directory
-                cursor_files_to_try = cursor_files
+
+            if numpy_matcher_enabled():
+                # Masked transparent templates make their opaque siblings redundant
+                cursor_files = masked_variant_files(cursor_files, cursors_base_path)
             
+            log.debug("Trying %d cursor variations from %s/", len(cursor_files), cursor_directory)
+        
+            # Try templates in expected-hit order for this game and context
+            stats_context = cursor_context(grid=False)
+            cursor_files_to_try = cursor_stats.ordered(cursor_directory, stats_context, cursor_files)
+            log.trace("Cursor order: %s", cursor_files_to_try)
+            tried_files = []
+
             # Try cursor files in optimized order
-            for cursor_file in cursor_files_to_try:
+            for cursor_file in cursor_sweep_order(cursors_base_path, cursor_files_to_try, thresholds, search_window):
                 cursor_path = cursors_base_path + cursor_file
-                print(f"Trying cursor: {cursor_file}")
-                
+                log.trace("Trying cursor: %s", cursor_file)
+                tried_files.append(cursor_file)
+            
                 # Try each threshold for this cursor
                 for threshold in thresholds:
                     try:
-                        print(f"  Trying threshold {threshold}")
-                        
-                        import talon.experimental.locate as locate
-                        matches = locate.locate(cursor_path, threshold=threshold)
-                        
+                        log.trace("  Trying threshold %s", threshold)
+                    
+                        matches = match_template(cursor_path, threshold, search_window)
+                    
                         if matches:
                             if len(matches) == 1:
                                 # Single match - best case
@@ -86,256 +559,255 @@ class TemplateMatchingActions:
                                 center_y = match.y + 2 * match.height // 3
 
                                 # Exclude cursors in HUD log region
-                                if not settings.get("user.disable_hud_log_exclusion"):
-                                    hud_region = get_hud_log_exclusion_region()
-                                    if (hud_region['x'] <= center_x <= hud_region['x'] + hud_region['width'] and
-                                        hud_region['y'] <= center_y <= hud_region['y'] + hud_region['height']):
-                                        print(f"  SKIPPED: Cursor at {(center_x, center_y)} is inside HUD log region, ignoring")
+                                if not setting("user.disable_hud_log_exclusion"):
+                                    if points_in_hud_region([(center_x, center_y)])[0]:
+                                        log.debug("  SKIPPED: Cursor at %s is inside HUD log region, ignoring", (center_x, center_y))
                                         continue  # Try next cursor file
 
                                 if search_region:
                                     left_x, top_y, right_x, bottom_y = search_region
                                     if left_x <= center_x <= right_x and top_y <= center_y <= bottom_y:
                                         result = (center_x, center_y)
-                                        print(f"SUCCESS: Found single cursor using {cursor_file} at {result}")
-                                        last_successful_cursor_file = cursor_file  # Update tracking
+                                        log.debug("SUCCESS: Found single cursor using %s at %s", cursor_file, result)
+                                        record_cursor_hit(cursor_directory, stats_context, tried_files)
                                         return result
                                 else:
                                     result = (center_x, center_y)
-                                    print(f"SUCCESS: Found single cursor using {cursor_file} at {result}")
-                                    last_successful_cursor_file = cursor_file  # Update tracking
+                                    log.debug("SUCCESS: Found single cursor using %s at %s", cursor_file, result)
+                                    record_cursor_hit(cursor_directory, stats_context, tried_files)
                                     return result
                             else:
                                 # Multiple matches - take first one and warn
-                                print(f"  WARNING: Multiple matches ({len(matches)}) for {cursor_file}, filtering HUD region")
+                                log.debug("  WARNING: Multiple matches (%d) for %s, filtering HUD region", len(matches), cursor_file)
 
                                 # Filter out matches in HUD region
-                                if settings.get("user.disable_hud_log_exclusion"):
-                                    valid_matches = []
-                                    for match in matches:
-                                        center_x = match.x + match.width // 2
-                                        center_y = match.y + 2 * match.height // 3
-                                        valid_matches.append((match, center_x, center_y))
+                                centers = [(match.x + match.width // 2, match.y + 2 * match.height // 3) for match in matches]
+                                if setting("user.disable_hud_log_exclusion"):
+                                    inside_flags = [False] * len(matches)
                                 else:
-                                    hud_region = get_hud_log_exclusion_region()
-                                    valid_matches = []
-                                    for match in matches:
-                                        center_x = match.x + match.width // 2
-                                        center_y = match.y + 2 * match.height // 3
-
-                                        if not (hud_region['x'] <= center_x <= hud_region['x'] + hud_region['width'] and
-                                                hud_region['y'] <= center_y <= hud_region['y'] + hud_region['height']):
-                                            valid_matches.append((match, center_x, center_y))
-                                        else:
-                                            print(f"    Filtered cursor at {(center_x, center_y)} (in HUD region)")
+                                    inside_flags = points_in_hud_region(centers)
+                                valid_matches = []
+                                for match, (center_x, center_y), inside in zip(matches, centers, inside_flags):
+                                    if inside:
+                                        log.trace("    Filtered cursor at %s (in HUD region)", (center_x, center_y))
+                                    else:
+                                        valid_matches.append((match, center_x, center_y))
 
                                 if not valid_matches:
-                                    print(f"  All {len(matches)} matches were in HUD region, trying next cursor")
+                                    log.trace("  All %d matches were in HUD region, trying next cursor", len(matches))
                                     continue
 
                                 # Use first valid match
                                 match, center_x, center_y = valid_matches[0]
-                                print(f"  Using first valid match (out of {len(valid_matches)})")
+                                log.trace("  Using first valid match (out of %d)", len(valid_matches))
 
                                 if search_region:
                                     left_x, top_y, right_x, bottom_y = search_region
                                     if left_x <= center_x <= right_x and top_y <= center_y <= bottom_y:
                                         result = (center_x, center_y)
-                                        print(f"SUCCESS: Found cursor using {cursor_file} at {result} (first of {len(valid_matches)} valid)")
-                                        last_successful_cursor_file = cursor_file  # Update tracking
+                                        log.debug("SUCCESS: Found cursor using %s at %s (first of %d valid)", cursor_file, result, len(valid_matches))
+                                        record_cursor_hit(cursor_directory, stats_context, tried_files)
                                         return result
                                 else:
                                     result = (center_x, center_y)
-                                    print(f"SUCCESS: Found cursor using {cursor_file} at {result} (first of {len(valid_matches)} valid)")
-                                    last_successful_cursor_file = cursor_file  # Update tracking
+                                    log.debug("SUCCESS: Found cursor using %s at %s (first of %d valid)", cursor_file, result, len(valid_matches))
+                                    record_cursor_hit(cursor_directory, stats_context, tried_files)
                                     return result
-                                
+                            
                     except Exception as e:
-                        print(f"  Error with {cursor_file} at threshold {threshold}: {e}")
+                        log.debug("  Error with %s at threshold %s: %s", cursor_file, threshold, e)
                         continue
-                    
-            print(f"No cursor found using any variation in {cursor_directory}/")
+                
+            log.debug("No cursor found using any variation in %s/", cursor_directory)
+            if cursor_search_window is None:
+                # A miss inside a tracking window says where the cursor is not, not which template fits
+                cursor_stats.record(cursor_directory, stats_context, tried_files)
             return None
         else:
             # Fallback to original highlight_image setting
-            highlight_image = settings.get("user.highlight_image")
+            highlight_image = setting("user.highlight_image")
             if highlight_image:
-                print(f"No cursor directory set, using highlight_image: {highlight_image}")
-                return actions.user.find_template_flexible(highlight_image, thresholds, search_region)
+                log.debug("No cursor directory set, using highlight_image: %s", highlight_image)
+                return locate_template_flexible(highlight_image, thresholds, search_region)
             else:
-                print("ERROR: No cursor directory or highlight_image configured")
+                log.error("No cursor directory or highlight_image configured")
                 return None
 
-    def find_grid_cursor(cursor_directory: str = None, thresholds: list = None, search_region: tuple = None) -> tuple:
-        """Find grid cursor using game-specific grid_cursors directory (for grid navigation)"""
-        global last_successful_cursor_file
-
-        if thresholds is None:
-            thresholds = [0.95, 0.9]
-
-        # Determine cursor directory and path
-        if not cursor_directory:
-            cursor_directory = settings.get("user.cursor_directory")
-
-        if cursor_directory:
-            # Use game-specific GRID cursor directory
-            cursors_base_path = f"/Users/jarrod/.talon/user/jarrod/gaming/grid_cursors/{cursor_directory}/"
-
-            if not os.path.exists(cursors_base_path):
-                print(f"ERROR: Grid cursor directory not found: {cursors_base_path}")
-                return None
-
-            # Get all image files in the grid cursor directory
-            cursor_files = []
-            for file in os.listdir(cursors_base_path):
-                if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    cursor_files.append(file)
-
-            if not cursor_files:
-                print(f"ERROR: No grid cursor images found in {cursors_base_path}")
-                return None
-
-            print(f"Trying {len(cursor_files)} grid cursor variations from {cursor_directory}/")
-
-            # Optimization: Try last successful cursor first if it exists
-            cursor_files_to_try = []
-
-            if last_successful_cursor_file and last_successful_cursor_file in cursor_files:
-                # Try last successful cursor first
-                cursor_files_to_try.append(last_successful_cursor_file)
-                print(f"OPTIMIZATION: Trying last successful grid cursor first: {last_successful_cursor_file}")
-
-                # Add remaining cursor files (excluding the last successful one)
-                remaining_files = [f for f in cursor_files if f != last_successful_cursor_file]
-                cursor_files_to_try.extend(remaining_files)
-            else:
-                # No previous successful cursor or it's not in current directory
-                cursor_files_to_try = cursor_files
-
-            # Try cursor files in optimized order
-            for cursor_file in cursor_files_to_try:
-                cursor_path = cursors_base_path + cursor_file
-                print(f"Trying grid cursor: {cursor_file}")
-
-                # Try each threshold for this cursor
-                for threshold in thresholds:
-                    try:
-                        print(f"  Trying threshold {threshold}")
-
-                        import talon.experimental.locate as locate
-                        matches = locate.locate(cursor_path, threshold=threshold)
-
-                        if matches:
-                            if len(matches) == 1:
-                                # Single match - best case
-                                match = matches[0]
-                                center_x = match.x + match.width // 2
-                                # Use bottom of middle third to prevent false proximity when cursor overlaps target
-                                center_y = match.y + 2 * match.height // 3
-
-                                if search_region:
-                                    left_x, top_y, right_x, bottom_y = search_region
-                                    if left_x <= center_x <= right_x and top_y <= center_y <= bottom_y:
-                                        result = (center_x, center_y)
-                                        print(f"SUCCESS: Found single grid cursor using {cursor_file} at {result}")
-                                        last_successful_cursor_file = cursor_file  # Update tracking
-                                        return result
-                                else:
-                                    result = (center_x, center_y)
-                                    print(f"SUCCESS: Found single grid cursor using {cursor_file} at {result}")
-                                    last_successful_cursor_file = cursor_file  # Update tracking
-                                    return result
-                            else:
-                                # Multiple matches - take first one and warn
-                                print(f"  WARNING: Multiple matches ({len(matches)}) for {cursor_file}, using first")
-                                match = matches[0]
-                                center_x = match.x + match.width // 2
-                                # Use bottom of middle third to prevent false proximity when cursor overlaps target
-                                center_y = match.y + 2 * match.height // 3
-
-                                if search_region:
-                                    left_x, top_y, right_x, bottom_y = search_region
-                                    if left_x <= center_x <= right_x and top_y <= center_y <= bottom_y:
-                                        result = (center_x, center_y)
-                                        print(f"SUCCESS: Found grid cursor using {cursor_file} at {result} (first of {len(matches)})")
-                                        last_successful_cursor_file = cursor_file  # Update tracking
-                                        return result
-                                else:
-                                    result = (center_x, center_y)
-                                    print(f"SUCCESS: Found grid cursor using {cursor_file} at {result} (first of {len(matches)})")
-                                    last_successful_cursor_file = cursor_file  # Update tracking
-                                    return result
-
-                    except Exception as e:
-                        print(f"  Error with {cursor_file} at threshold {threshold}: {e}")
-                        continue
-
-            print(f"No grid cursor found using any variation in {cursor_directory}/")
-            return None
-        else:
-            print("ERROR: No cursor directory configured for grid cursor detection")
-            return None
-
-    def find_template_flexible(image_name: str, thresholds: list = None, search_region: tuple = None) -> tuple:
-        """Find template using flexible matching with multiple thresholds and optional region limiting"""
+def locate_template_flexible(image_name: str, thresholds: list = None, search_region: tuple = None) -> tuple:
+    """Find template using flexible matching with multiple thresholds and optional region limiting"""
+    # One capture (per search window) serves every template and threshold of this lookup
+    with shared_frame.lookup():
+        search_window = lookup_window(search_region)
         if thresholds is None:
             thresholds = [0.9]  # Use high threshold for cursor variations
-            
-        image_path = f"{images_to_click_location}{image_name}"
         
+        image_path = f"{images_to_click_location}{image_name}"
+    
         for threshold in thresholds:
             try:
-                print(f"Trying template match with threshold {threshold}")
-                
-                # Use Talon's locate function directly with custom threshold
-                import talon.experimental.locate as locate
+                log.trace("Trying template match with threshold %s", threshold)
+            
+                # Match the cached template at this threshold (score map or Talon's locate)
+                matches = match_template(image_path, threshold, search_window)
                 
-                matches = locate.locate(image_path, threshold=threshold)
-                    
                 if matches:
                     # Multi-cursor detection warning
                     if len(matches) > 1:
-                        print(f"WARNING: Multiple cursor matches detected ({len(matches)} matches) at threshold {threshold}")
-                        print(f"This may indicate template matching issues that need investigation!")
+                        log.debug("WARNING: Multiple cursor matches detected (%d matches) at threshold %s", len(matches), threshold)
+                        log.trace("This may indicate template matching issues that need investigation!")
                         for i, match in enumerate(matches):
                             center_x = match.x + match.width // 2
                             # Use bottom of middle third to prevent false proximity when cursor overlaps target
                             center_y = match.y + 2 * match.height // 3
-                            print(f"  Cursor match {i+1}: ({center_x}, {center_y})")
-                    
+                            log.trace("  Cursor match %d: (%s, %s)", i + 1, center_x, center_y)
+                
                     # Filter matches by region if specified (left_x, top_y, right_x, bottom_y)
                     valid_matches = []
                     for match in matches:
                         center_x = match.x + match.width // 2
                         # Use bottom of middle third to prevent false proximity when cursor overlaps target
                         center_y = match.y + 2 * match.height // 3
-                        
+                    
                         if search_region:
                             left_x, top_y, right_x, bottom_y = search_region
                             if left_x <= center_x <= right_x and top_y <= center_y <= bottom_y:
                                 valid_matches.append((center_x, center_y))
-                                print(f"Found template at ({center_x}, {center_y}) with threshold {threshold} (within region)")
+                                log.trace("Found template at (%s, %s) with threshold %s (within region)", center_x, center_y, threshold)
                             else:
-                                print(f"Rejected template at ({center_x}, {center_y}) - outside region {search_region}")
+                                log.trace("Rejected template at (%s, %s) - outside region %s", center_x, center_y, search_region)
                         else:
                             valid_matches.append((center_x, center_y))
-                            print(f"Found template at ({center_x}, {center_y}) with threshold {threshold}")
-                    
+                            log.trace("Found template at (%s, %s) with threshold %s", center_x, center_y, threshold)
+                
                     if valid_matches:
                         if len(valid_matches) > 1:
-                            print(f"WARNING: Multiple valid cursor matches ({len(valid_matches)}) after region filtering!")
-                            print(f"Selecting first match: {valid_matches[0]}")
+                            log.debug("WARNING: Multiple valid cursor matches (%d) after region filtering!", len(valid_matches))
+                            log.trace("Selecting first match: %s", valid_matches[0])
                         return valid_matches[0]  # Return first valid match
-                        
+                    
             except Exception as e:
-                print(f"Error with threshold {threshold}: {str(e)}")
+                log.warn("Error with threshold %s: %s", threshold, str(e))
                 continue
-        
-        print(f"Could not find template '{image_name}' with any threshold{' in specified region' if search_region else ''}")
+    
+        log.debug("Could not find template '%s' with any threshold%s", image_name, ' in specified region' if search_region else '')
         return None
 
+@mod.action_class
+class TemplateMatchingActions:
+    def find_cursor_flexible(cursor_directory: str = None, thresholds: list = None, search_region: tuple = None) -> tuple:
+        """Find cursor using game-specific cursor directory with multiple cursor variations"""
+        return locate_cursor(cursor_directory, thresholds, search_region)
+
+    def find_grid_cursor(cursor_directory: str = None, thresholds: list = None, search_region: tuple = None) -> tuple:
+        """Find grid cursor using game-specific grid_cursors directory (for grid navigation)"""
+        # One capture (per search window) serves every template and threshold of this lookup
+        with shared_frame.lookup():
+            search_window = lookup_window(search_region)
+            if thresholds is None:
+                thresholds = [0.95, 0.9]
+
+            # Determine cursor directory and path
+            if not cursor_directory:
+                cursor_directory = settings.get("user.cursor_directory")
+
+            if cursor_directory:
+                # Use game-specific GRID cursor directory
+                cursors_base_path = cursor_template_directory(cursor_directory, grid=True)
+
+                # Image files in the grid cursor directory (listing cached until the directory changes)
+                cursor_files = template_cache.list_templates(cursors_base_path)
+                if cursor_files is None:
+                    log.error("Grid cursor directory not found: %s", cursors_base_path)
+                    return None
+
+                if not cursor_files:
+                    log.error("No grid cursor images found in %s", cursors_base_path)
+                    return None
+
+                if numpy_matcher_enabled():
+                    # Masked transparent templates make their opaque siblings redundant
+                    cursor_files = masked_variant_files(cursor_files, cursors_base_path)
+
+                log.debug("Trying %d grid cursor variations from %s/", len(cursor_files), cursor_directory)
+
+                # Try templates in expected-hit order for this game and context
+                stats_context = cursor_context(grid=True)
+                cursor_files_to_try = cursor_stats.ordered(cursor_directory, stats_context, cursor_files)
+                log.trace("Cursor order: %s", cursor_files_to_try)
+                tried_files = []
+
+                # Try cursor files in optimized order
+                for cursor_file in cursor_sweep_order(cursors_base_path, cursor_files_to_try, thresholds, search_window):
+                    cursor_path = cursors_base_path + cursor_file
+                    log.trace("Trying grid cursor: %s", cursor_file)
+                    tried_files.append(cursor_file)
+
+                    # Try each threshold for this cursor
+                    for threshold in thresholds:
+                        try:
+                            log.trace("  Trying threshold %s", threshold)
+
+                            matches = match_template(cursor_path, threshold, search_window)
+
+                            if matches:
+                                if len(matches) == 1:
+                                    # Single match - best case
+                                    match = matches[0]
+                                    center_x = match.x + match.width // 2
+                                    # Use bottom of middle third to prevent false proximity when cursor overlaps target
+                                    center_y = match.y + 2 * match.height // 3
+
+                                    if search_region:
+                                        left_x, top_y, right_x, bottom_y = search_region
+                                        if left_x <= center_x <= right_x and top_y <= center_y <= bottom_y:
+                                            result = (center_x, center_y)
+                                            log.debug("SUCCESS: Found single grid cursor using %s at %s", cursor_file, result)
+                                            record_cursor_hit(cursor_directory, stats_context, tried_files)
+                                            return result
+                                    else:
+                                        result = (center_x, center_y)
+                                        log.debug("SUCCESS: Found single grid cursor using %s at %s", cursor_file, result)
+                                        record_cursor_hit(cursor_directory, stats_context, tried_files)
+                                        return result
+                                else:
+                                    # Multiple matches - take first one and warn
+                                    log.debug("  WARNING: Multiple matches (%d) for %s, using first", len(matches), cursor_file)
+                                    match = matches[0]
+                                    center_x = match.x + match.width // 2
+                                    # Use bottom of middle third to prevent false proximity when cursor overlaps target
+                                    center_y = match.y + 2 * match.height // 3
+
+                                    if search_region:
+                                        left_x, top_y, right_x, bottom_y = search_region
+                                        if left_x <= center_x <= right_x and top_y <= center_y <= bottom_y:
+                                            result = (center_x, center_y)
+                                            log.debug("SUCCESS: Found grid cursor using %s at %s (first of %d)", cursor_file, result, len(matches))
+                                            record_cursor_hit(cursor_directory, stats_context, tried_files)
+                                            return result
+                                    else:
+                                        result = (center_x, center_y)
+                                        log.debug("SUCCESS: Found grid cursor using %s at %s (first of %d)", cursor_file, result, len(matches))
+                                        record_cursor_hit(cursor_directory, stats_context, tried_files)
+                                        return result
+
+                        except Exception as e:
+                            log.debug("  Error with %s at threshold %s: %s", cursor_file, threshold, e)
+                            continue
+
+                log.debug("No grid cursor found using any variation in %s/", cursor_directory)
+                if cursor_search_window is None:
+                    # A miss inside a tracking window says where the cursor is not, not which template fits
+                    cursor_stats.record(cursor_directory, stats_context, tried_files)
+                return None
+            else:
+                log.error("No cursor directory configured for grid cursor detection")
+                return None
+
+    def find_template_flexible(image_name: str, thresholds: list = None, search_region: tuple = None) -> tuple:
+        """Find template using flexible matching with multiple thresholds and optional region limiting"""
+        return locate_template_flexible(image_name, thresholds, search_region)
+
     def find_template_flexible_menu_region(image_name: str) -> tuple:
-        """Find template in menu region (left side of screen) using flexible matching"""
-        # Menu region: left=0, top=600, right=400, bottom=900 (approximate battle menu area)
-        menu_region = (0, 600, 400, 900)
+        """Find template in the game's battle_menu OCR region (left side of screen by default) using flexible matching"""
+        menu_region = parse_ocr_regions(settings.get("user.ocr_regions")).get("battle_menu", DEFAULT_MENU_REGION)
         return actions.user.find_template_flexible(image_name, None, menu_region)
\ No newline at end of file
@@ -4,7 +4,19 @@ OCR text detection and coordinate finding for pathfinding system.
 Handles text coordinate detection, fuzzy matching, and homophone support.
 """
 
-from talon import Module, actions, settings
+from talon import Module, actions, settings, speech_system
+from .ocr_types import OcrContents, filter_lines_to_rects
+from .ocr_cache import capture_cache_frames, hash_ocr_frames, read_captured_lines, read_through_ocr_cache
+from .dirty_tiles import incremental_ocr, is_incremental_ocr_active
+from .spatial_index import build_word_index, closest_match
+from .token_index import get_token_index, seed_token_cutoff
+from .game_lexicon import get_game_lexicon, find_lexicon_matches
+from .phonetic_index import get_phonetic_index
+from ..utils.integrations import gaze_ocr, get_gaze_ocr_controller, get_hud_widget
+from ..utils.screen_capture import NUMPY_AVAILABLE
+from ..utils.pathfinding_log import log
+from ..utils.worker_pool import main_thread_value, setting
+import time
 
 # Import RapidFuzz for fuzzy text matching (same as talon-gaze-ocr)
 try:
@@ -22,6 +34,16 @@ except ImportError:
     print("Jaro-Winkler not available - phonetic matching disabled")
     JAROWINKLER_AVAILABLE = False
 
+# Import RapidFuzz matrix scoring and NumPy for batch fuzzy scoring over a whole screen
+try:
+    import numpy as np
+    from rapidfuzz import process
+    from rapidfuzz.distance import JaroWinkler
+    BATCH_SCORING_AVAILABLE = RAPIDFUZZ_AVAILABLE
+except ImportError:
+    print("RapidFuzz process/NumPy not available - batch fuzzy scoring disabled")
+    BATCH_SCORING_AVAILABLE = False
+
 mod = Module()
 
 # Essential fallback homophones (only when community system unavailable)
@@ -41,32 +63,206 @@ BASIC_HOMOPHONES = {
 # Global variable for text width tracking
 current_target_width = 0
 
+# Global variable holding the OCR snapshot shared across one voice command
+current_ocr_snapshot = None
+
+# Counts invalidations, so background reads started before a key press can be discarded
+ocr_snapshot_invalidations = 0
+
+# Region names chosen by the current command, overriding user.ocr_active_regions
+ocr_region_override = None
+
+# HUD event log exclusion region, keyed on the widget geometry it was computed from
+hud_region_cache = {'geometry': None, 'region': None}
+
+# Default is bottom-right: x=1430, y=720, width=450, height=200 (plus padding)
+DEFAULT_HUD_LOG_REGION = {'x': 1410, 'y': 700, 'width': 490, 'height': 240}
+
+# Settings a text lookup reads, for worker jobs to read on the main thread
+TEXT_LOOKUP_SETTINGS = (
+    "user.ocr_active_regions",
+    "user.ocr_regions",
+    "user.ocr_snapshot_ttl",
+    "user.phrase_adjacency_gap",
+    "user.disable_hud_log_exclusion",
+    "user.game_lexicon_enabled",
+    "user.menu_enable_fuzzy_matching",
+    "user.phonetic_shortlist_enabled",
+)
+
+class OcrSnapshot:
+    """One OCR pass over the screen, reused by every phase of a voice command"""
+
+    def __init__(self, contents, ttl_ms: int, regions: tuple = ()):
+        self.contents = contents
+        self.captured_at = time.monotonic()
+        self.ttl_ms = ttl_ms
+        self.regions = regions
+        self.invalidated = False
+        self._word_index = None
+
+    @property
+    def lines(self):
+        """OCR lines captured in this snapshot"""
+        return self.contents.result.lines
+
+    @property
+    def word_index(self):
+        """Spatial index over this snapshot's words, built on first use"""
+        if self._word_index is None:
+            self._word_index = build_word_index(self.lines)
+        return self._word_index
+
+    def age_ms(self) -> float:
+        """Milliseconds since this snapshot was captured"""
+        return (time.monotonic() - self.captured_at) * 1000
+
+    def confirm_unchanged(self):
+        """Restart the time-to-live after the screen was checked and found unchanged"""
+        self.captured_at = time.monotonic()
+
+    def is_fresh(self) -> bool:
+        """True while the snapshot has not been invalidated or outlived its time-to-live"""
+        return not self.invalidated and self.age_ms() <= self.ttl_ms
+
+def parse_ocr_regions(spec: str) -> dict:
+    """Parse 'name:left,top,right,bottom; name2:...' into {name: (left_x, top_y, right_x, bottom_y)}"""
+    regions = {}
+    for entry in (spec or "").split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            name, coords = entry.split(":", 1)
+            left_x, top_y, right_x, bottom_y = (int(value) for value in coords.split(","))
+            regions[name.strip()] = (left_x, top_y, right_x, bottom_y)
+        except ValueError:
+            print(f"WARNING: Ignoring malformed OCR region '{entry}' (expected name:left,top,right,bottom)")
+    return regions
+
+def get_active_ocr_regions() -> tuple:
+    """Return the ((name, rect), ...) regions OCR should be limited to; empty means full screen"""
+    names = ocr_region_override or setting("user.ocr_active_regions")
+    if not names:
+        return ()
+
+    defined_regions = parse_ocr_regions(setting("user.ocr_regions"))
+    active_regions = []
+    for name in names.split(","):
+        name = name.strip()
+        if name in defined_regions:
+            active_regions.append((name, defined_regions[name]))
+        elif name:
+            print(f"WARNING: OCR region '{name}' is not defined in user.ocr_regions, ignoring")
+    return tuple(active_regions)
+
+def set_ocr_region_override(region_names: str = None):
+    """Limit OCR to the named regions for the current command (None restores the setting)"""
+    global ocr_region_override
+    if region_names != ocr_region_override:
+        ocr_region_override = region_names
+        invalidate_ocr_snapshot("OCR region changed")
+        print(f"OCR region override: {region_names or 'none'}")
+
+def read_ocr_regions(gaze_ocr_controller, regions: tuple):
+    """OCR only the given regions, falling back to a full read filtered to the regions"""
+    rects = [rect for _, rect in regions]
+    ocr_reader = getattr(gaze_ocr_controller, "ocr_reader", None)
+
+    if ocr_reader is not None and hasattr(ocr_reader, "read_screen"):
+        lines = []
+        for name, rect in regions:
+            region_contents = ocr_reader.read_screen(rect)
+            lines.extend(region_contents.result.lines)
+        print(f"OCR read {len(regions)} region(s): {', '.join(name for name, _ in regions)}")
+    else:
+        # Reader not exposed - read everything, then match only inside the regions
+        gaze_ocr_controller.read_nearby()
+        lines = gaze_ocr_controller.latest_screen_contents().result.lines
+        print("OCR reader does not support region reads, filtering full-screen OCR to regions")
+
+    # Drop words outside the regions (reads may include margin text)
+    return OcrContents(filter_lines_to_rects(lines, rects))
+
+def read_ocr_lines(gaze_ocr_controller, regions: tuple):
+    """Run one OCR pass over the regions, or the full screen when there are none"""
+    if regions:
+        return read_ocr_regions(gaze_ocr_controller, regions).result.lines
+
+    # Trigger OCR scan without overlay
+    gaze_ocr_controller.read_nearby()
+
+    # Get the latest screen contents
+    return gaze_ocr_controller.latest_screen_contents().result.lines
+
+def install_ocr_snapshot(lines, regions: tuple) -> OcrSnapshot:
+    """Make freshly read OCR lines the snapshot shared by the next lookups"""
+    global current_ocr_snapshot
+    current_ocr_snapshot = OcrSnapshot(OcrContents(lines), setting("user.ocr_snapshot_ttl"), regions)
+    return current_ocr_snapshot
+
+def get_ocr_snapshot(gaze_ocr_controller) -> OcrSnapshot:
+    """Return the current OCR snapshot, running a new OCR scan only when it is stale"""
+    regions = get_active_ocr_regions()
+    if current_ocr_snapshot and current_ocr_snapshot.is_fresh() and current_ocr_snapshot.regions == regions:
+        log.debug("Reusing OCR snapshot (%.0fms old, %d lines)", current_ocr_snapshot.age_ms(), len(current_ocr_snapshot.lines))
+        return current_ocr_snapshot
+
+    if not regions and is_incremental_ocr_active():
+        # Continuous navigation: only re-read the tiles that changed since the last tick
+        lines = incremental_ocr.read(gaze_ocr_controller)
+    else:
+        # Skip OCR entirely when the captured frame matches a recently read one,
+        # and OCR that same capture on a miss
+        frames = capture_cache_frames(regions)
+        lines = read_through_ocr_cache(
+            hash_ocr_frames(frames),
+            lambda: read_captured_lines(
+                getattr(gaze_ocr_controller, "ocr_reader", None), frames,
+                lambda: read_ocr_lines(gaze_ocr_controller, regions),
+            ),
+        )
+    snapshot = install_ocr_snapshot(lines, regions)
+    print(f"Captured new OCR snapshot with {len(snapshot.lines)} lines")
+    return snapshot
+
+def peek_ocr_snapshot():
+    """Return the current OCR snapshot if it is still fresh, without scanning"""
+    if current_ocr_snapshot and current_ocr_snapshot.is_fresh():
+        return current_ocr_snapshot
+    return None
+
+def invalidate_ocr_snapshot(reason: str = "key sent"):
+    """Mark the current OCR snapshot as stale so the next lookup rescans the screen"""
+    global ocr_snapshot_invalidations
+    ocr_snapshot_invalidations += 1
+    if current_ocr_snapshot and not current_ocr_snapshot.invalidated:
+        current_ocr_snapshot.invalidated = True
+        log.debug("Invalidated OCR snapshot (%s)", reason)
+
+def on_pre_phrase(_phrase):
+    """Start each voice command from its own OCR snapshot; unchanged frames are still served by the OCR cache"""
+    global current_ocr_snapshot
+    if current_ocr_snapshot is not None:
+        current_ocr_snapshot = None
+        log.debug("Dropped OCR snapshot (new phrase)")
+
+speech_system.register("pre:phrase", on_pre_phrase)
+
 def clear_hud_event_log():
     """Clear talon-hud event log to prevent OCR false matches"""
     try:
-        import sys
-        hud_instance = None
-
-        # Find talon-hud display module
-        for module_name, module in sys.modules.items():
-            if 'talon_hud' in module_name and 'display' in module_name:
-                if hasattr(module, 'hud'):
-                    hud_instance = module.hud
-                    break
-
         # Clear event log widget
-        if hud_instance and hasattr(hud_instance, 'widget_manager'):
-            for widget in hud_instance.widget_manager.widgets:
-                if hasattr(widget, 'id') and widget.id == "event_log":
-                    if hasattr(widget, 'clear_logs'):
-                        widget.clear_logs()
-                        print("DEBUG: Cleared HUD event log before OCR scan")
-                        return True
-                    break
+        widget = get_hud_widget("event_log")
+        if widget is not None:
+            if hasattr(widget, 'clear_logs'):
+                widget.clear_logs()
+                log.debug("Cleared HUD event log before OCR scan")
+                return True
         else:
-            print("DEBUG: talon-hud instance not found, skipping log clear")
+            log.debug("talon-hud event log not found, skipping log clear")
     except Exception as e:
-        print(f"DEBUG: Could not clear HUD logs: {e}")
+        log.debug("Could not clear HUD logs: %s", e)
     return False
 
 def restore_hud_command_echo(command_text: str):
@@ -74,72 +270,72 @@ def restore_hud_command_echo(command_text: str):
     try:
         # Use the hud_add_log action to restore the command echo
         actions.user.hud_add_log("command", command_text)
-        print(f"DEBUG: Restored command echo to HUD: '{command_text}'")
+        log.debug("Restored command echo to HUD: '%s'", command_text)
     except Exception as e:
-        print(f"DEBUG: Could not restore HUD command echo: {e}")
+        log.debug("Could not restore HUD command echo: %s", e)
 
 def find_phrase_sequences(target_text: str, ocr_lines, fuzzy_threshold: float = 0.8, max_gap: int = None):
-    """Find multi-word phrase sequences in OCR lines using sliding window approach (talon-gaze-ocr method)"""
+    """Find multi-word phrase sequences in OCR lines, scoring only windows seeded from the token index"""
     target_words = target_text.lower().split()
     if len(target_words) <= 1:
         return []  # Single words should use existing word-based matching
 
+    if not RAPIDFUZZ_AVAILABLE:
+        return []
+
     if max_gap is None:
-        max_gap = settings.get("user.phrase_adjacency_gap", 80)
+        max_gap = setting("user.phrase_adjacency_gap", 80)
 
     phrase_matches = []
+    token_index = get_token_index(ocr_lines)
+    windows = token_index.seed_windows(target_words, seed_token_cutoff(fuzzy_threshold))
+
+    for line_idx, start_idx in windows:
+        line = ocr_lines[line_idx]
+        candidate_words = line.words[start_idx:start_idx + len(target_words)]
+
+        # Check if words are adjacent (only whitespace between them)
+        adjacent = True
+        for i in range(len(candidate_words) - 1):
+            current_word = candidate_words[i]
+            next_word = candidate_words[i + 1]
+
+            # Words are adjacent if next word starts close to where current word ends
+            gap = next_word.left - (current_word.left + current_word.width)
+            if gap > max_gap:
+                adjacent = False
+                break
+
+        if not adjacent:
+            continue
+
+        # Create candidate phrase text
+        candidate_phrase = ' '.join([w.text for w in candidate_words])
+
+        # Score the complete phrase using fuzzy matching
+        score = fuzz.ratio(target_text.lower(), candidate_phrase.lower()) / 100.0
+        if score >= fuzzy_threshold:
+            # Calculate phrase bounding box (first word top-left to last word bottom-right)
+            first_word = candidate_words[0]
+            last_word = candidate_words[-1]
+
+            phrase_info = {
+                'coords': (
+                    first_word.left,  # Left edge of first word (matches single word behavior)
+                    first_word.top + first_word.height // 2  # Vertical center of first word
+                ),
+                'text': candidate_phrase,
+                'width': (last_word.left + last_word.width) - first_word.left,
+                'height': max(first_word.height, last_word.height),
+                'line': line_idx,
+                'word_start': start_idx,
+                'word_count': len(candidate_words),
+                'fuzzy_score': score,
+                'is_phrase': True
+            }
+            phrase_matches.append(phrase_info)
+            log.trace("  ✓ Phrase match: '%s' (score: %.2f) at %s", candidate_phrase, score, phrase_info['coords'])
 
-    for line_idx, line in enumerate(ocr_lines):
-        if len(line.words) < len(target_words):
-            continue  # Line too short to contain the phrase
-
-        # Sliding window approach: try all possible positions
-        for start_idx in range(len(line.words) - len(target_words) + 1):
-            candidate_words = line.words[start_idx:start_idx + len(target_words)]
-
-            # Check if words are adjacent (only whitespace between them)
-            adjacent = True
-            for i in range(len(candidate_words) - 1):
-                current_word = candidate_words[i]
-                next_word = candidate_words[i + 1]
-
-                # Words are adjacent if next word starts close to where current word ends
-                gap = next_word.left - (current_word.left + current_word.width)
-                if gap > max_gap:
-                    adjacent = False
-                    break
-            
-            if not adjacent:
-                continue
-            
-            # Create candidate phrase text
-            candidate_phrase = ' '.join([w.text for w in candidate_words])
-            
-            # Score the complete phrase using fuzzy matching
-            if RAPIDFUZZ_AVAILABLE:
-                score = fuzz.ratio(target_text.lower(), candidate_phrase.lower()) / 100.0
-                if score >= fuzzy_threshold:
-                    # Calculate phrase bounding box (first word top-left to last word bottom-right)
-                    first_word = candidate_words[0]
-                    last_word = candidate_words[-1]
-                    
-                    phrase_info = {
-                        'coords': (
-                            first_word.left,  # Left edge of first word (matches single word behavior)
-                            first_word.top + first_word.height // 2  # Vertical center of first word
-                        ),
-                        'text': candidate_phrase,
-                        'width': (last_word.left + last_word.width) - first_word.left,
-                        'height': max(first_word.height, last_word.height),
-                        'line': line_idx,
-                        'word_start': start_idx,
-                        'word_count': len(candidate_words),
-                        'fuzzy_score': score,
-                        'is_phrase': True
-                    }
-                    phrase_matches.append(phrase_info)
-                    print(f"  ✓ Phrase match: '{candidate_phrase}' (score: {score:.2f}) at {phrase_info['coords']}")
-    
     return phrase_matches
 
 def get_homophones_for_word(word: str) -> list:
@@ -159,432 +355,492 @@ def normalize_text_for_fuzzy_matching(text: str) -> str:
     """Normalize text for fuzzy matching (same as talon-gaze-ocr)"""
     return text.lower().replace("\u2019", "'")
 
+class CompiledTarget:
+    """Target text resolved once per lookup: normalization, homophones, phrase tokens and thresholds"""
+
+    def __init__(self, target_text: str, fuzzy_threshold: float, phonetic_threshold: float = 0.75):
+        self.text = target_text
+        self.lowered = target_text.lower()
+        self.normalized = normalize_text_for_fuzzy_matching(target_text)
+        self.tokens = self.normalized.split()
+        self.is_phrase = len(self.tokens) > 1
+        self.fuzzy_threshold = fuzzy_threshold
+        # Stricter threshold for phonetic matching to avoid false positives
+        self.phonetic_threshold = phonetic_threshold
+
+        # Get homophones using community system with fallback (one lookup per target, not per word)
+        homophones = get_homophones_for_word(self.normalized)
+
+        # Ensure target is included (normalize homophones to lowercase)
+        self.homophones = []
+        for homophone in homophones:
+            homophone_normalized = normalize_text_for_fuzzy_matching(homophone)
+            if homophone_normalized not in self.homophones:
+                self.homophones.append(homophone_normalized)
+        if self.normalized not in self.homophones:
+            self.homophones.append(self.normalized)
+        self.homophone_set = set(self.homophones)
+
+    def is_exact_word_match(self, word_text: str) -> bool:
+        """Exact matching used before any fuzzy scoring (target contained in the OCR word)"""
+        return self.lowered in word_text.lower()
+
+    def score(self, candidate_text: str, threshold: float = None) -> float:
+        """Score an OCR word against this target using multi-algorithm fuzzy matching"""
+        if threshold is None:
+            threshold = self.fuzzy_threshold
+        candidate_normalized = normalize_text_for_fuzzy_matching(candidate_text)
+
+        # 1. Exact match against any homophone (highest priority)
+        if candidate_normalized in self.homophone_set:
+            log.trace("    EXACT match: '%s' in %s = 1.00", candidate_normalized, self.homophones)
+            return 1.0
+
+        best_score = 0.0
+        best_method = None
+
+        # Try each homophone with multiple algorithms
+        for homophone in self.homophones:
+            # 2. Jaro-Winkler similarity (excellent for phonetic matching like fire/file)
+            if JAROWINKLER_AVAILABLE:
+                try:
+                    jw_score = jarowinkler.jarowinkler_similarity(candidate_normalized, homophone)
+                    if jw_score > best_score and jw_score >= self.phonetic_threshold:
+                        best_score = jw_score
+                        best_method = f"Jaro-Winkler vs '{homophone}'"
+                except Exception as e:
+                    log.warn("Jaro-Winkler error for '%s' vs '%s': %s", homophone, candidate_normalized, e)
+
+            # 3. RapidFuzz algorithms (if available)
+            if RAPIDFUZZ_AVAILABLE:
+                try:
+                    # Standard ratio
+                    ratio_score = fuzz.ratio(homophone, candidate_normalized) / 100.0
+                    if ratio_score > best_score and ratio_score >= threshold:
+                        best_score = ratio_score
+                        best_method = f"Ratio vs '{homophone}'"
+
+                    # Partial ratio (good for substring matching)
+                    partial_score = fuzz.partial_ratio(homophone, candidate_normalized) / 100.0
+                    if partial_score > best_score and partial_score >= threshold:
+                        best_score = partial_score
+                        best_method = f"Partial ratio vs '{homophone}'"
+
+                    # Token sort ratio (good for word order independence)
+                    token_score = fuzz.token_sort_ratio(homophone, candidate_normalized) / 100.0
+                    if token_score > best_score and token_score >= threshold:
+                        best_score = token_score
+                        best_method = f"Token sort vs '{homophone}'"
+
+                except Exception as e:
+                    log.warn("RapidFuzz error for '%s' vs '%s': %s", homophone, candidate_normalized, e)
+
+        # Debug logging
+        if best_score > 0 and best_method:
+            log.trace("    Best fuzzy match: %s = %.3f", best_method, best_score)
+        elif len(self.homophones) > 1:
+            log.trace("    No fuzzy matches above threshold %.2f for '%s' vs homophones %s", threshold, candidate_normalized, self.homophones)
+
+        return best_score
+
+    def score_batch(self, candidate_texts: list, threshold: float = None) -> list:
+        """Score every OCR word at once, returning (score, method) per word in input order"""
+        if threshold is None:
+            threshold = self.fuzzy_threshold
+        if BATCH_SCORING_AVAILABLE and candidate_texts:
+            return score_words_batch(self, candidate_texts, threshold)
+
+        # Fallback: one word at a time
+        results = []
+        for candidate_text in candidate_texts:
+            score = self.score(candidate_text, threshold)
+            results.append((score, "Sequential" if score > 0 else None))
+        return results
+
+def score_words_batch(compiled_target: CompiledTarget, candidate_texts: list, threshold: float) -> list:
+    """Matrix-score all OCR words against all homophones, matching CompiledTarget.score() results"""
+    candidates_normalized = [normalize_text_for_fuzzy_matching(text) for text in candidate_texts]
+    homophones = compiled_target.homophones
+
+    # One (homophones x words) matrix per algorithm, in the same order score() tries them
+    method_names = ["Jaro-Winkler", "Ratio", "Partial ratio", "Token sort"]
+    if JAROWINKLER_AVAILABLE:
+        jw_scores = process.cdist(homophones, candidates_normalized, scorer=JaroWinkler.normalized_similarity, dtype=np.float64)
+        jw_scores = np.where(jw_scores >= compiled_target.phonetic_threshold, jw_scores, 0.0)
+    else:
+        jw_scores = np.zeros((len(homophones), len(candidates_normalized)))
+    method_scores = [jw_scores]
+    for scorer in (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio):
+        scores = process.cdist(homophones, candidates_normalized, scorer=scorer, dtype=np.float64) / 100.0
+        method_scores.append(np.where(scores >= threshold, scores, 0.0))
+
+    # Shape (words, homophones * methods) ordered homophone-major, so argmax picks the
+    # first best score exactly like the sequential strictly-greater-than loop
+    stacked = np.stack(method_scores, axis=2).transpose(1, 0, 2).reshape(len(candidates_normalized), -1)
+    best_columns = np.argmax(stacked, axis=1)
+    best_scores = stacked[np.arange(len(candidates_normalized)), best_columns]
+
+    results = []
+    for word_idx, candidate_normalized in enumerate(candidates_normalized):
+        if candidate_normalized in compiled_target.homophone_set:
+            results.append((1.0, "Exact"))
+            continue
+        best_score = float(best_scores[word_idx])
+        if best_score > 0:
+            homophone_idx, method_idx = divmod(int(best_columns[word_idx]), len(method_names))
+            results.append((best_score, f"{method_names[method_idx]} vs '{homophones[homophone_idx]}'"))
+        else:
+            results.append((0.0, None))
+    return results
+
 def score_word_fuzzy(candidate_text: str, target_text: str, threshold: float) -> float:
     """Score a word using multi-algorithm fuzzy matching with enhanced homophone support"""
-    candidate_normalized = normalize_text_for_fuzzy_matching(candidate_text)
-    target_normalized = normalize_text_for_fuzzy_matching(target_text)
-    
-    # Get homophones using community system with fallback
-    homophones = get_homophones_for_word(target_normalized)
-    
-    # Ensure target is included (normalize homophones to lowercase)
-    homophones_normalized = [normalize_text_for_fuzzy_matching(h) for h in homophones]
-    if target_normalized not in homophones_normalized:
-        homophones_normalized.append(target_normalized)
-    
-    best_score = 0.0
-    best_method = None
-    best_homophone = None
-    
-    # Try each homophone with multiple algorithms
-    for homophone in homophones_normalized:
-        # 1. Exact match (highest priority)
-        if candidate_normalized == homophone:
-            print(f"    EXACT match: '{candidate_normalized}' == '{homophone}' = 1.00")
-            return 1.0
-        
-        # 2. Jaro-Winkler similarity (excellent for phonetic matching like fire/file)
-        if JAROWINKLER_AVAILABLE:
-            try:
-                jw_score = jarowinkler.jarowinkler_similarity(candidate_normalized, homophone)
-                if jw_score > best_score and jw_score >= 0.75:  # Stricter threshold for phonetic to avoid false positives
-                    best_score = jw_score
-                    best_method = f"Jaro-Winkler vs '{homophone}'"
-                    best_homophone = homophone
-            except Exception as e:
-                print(f"Jaro-Winkler error for '{homophone}' vs '{candidate_normalized}': {e}")
-        
-        # 3. RapidFuzz algorithms (if available)
-        if RAPIDFUZZ_AVAILABLE:
-            try:
-                # Standard ratio
-                ratio_score = fuzz.ratio(homophone, candidate_normalized) / 100.0
-                if ratio_score > best_score and ratio_score >= threshold:
-                    best_score = ratio_score
-                    best_method = f"Ratio vs '{homophone}'"
-                    best_homophone = homophone
-                
-                # Partial ratio (good for substring matching)
-                partial_score = fuzz.partial_ratio(homophone, candidate_normalized) / 100.0
-                if partial_score > best_score and partial_score >= threshold:
-                    best_score = partial_score
-                    best_method = f"Partial ratio vs '{homophone}'"
-                    best_homophone = homophone
-                
-                # Token sort ratio (good for word order independence)
-                token_score = fuzz.token_sort_ratio(homophone, candidate_normalized) / 100.0
-                if token_score > best_score and token_score >= threshold:
-                    best_score = token_score
-                    best_method = f"Token sort vs '{homophone}'"
-                    best_homophone = homophone
-                    
-            except Exception as e:
-                print(f"RapidFuzz error for '{homophone}' vs '{candidate_normalized}': {e}")
-    
-    # Debug logging
-    if best_score > 0 and best_method:
-        print(f"    Best fuzzy match: {best_method} = {best_score:.3f}")
-    elif len(homophones_normalized) > 1:
-        print(f"    No fuzzy matches above threshold {threshold:.2f} for '{candidate_normalized}' vs homophones {homophones_normalized}")
-    
-    return best_score
+    return CompiledTarget(target_text, threshold).score(candidate_text)
 
 def get_hud_log_exclusion_region():
     """Get the screen region occupied by talon_hud event log to exclude from OCR results"""
+    return main_thread_value("hud_log_region", read_hud_log_exclusion_region)
+
+def read_hud_log_exclusion_region():
+    """Compute the HUD log region from talon-hud's widget geometry; main thread only"""
+    geometry = None
     try:
-        import sys
-        # Find the talon_hud display module and get event log widget position
-        for module_name, module in sys.modules.items():
-            if 'talon_hud' in module_name and 'display' in module_name:
-                if hasattr(module, 'hud') and hasattr(module.hud, 'widget_manager'):
-                    for widget in module.hud.widget_manager.widgets:
-                        if hasattr(widget, 'id') and widget.id == "event_log":
-                            if hasattr(widget, 'x') and hasattr(widget, 'y'):
-                                # Return the bounding box of the event log
-                                # Add some padding to be safe
-                                padding = 20
-                                return {
-                                    'x': widget.x - padding,
-                                    'y': widget.y - padding,
-                                    'width': widget.width + padding * 2,
-                                    'height': widget.height + padding * 2
-                                }
+        # Get event log widget position from talon-hud
+        widget = get_hud_widget("event_log")
+        if widget is not None and hasattr(widget, 'x') and hasattr(widget, 'y'):
+            geometry = (widget.x, widget.y, widget.width, widget.height)
     except Exception as e:
-        print(f"DEBUG: Could not get HUD log region: {e}")
-
-    # Fallback to default position if we can't detect it
-    # Default is bottom-right: x=1430, y=720, width=450, height=200
-    return {'x': 1410, 'y': 700, 'width': 490, 'height': 240}
+        log.debug("Could not get HUD log region: %s", e)
+
+    # Only rebuild the region when the widget moved or resized
+    if hud_region_cache['region'] is not None and hud_region_cache['geometry'] == geometry:
+        return hud_region_cache['region']
+
+    if geometry:
+        # Return the bounding box of the event log
+        # Add some padding to be safe
+        padding = 20
+        x, y, width, height = geometry
+        region = {
+            'x': x - padding,
+            'y': y - padding,
+            'width': width + padding * 2,
+            'height': height + padding * 2
+        }
+    else:
+        # Fallback to default position if we can't detect it
+        region = DEFAULT_HUD_LOG_REGION
+
+    hud_region_cache['geometry'] = geometry
+    hud_region_cache['region'] = region
+    return region
+
+def points_in_hud_region(points: list, hud_region: dict = None) -> list:
+    """For each (x, y) point, whether it lies inside the HUD log region (one array operation)"""
+    if hud_region is None:
+        hud_region = get_hud_log_exclusion_region()
+    left_x, top_y = hud_region['x'], hud_region['y']
+    right_x, bottom_y = left_x + hud_region['width'], top_y + hud_region['height']
+    if not points:
+        return []
+    if NUMPY_AVAILABLE:
+        xy = np.asarray(points, dtype=np.float64)
+        inside = (xy[:, 0] >= left_x) & (xy[:, 0] <= right_x) & (xy[:, 1] >= top_y) & (xy[:, 1] <= bottom_y)
+        return inside.tolist()
+    return [left_x <= x <= right_x and top_y <= y <= bottom_y for x, y in points]
 
 def filter_hud_log_results(text_matches):
     """Filter out OCR results that are in the HUD log region"""
-    if settings.get("user.disable_hud_log_exclusion"):
-        print("DEBUG: HUD log exclusion disabled by setting, skipping filter")
+    if setting("user.disable_hud_log_exclusion"):
+        log.debug("HUD log exclusion disabled by setting, skipping filter")
         return text_matches
 
     hud_region = get_hud_log_exclusion_region()
-    print(f"DEBUG: Excluding HUD log region: x={hud_region['x']}, y={hud_region['y']}, w={hud_region['width']}, h={hud_region['height']}")
+    log.debug("Excluding HUD log region: x=%s, y=%s, w=%s, h=%s", hud_region['x'], hud_region['y'], hud_region['width'], hud_region['height'])
 
     filtered_matches = []
     excluded_count = 0
 
-    for match in text_matches:
-        coords = match.get('coords', (0, 0))
-        x, y = coords
-
-        # Check if this coordinate is inside the HUD log region
-        if (hud_region['x'] <= x <= hud_region['x'] + hud_region['width'] and
-            hud_region['y'] <= y <= hud_region['y'] + hud_region['height']):
-            print(f"DEBUG: Excluded '{match.get('text', '')}' at {coords} (inside HUD log region)")
+    # Check every coordinate against the HUD log region at once
+    inside_flags = points_in_hud_region([match.get('coords', (0, 0)) for match in text_matches], hud_region)
+    for match, inside in zip(text_matches, inside_flags):
+        if inside:
+            log.trace("Excluded '%s' at %s (inside HUD log region)", match.get('text', ''), match.get('coords', (0, 0)))
             excluded_count += 1
         else:
             filtered_matches.append(match)
 
     if excluded_count > 0:
-        print(f"DEBUG: Filtered out {excluded_count} matches from HUD log region, {len(filtered_matches)} remaining")
+        log.debug("Filtered out %d matches from HUD log region, %d remaining", excluded_count, len(filtered_matches))
 
     return filtered_matches
 
+class MatchMetrics:
+    """Per-tier counters for the text match engine"""
+
+    def __init__(self):
+        self.lookups = 0
+        self.unresolved = 0
+        self.tiers = {}
+
+    def record_tier(self, tier: str, match_count: int, elapsed_ms: float):
+        """Count one run of a match tier and how many matches it kept"""
+        stats = self.tiers.setdefault(tier, {'runs': 0, 'resolved': 0, 'matches': 0, 'total_ms': 0.0})
+        stats['runs'] += 1
+        stats['matches'] += match_count
+        stats['total_ms'] += elapsed_ms
+        if match_count:
+            stats['resolved'] += 1
+
+    def reset(self):
+        """Clear all counters"""
+        self.__init__()
+
+# Global match engine metrics
+match_metrics = MatchMetrics()
+
+def build_word_infos(lines) -> list:
+    """Flatten OCR lines into match dictionaries for every word"""
+    return [
+        {
+            'coords': (word.left, word.top + word.height // 2),
+            'text': word.text,
+            'width': word.width,
+            'height': word.height,
+            'line': line_idx,
+            'word': word_idx
+        }
+        for line_idx, line in enumerate(lines)
+        for word_idx, word in enumerate(line.words)
+    ]
+
+def run_match_tier(tier: str, find_matches):
+    """Run one tier's matcher, drop HUD log results and record metrics; yields (tier, matches) if any remain"""
+    start = time.perf_counter()
+    matches = find_matches()
+    if matches:
+        matches = filter_hud_log_results(matches)
+    match_metrics.record_tier(tier, len(matches), (time.perf_counter() - start) * 1000)
+    if matches:
+        log.debug("Match tier '%s': %d match(es)", tier, len(matches))
+        yield tier, matches
+    else:
+        log.debug("Match tier '%s': no matches", tier)
+
+def score_word_infos(compiled_target: CompiledTarget, candidates: list, accept_threshold: float = None) -> list:
+    """Fuzzy-score candidate word infos in one batch, best first"""
+    fuzzy_threshold = compiled_target.fuzzy_threshold
+    if accept_threshold is None:
+        accept_threshold = fuzzy_threshold
+    fuzzy_matches = []
+    batch_scores = compiled_target.score_batch([info['text'] for info in candidates], fuzzy_threshold)
+    for word_info, (score, method) in zip(candidates, batch_scores):
+        if score > 0 and score >= accept_threshold:
+            fuzzy_matches.append(dict(word_info, fuzzy_score=score))
+            log.trace("  ✓ Fuzzy match: '%s' (score: %.2f via %s)", word_info['text'], score, method)
+    return sorted(fuzzy_matches, key=lambda x: x['fuzzy_score'], reverse=True)
+
+def phonetic_word_matches(compiled_target: CompiledTarget, word_infos: list) -> list:
+    """Accept words that sound like the target (or a homophone of it) at the phonetic threshold
+
+    Sharing a phonetic key is the evidence the fuzzy threshold would otherwise demand, so
+    "file" reaches "Fire" (same key, Jaro-Winkler 0.87) while "Skills" never gets scored.
+    """
+    texts = [info['text'] for info in word_infos]
+    shortlist = get_phonetic_index(texts).shortlist(compiled_target.homophones)
+    if not shortlist:
+        return []
+    log.debug("Phonetic shortlist: %d of %d words", len(shortlist), len(word_infos))
+    return score_word_infos(
+        compiled_target,
+        [word_infos[idx] for idx in shortlist],
+        compiled_target.phonetic_threshold
+    )
+
+def iter_text_matches(lines, compiled_target: CompiledTarget):
+    """Lazily yield (tier, matches) for each tier that finds the target, best tier first
+
+    Phrase targets try phrase sequences, then exact words, then the game lexicon, then
+    phrases with a relaxed adjacency gap. Single words try exact words, then the game
+    lexicon, then fuzzy scoring of every word, then words that sound alike at the looser
+    phonetic threshold. Callers stop consuming once they have a tier, so later tiers are never computed.
+    """
+    fuzzy_threshold = compiled_target.fuzzy_threshold
+    word_infos = []
+
+    def exact_word_matches():
+        word_infos.extend(build_word_infos(lines))
+        return [info for info in word_infos if compiled_target.is_exact_word_match(info['text'])]
+
+    def by_score(matches):
+        return sorted(matches, key=lambda x: x['fuzzy_score'], reverse=True)
+
+    if compiled_target.is_phrase:
+        yield from run_match_tier("phrase", lambda: by_score(
+            find_phrase_sequences(compiled_target.text, lines, fuzzy_threshold)
+        ))
+
+    yield from run_match_tier("exact", exact_word_matches)
+
+    # Known game terms resolve deterministically before any fuzzy scoring
+    if setting("user.game_lexicon_enabled"):
+        lexicon = get_game_lexicon()
+        canonical_forms = lexicon.canonical_forms(compiled_target.text) if lexicon else []
+        if canonical_forms:
+            log.debug("Game lexicon: '%s' -> %s", compiled_target.text, canonical_forms)
+            yield from run_match_tier("lexicon", lambda: find_lexicon_matches(
+                lines, canonical_forms, get_token_index(lines)
+            ))
+
+    if not setting("user.menu_enable_fuzzy_matching") or not RAPIDFUZZ_AVAILABLE or not word_infos:
+        return
+
+    if compiled_target.is_phrase:
+        relaxed_gap = setting("user.phrase_adjacency_gap", 80) * 2
+        yield from run_match_tier("relaxed_phrase", lambda: by_score(
+            find_phrase_sequences(compiled_target.text, lines, fuzzy_threshold * 0.9, max_gap=relaxed_gap)
+        ))
+    else:
+        yield from run_match_tier("fuzzy", lambda: score_word_infos(compiled_target, word_infos))
+        # Only reached when fuzzy scoring found nothing, so it never hides fuzzy matches
+        if setting("user.phonetic_shortlist_enabled"):
+            yield from run_match_tier("phonetic", lambda: phonetic_word_matches(compiled_target, word_infos))
+
+def compile_target(target_text: str) -> CompiledTarget:
+    """Resolve target_text against the fuzzy threshold and homophones; reads Talon, so main thread only"""
+    return CompiledTarget(target_text, settings.get("user.menu_fuzzy_threshold"))
+
+def find_text_matches(target_text: str, compiled_target: CompiledTarget = None):
+    """OCR the screen (or reuse the snapshot) and return the first tier of matches as (tier, matches)
+
+    Worker jobs pass a compiled_target built by compile_target() on the main thread.
+    Returns None when the OCR controller is unavailable.
+    """
+    if compiled_target is None:
+        log.refresh()
+        compiled_target = compile_target(target_text)
+    gaze_ocr_controller = get_gaze_ocr_controller()
+    if not gaze_ocr_controller:
+        print("Could not find gaze_ocr_controller")
+        return None
+
+    # Reuse this command's OCR snapshot, scanning only when it is stale
+    try:
+        contents = get_ocr_snapshot(gaze_ocr_controller).contents
+    except Exception:
+        # The controller may be stale after a gaze-ocr reload
+        gaze_ocr.invalidate("OCR read failed")
+        raise
+    log.debug("Got OCR contents with %d lines", len(contents.result.lines))
+
+    if compiled_target.is_phrase:
+        print(f"Multi-word target detected: '{target_text}' -> {target_text.split()}")
+
+    match_metrics.lookups += 1
+    tier, text_matches = next(iter_text_matches(contents.result.lines, compiled_target), (None, []))
+    if tier is None:
+        match_metrics.unresolved += 1
+    return tier, text_matches
+
+def begin_text_lookup():
+    """Disconnect the eye tracker and clear the HUD log before an OCR lookup"""
+    # Disconnect eye tracker to scan full screen
+    actions.user.disconnect_ocr_eye_tracker()
+
+    # Always clear HUD logs before OCR scan to prevent command echo false matches
+    clear_hud_event_log()
+
+def locate_text_coordinates(target_text: str, compiled_target: CompiledTarget = None):
+    """Coordinates of the best on-screen match for target_text, closest to the cursor when several match
+
+    Reads the screen but leaves the eye tracker and HUD alone, so it can run on the
+    navigation worker between begin_text_lookup() and finish_text_lookup(), given a
+    compiled_target and the main-thread values it installed.
+    """
+    from .template_matching import locate_cursor
+    global current_target_width
+    lookup = find_text_matches(target_text, compiled_target)
+    text_matches = lookup[1] if lookup else []
+    if not text_matches:
+        if lookup:
+            print(f"Text '{target_text}' not found in OCR results")
+        return None
+
+    if len(text_matches) == 1:
+        # Single match - use it
+        match = text_matches[0]
+        print(f"Found single '{target_text}' at center coordinates: {match['coords']}")
+        current_target_width = match['width']
+        return match['coords']
+
+    # Sort by position for consistent ordering (top-to-bottom, left-to-right)
+    text_matches.sort(key=lambda m: (m['coords'][1], m['coords'][0]))
+
+    # Multiple matches - pick closest to current cursor
+    print(f"Found {len(text_matches)} instances of '{target_text}' (sorted by position):")
+    for i, match in enumerate(text_matches):
+        log.debug("  %d. '%s' at %s (Line %s, Word %s)", i + 1, match['text'], match['coords'], match['line'], match.get('word', match.get('word_start')))
+
+    # Get current cursor position to choose closest text
+    cursor_pos = locate_cursor()
+    if cursor_pos:
+        match, min_distance = closest_match(text_matches, cursor_pos)
+        print(f"Selected closest '{target_text}' at {match['coords']} (distance: {min_distance:.1f}px)")
+    else:
+        # No cursor found, use first match
+        match = text_matches[0]
+        print(f"No cursor found, using first '{target_text}' at {match['coords']}")
+    current_target_width = match['width']
+    return match['coords']
+
+def finish_text_lookup(restore_text: str):
+    """Restore the HUD command echo and reconnect the eye tracker after an OCR lookup"""
+    restore_hud_command_echo(restore_text)
+    actions.user.connect_ocr_eye_tracker()
+
 @mod.action_class
 class OCRTextDetectionActions:
+    def set_ocr_region(region_names: str):
+        """Limit OCR and text matching to named regions from user.ocr_regions until cleared"""
+        set_ocr_region_override(region_names)
+
+    def clear_ocr_region():
+        """Return OCR to the regions from user.ocr_active_regions (full screen by default)"""
+        set_ocr_region_override(None)
+
+    def debug_match_metrics() -> None:
+        """Print per-tier text match engine metrics"""
+        print("=== DEBUG: TEXT MATCH METRICS ===")
+        print(f"Lookups: {match_metrics.lookups}, unresolved: {match_metrics.unresolved}")
+        for tier, stats in match_metrics.tiers.items():
+            average_ms = stats['total_ms'] / stats['runs'] if stats['runs'] else 0.0
+            print(f"  {tier}: runs={stats['runs']} resolved={stats['resolved']} matches={stats['matches']} avg={average_ms:.2f}ms")
+        print("=== END DEBUG TEXT MATCH METRICS ===")
+
+    def reset_match_metrics() -> None:
+        """Reset text match engine metrics"""
+        match_metrics.reset()
+        print("Text match metrics reset")
+
     def get_text_coordinates(target_text: str, source_command: str = None):
         """Find coordinates of text using OCR with fuzzy matching support"""
         # Determine restore text: use source_command if provided, otherwise target_text
         restore_text = source_command or target_text
         try:
-            # Disconnect eye tracker to scan full screen
-            actions.user.disconnect_ocr_eye_tracker()
-
-            # Always clear HUD logs before OCR scan to prevent command echo false matches
-            clear_hud_event_log()
-
-            # Trigger OCR scan without visual overlay
-            
-            # Try different approaches to access the OCR controller
-            import sys
-            gaze_ocr_controller = None
-            
-            # Method 1: Check sys.modules for loaded gaze_ocr_talon
-            for module_name, module in sys.modules.items():
-                if 'gaze_ocr' in module_name and hasattr(module, 'gaze_ocr_controller'):
-                    gaze_ocr_controller = module.gaze_ocr_controller
-                    print(f"Found gaze_ocr_controller via sys.modules in: {module_name}")
-                    break
-            
-            # Method 2: Try accessing through globals 
-            if not gaze_ocr_controller:
-                import builtins
-                if hasattr(builtins, 'gaze_ocr_controller'):
-                    gaze_ocr_controller = builtins.gaze_ocr_controller
-                    print("Found gaze_ocr_controller in builtins")
-            
-            # Method 3: Try direct import approach
-            if not gaze_ocr_controller:
-                try:
-                    import importlib.util
-                    spec = importlib.util.spec_from_file_location(
-                        "gaze_ocr_talon", 
-                        "/Users/jarrod/.talon/user/talon-gaze-ocr/gaze_ocr_talon.py"
-                    )
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        # Don't execute - just see if we can access existing instance
-                        print("Could load module spec, but need existing instance")
-                except Exception as e:
-                    print(f"Import approach failed: {e}")
-            
-            if gaze_ocr_controller:
-                # Trigger OCR scan without overlay
-                gaze_ocr_controller.read_nearby()
-                
-                # Get the latest screen contents
-                contents = gaze_ocr_controller.latest_screen_contents()
-                print(f"Got OCR contents with {len(contents.result.lines)} lines")
-                
-                # Search for the target text
-                # PHASE 1: Try phrase sequence matching first (multi-word phrases)
-                text_matches = []
-                all_words = []  # Store all words for potential fuzzy matching
-                
-                # Check if this is a multi-word phrase
-                target_words = target_text.split()
-                if len(target_words) > 1:
-                    print(f"Multi-word target detected: '{target_text}' -> {target_words}")
-                    fuzzy_threshold = settings.get("user.menu_fuzzy_threshold", 0.8)
-                    phrase_matches = find_phrase_sequences(target_text, contents.result.lines, fuzzy_threshold)
-                    if phrase_matches:
-                        # Filter HUD matches early so Phase 2 can run if all Phase 1 matches were HUD echoes
-                        phrase_matches = filter_hud_log_results(phrase_matches)
-                    if phrase_matches:
-                        phrase_matches.sort(key=lambda x: x['fuzzy_score'], reverse=True)
-                        text_matches = phrase_matches
-                        print(f"Found {len(text_matches)} phrase sequence matches for '{target_text}' (best score: {text_matches[0]['fuzzy_score']:.2f})")
-
-                # PHASE 2: If no phrase matches, try individual word matching (original behavior)
-                if not text_matches:
-                    print(f"No phrase matches found, trying individual word matching for '{target_text}'")
-
-                    for line_idx, line in enumerate(contents.result.lines):
-                        for word_idx, word in enumerate(line.words):
-                            print(f"Line {line_idx}, Word {word_idx}: '{word.text}' at ({word.left}, {word.top})")
-
-                            # Store word for potential fuzzy matching
-                            word_info = {
-                                'coords': (word.left, word.top + word.height//2),
-                                'text': word.text,
-                                'width': word.width,
-                                'line': line_idx,
-                                'word': word_idx
-                            }
-                            all_words.append(word_info)
-
-                            # Try exact matching first (current behavior)
-                            if target_text.lower() in word.text.lower():
-                                text_matches.append(word_info)
-
-                    # If exact matches found, use them
-                    if text_matches:
-                        print(f"Found {len(text_matches)} exact word matches for '{target_text}'")
-                    elif settings.get("user.menu_enable_fuzzy_matching") and RAPIDFUZZ_AVAILABLE and all_words:
-                        if len(target_words) > 1:
-                            # Multi-word target: retry phrase matching with relaxed gap (2x)
-                            print(f"Retrying phrase match with relaxed adjacency gap for '{target_text}'...")
-                            relaxed_gap = settings.get("user.phrase_adjacency_gap", 80) * 2
-                            phrase_matches = find_phrase_sequences(
-                                target_text, contents.result.lines, fuzzy_threshold * 0.9,
-                                max_gap=relaxed_gap
-                            )
-                            if phrase_matches:
-                                phrase_matches.sort(key=lambda x: x['fuzzy_score'], reverse=True)
-                                text_matches = phrase_matches
-                                print(f"Found {len(text_matches)} relaxed phrase matches for '{target_text}'")
-                            else:
-                                print(f"No matches found for multi-word target '{target_text}' even with relaxed gap")
-                        else:
-                            # Single word: existing fuzzy matching behavior
-                            print(f"No exact matches for '{target_text}', trying fuzzy matching...")
-                            fuzzy_threshold = settings.get("user.menu_fuzzy_threshold")
-                            fuzzy_matches = []
-
-                            for word_info in all_words:
-                                score = score_word_fuzzy(word_info['text'], target_text, fuzzy_threshold)
-                                print(f"  Testing '{word_info['text']}' vs '{target_text}': score {score:.2f} (threshold: {fuzzy_threshold:.2f})")
-                                if score >= fuzzy_threshold:
-                                    word_info['fuzzy_score'] = score
-                                    fuzzy_matches.append(word_info)
-                                    print(f"  ✓ Fuzzy match: '{word_info['text']}' (score: {score:.2f})")
-
-                            if fuzzy_matches:
-                                # Sort by score (best first) and use fuzzy matches
-                                fuzzy_matches.sort(key=lambda x: x['fuzzy_score'], reverse=True)
-                                text_matches = fuzzy_matches
-                                print(f"Found {len(text_matches)} fuzzy word matches for '{target_text}' (best score: {text_matches[0]['fuzzy_score']:.2f})")
-                            else:
-                                print(f"No fuzzy matches found for '{target_text}' above threshold {fuzzy_threshold:.2f}")
-
-                # Filter out results in the HUD log region
-                if text_matches:
-                    text_matches = filter_hud_log_results(text_matches)
-
-                if text_matches:
-                    global current_target_width
-
-                    if len(text_matches) == 1:
-                        # Single match - use it
-                        match = text_matches[0]
-                        print(f"Found single '{target_text}' at center coordinates: {match['coords']}")
-                        current_target_width = match['width']
-                        # Restore HUD command echo after OCR
-                        restore_hud_command_echo(restore_text)
-                        actions.user.connect_ocr_eye_tracker()
-                        return match['coords']
-                    else:
-                        # Sort by position for consistent ordering (top-to-bottom, left-to-right)
-                        text_matches.sort(key=lambda m: (m['coords'][1], m['coords'][0]))
-                        
-                        # Multiple matches - pick closest to current cursor
-                        print(f"Found {len(text_matches)} instances of '{target_text}' (sorted by position):")
-                        for i, match in enumerate(text_matches):
-                            print(f"  {i+1}. '{match['text']}' at {match['coords']} (Line {match['line']}, Word {match['word']})")
-                        
-                        # Get current cursor position to choose closest text
-                        cursor_pos = actions.user.find_cursor_flexible()
-                        if cursor_pos:
-                            best_match = None
-                            min_distance = float('inf')
-                            
-                            for match in text_matches:
-                                distance = actions.user.calculate_distance(cursor_pos, match['coords'])
-                                print(f"  Distance from cursor {cursor_pos} to '{match['text']}' at {match['coords']}: {distance:.1f}px")
-                                if distance < min_distance:
-                                    min_distance = distance
-                                    best_match = match
-                            
-                            if best_match:
-                                print(f"Selected closest '{target_text}' at {best_match['coords']} (distance: {min_distance:.1f}px)")
-                                current_target_width = best_match['width']
-                                # Restore HUD command echo after OCR
-                                restore_hud_command_echo(restore_text)
-                                actions.user.connect_ocr_eye_tracker()
-                                return best_match['coords']
-                        else:
-                            # No cursor found, use first match
-                            match = text_matches[0]
-                            print(f"No cursor found, using first '{target_text}' at {match['coords']}")
-                            current_target_width = match['width']
-                            # Restore HUD command echo after OCR
-                            restore_hud_command_echo(restore_text)
-                            actions.user.connect_ocr_eye_tracker()
-                            return match['coords']
-                
-                print(f"Text '{target_text}' not found in OCR results")
-            else:
-                print("Could not find gaze_ocr_controller via any method")
-
-            # Restore HUD command echo after OCR
-            restore_hud_command_echo(restore_text)
-
-            # Reconnect eye tracker
-            actions.user.connect_ocr_eye_tracker()
-            return None
+            begin_text_lookup()
+            return locate_text_coordinates(target_text)
 
         except Exception as e:
             print(f"Error getting text coordinates: {str(e)}")
-            # Restore HUD command echo even on error
-            restore_hud_command_echo(restore_text)
-            actions.user.connect_ocr_eye_tracker()
             return None
-
-    def check_if_disambiguation_needed(target_text: str, source_command: str = None) -> bool:
-        """Check if multiple matches exist for the target text without doing full disambiguation"""
-        restore_text = source_command or target_text
-        try:
-            # Disconnect eye tracker to scan full screen
-            actions.user.disconnect_ocr_eye_tracker()
-
-            # Always clear HUD logs before OCR scan to prevent command echo false matches
-            clear_hud_event_log()
-
-            # Try different approaches to access the OCR controller
-            import sys
-            gaze_ocr_controller = None
-            
-            # Method 1: Check sys.modules for loaded gaze_ocr_talon
-            for module_name, module in sys.modules.items():
-                if 'gaze_ocr' in module_name and hasattr(module, 'gaze_ocr_controller'):
-                    gaze_ocr_controller = module.gaze_ocr_controller
-                    break
-            
-            if gaze_ocr_controller:
-                # Trigger OCR scan without overlay
-                gaze_ocr_controller.read_nearby()
-                
-                # Get the latest screen contents
-                contents = gaze_ocr_controller.latest_screen_contents()
-                
-                # Count matches
-                text_matches = []
-                all_words = []
-                
-                for line_idx, line in enumerate(contents.result.lines):
-                    for word_idx, word in enumerate(line.words):
-                        # Store word for potential fuzzy matching
-                        word_info = {
-                            'coords': (word.left, word.top + word.height // 2),
-                            'text': word.text,
-                            'width': word.width,
-                            'height': word.height,
-                            'line': line_idx,
-                            'word': word_idx
-                        }
-                        all_words.append(word_info)
-                        
-                        # Try exact matching first
-                        if target_text.lower() in word.text.lower():
-                            text_matches.append(word_info)
-                
-                # Check fuzzy matching if no exact matches
-                if not text_matches and settings.get("user.menu_enable_fuzzy_matching") and RAPIDFUZZ_AVAILABLE and all_words:
-                    fuzzy_threshold = settings.get("user.menu_fuzzy_threshold")
-
-                    for word_info in all_words:
-                        score = score_word_fuzzy(word_info['text'], target_text, fuzzy_threshold)
-                        if score >= fuzzy_threshold:
-                            text_matches.append(word_info)
-
-                # Filter out results in the HUD log region
-                if text_matches:
-                    text_matches = filter_hud_log_results(text_matches)
-
-                # Restore HUD command echo after OCR check
-                restore_hud_command_echo(restore_text)
-
-                # Reconnect eye tracker
-                actions.user.connect_ocr_eye_tracker()
-
-                # Return True if more than one match
-                result = len(text_matches) > 1
-                print(f"Disambiguation check for '{target_text}': {len(text_matches)} matches found, needs_disambiguation={result}")
-                return result
-            else:
-                print("Could not find gaze_ocr_controller for disambiguation check")
-                # Restore HUD command echo even on failure
-                restore_hud_command_echo(restore_text)
-                # Reconnect eye tracker
-                actions.user.connect_ocr_eye_tracker()
-                return False
-
-        except Exception as e:
-            print(f"Error checking disambiguation need: {str(e)}")
+        finally:
             # Restore HUD command echo even on error
-            restore_hud_command_echo(restore_text)
-            actions.user.connect_ocr_eye_tracker()
-            return False
+            finish_text_lookup(restore_text)
 
     def get_text_coordinates_generator(target_text: str, disambiguate: bool = True, source_command: str = None):
         """Generator version that yields multiple matches for disambiguation"""
         restore_text = source_command or target_text
-        print(f"GENERATOR DEBUG: get_text_coordinates_generator called with target='{target_text}', disambiguate={disambiguate}")
+        log.trace("get_text_coordinates_generator called with target='%s', disambiguate=%s", target_text, disambiguate)
         try:
             # Disconnect eye tracker to scan full screen
             actions.user.disconnect_ocr_eye_tracker()
@@ -592,215 +848,78 @@ class OCRTextDetectionActions:
             # Always clear HUD logs before OCR scan to prevent command echo false matches
             clear_hud_event_log()
 
-            # Try different approaches to access the OCR controller
-            import sys
-            gaze_ocr_controller = None
-            
-            # Method 1: Check sys.modules for loaded gaze_ocr_talon
-            for module_name, module in sys.modules.items():
-                if 'gaze_ocr' in module_name and hasattr(module, 'gaze_ocr_controller'):
-                    gaze_ocr_controller = module.gaze_ocr_controller
-                    break
-            
-            if gaze_ocr_controller:
-                # Trigger OCR scan without overlay
-                gaze_ocr_controller.read_nearby()
-                
-                # Get the latest screen contents
-                contents = gaze_ocr_controller.latest_screen_contents()
-                
-                # Search for the target text
-                # PHASE 1: Try phrase sequence matching first (multi-word phrases)
-                text_matches = []
-                all_words = []
-                
-                # Check if this is a multi-word phrase
-                target_words = target_text.split()
-                if len(target_words) > 1:
-                    print(f"Multi-word target detected: '{target_text}' -> {target_words}")
-                    fuzzy_threshold = settings.get("user.menu_fuzzy_threshold", 0.8)
-                    phrase_matches = find_phrase_sequences(target_text, contents.result.lines, fuzzy_threshold)
-                    if phrase_matches:
-                        # Filter HUD matches early so Phase 2 can run if all Phase 1 matches were HUD echoes
-                        phrase_matches = filter_hud_log_results(phrase_matches)
-                    if phrase_matches:
-                        phrase_matches.sort(key=lambda x: x['fuzzy_score'], reverse=True)
-                        text_matches = phrase_matches
-                        print(f"Found {len(text_matches)} phrase sequence matches for '{target_text}' (best score: {text_matches[0]['fuzzy_score']:.2f})")
-
-                # PHASE 2: If no phrase matches, try individual word matching (original behavior)
-                if not text_matches:
-                    print(f"No phrase matches found, trying individual word matching for '{target_text}'")
-
-                    for line_idx, line in enumerate(contents.result.lines):
-                        for word_idx, word in enumerate(line.words):
-                            # Store word for potential fuzzy matching
-                            word_info = {
-                                'coords': (word.left, word.top + word.height // 2),
-                                'text': word.text,
-                                'width': word.width,
-                                'height': word.height,
-                                'line': line_idx,
-                                'word': word_idx
-                            }
-                            all_words.append(word_info)
-
-                            # Try exact matching first
-                            if target_text.lower() in word.text.lower():
-                                text_matches.append(word_info)
-
-                    # If exact matches found, use them
-                    if text_matches:
-                        print(f"Found {len(text_matches)} exact word matches for '{target_text}'")
-                    elif settings.get("user.menu_enable_fuzzy_matching") and RAPIDFUZZ_AVAILABLE and all_words:
-                        if len(target_words) > 1:
-                            # Multi-word target: retry phrase matching with relaxed gap (2x)
-                            print(f"Retrying phrase match with relaxed adjacency gap for '{target_text}'...")
-                            relaxed_gap = settings.get("user.phrase_adjacency_gap", 80) * 2
-                            phrase_matches = find_phrase_sequences(
-                                target_text, contents.result.lines, fuzzy_threshold * 0.9,
-                                max_gap=relaxed_gap
-                            )
-                            if phrase_matches:
-                                phrase_matches.sort(key=lambda x: x['fuzzy_score'], reverse=True)
-                                text_matches = phrase_matches
-                                print(f"Found {len(text_matches)} relaxed phrase matches for '{target_text}'")
-                            else:
-                                print(f"No matches found for multi-word target '{target_text}' even with relaxed gap")
-                        else:
-                            # Single word: existing fuzzy matching behavior
-                            print(f"No exact matches for '{target_text}', trying fuzzy matching...")
-                            fuzzy_threshold = settings.get("user.menu_fuzzy_threshold")
-                            fuzzy_matches = []
-
-                            for word_info in all_words:
-                                score = score_word_fuzzy(word_info['text'], target_text, fuzzy_threshold)
-                                if score >= fuzzy_threshold:
-                                    word_info['fuzzy_score'] = score
-                                    fuzzy_matches.append(word_info)
-
-                            if fuzzy_matches:
-                                # Sort by score (best first) and use fuzzy matches
-                                fuzzy_matches.sort(key=lambda x: x['fuzzy_score'], reverse=True)
-                                text_matches = fuzzy_matches
-                                best_score = text_matches[0]['fuzzy_score'] if text_matches else 0
-                                print(f"Found {len(text_matches)} fuzzy word matches for '{target_text}' (best score: {best_score:.2f})")
-
-                # Filter out results in the HUD log region
-                if text_matches:
-                    text_matches = filter_hud_log_results(text_matches)
-
-                if text_matches:
-                    if len(text_matches) == 1:
-                        # Single match - return coordinates directly
-                        match = text_matches[0]
-                        print(f"Found single '{target_text}' at center coordinates: {match['coords']}")
-                        # Restore HUD command echo after OCR
-                        restore_hud_command_echo(restore_text)
-                        actions.user.connect_ocr_eye_tracker()
-                        return match['coords']
-                    elif disambiguate:
-                        # Sort by position for disambiguation (top-to-bottom, left-to-right)
-                        text_matches.sort(key=lambda m: (m['coords'][1], m['coords'][0]))
-                        
-                        # Multiple matches - yield for disambiguation
-                        print(f"Found {len(text_matches)} instances of '{target_text}', requiring disambiguation (sorted by position)")
-                        for i, match in enumerate(text_matches):
-                            print(f"  {i+1}. '{match['text']}' at {match['coords']}")
-                        
-                        # Yield matches and wait for user selection
-                        chosen_match = yield text_matches
-                        print(f"User chose match: '{chosen_match['text']}' at {chosen_match['coords']}")
-                        print(f"SIMPLE_DEBUG: Coordinate fix starting now!")
-                        
-                        # CRITICAL FIX: The chosen_match contains NUMBER coordinates, not target word coordinates
-                        # Find the actual target word closest to the selected number position
-                        selected_number_coords = chosen_match['coords']
-                        print(f"COORDINATE FIX: Selected number at {selected_number_coords}, finding closest '{target_text}' word")
-                        
-                        # Find closest target word to the selected number
-                        closest_word = None
-                        min_distance = float('inf')
-                        
-                        for match in text_matches:
-                            # Calculate distance from number position to this word instance
-                            word_coords = match['coords']
-                            distance = actions.user.calculate_distance(selected_number_coords, word_coords)
-                            print(f"  Distance from selected number {selected_number_coords} to '{match['text']}' at {word_coords}: {distance:.1f}px")
-                            
-                            if distance < min_distance:
-                                min_distance = distance
-                                closest_word = match
-                        
-                        if closest_word:
-                            actual_target_coords = closest_word['coords']
-                            print(f"COORDINATE FIX: Using closest word '{closest_word['text']}' at {actual_target_coords} (distance: {min_distance:.1f}px)")
-
-                            # Trace the coordinate fix
-                            from ..debug.coordinate_tracer import coord_tracer
-                            coord_tracer.log_event('fixed', actual_target_coords, 'coordinate_fix', {
-                                'original_number_coords': selected_number_coords,
-                                'fixed_word_coords': actual_target_coords,
-                                'word_text': closest_word['text'],
-                                'distance': min_distance
-                            })
-
-                            # Restore HUD command echo after OCR
-                            restore_hud_command_echo(restore_text)
-
-                            actions.user.connect_ocr_eye_tracker()
-                            return actual_target_coords
-                        else:
-                            # Fallback to chosen match if something goes wrong
-                            print("COORDINATE FIX: Warning - couldn't find closest word, using selected match")
-                            # Restore HUD command echo after OCR
-                            restore_hud_command_echo(restore_text)
-                            actions.user.connect_ocr_eye_tracker()
-                            return chosen_match['coords']
-                    else:
-                        # Multiple matches but no disambiguation - use closest to cursor
-                        cursor_pos = actions.user.find_cursor_flexible()
-                        if cursor_pos:
-                            best_match = None
-                            min_distance = float('inf')
-                            
-                            for match in text_matches:
-                                distance = actions.user.calculate_distance(cursor_pos, match['coords'])
-                                if distance < min_distance:
-                                    min_distance = distance
-                                    best_match = match
-                            
-                            if best_match:
-                                print(f"Selected closest '{target_text}' at {best_match['coords']} (distance: {min_distance:.1f}px)")
-                                # Restore HUD command echo after OCR
-                                restore_hud_command_echo(restore_text)
-                                actions.user.connect_ocr_eye_tracker()
-                                return best_match['coords']
-                        else:
-                            # No cursor found, use first match
-                            match = text_matches[0]
-                            print(f"No cursor found, using first '{target_text}' at {match['coords']}")
-                            # Restore HUD command echo after OCR
-                            restore_hud_command_echo(restore_text)
-                            actions.user.connect_ocr_eye_tracker()
-                            return match['coords']
-                
+            lookup = find_text_matches(target_text)
+            text_matches = lookup[1] if lookup else []
+
+            if text_matches:
+                if len(text_matches) == 1:
+                    # Single match - return coordinates directly
+                    match = text_matches[0]
+                    print(f"Found single '{target_text}' at center coordinates: {match['coords']}")
+                    finish_text_lookup(restore_text)
+                    return match['coords']
+
+                if disambiguate:
+                    # Sort by position for disambiguation (top-to-bottom, left-to-right)
+                    text_matches.sort(key=lambda m: (m['coords'][1], m['coords'][0]))
+
+                    # Multiple matches - yield for disambiguation
+                    print(f"Found {len(text_matches)} instances of '{target_text}', requiring disambiguation (sorted by position)")
+                    for i, match in enumerate(text_matches):
+                        print(f"  {i+1}. '{match['text']}' at {match['coords']}")
+
+                    # Yield matches and wait for user selection
+                    chosen_match = yield text_matches
+                    print(f"User chose match: '{chosen_match['text']}' at {chosen_match['coords']}")
+
+                    # CRITICAL FIX: The chosen_match contains NUMBER coordinates, not target word coordinates
+                    # Find the actual target word closest to the selected number position
+                    selected_number_coords = chosen_match['coords']
+                    print(f"COORDINATE FIX: Selected number at {selected_number_coords}, finding closest '{target_text}' word")
+                    closest_word, min_distance = closest_match(text_matches, selected_number_coords)
+
+                    if closest_word:
+                        actual_target_coords = closest_word['coords']
+                        print(f"COORDINATE FIX: Using closest word '{closest_word['text']}' at {actual_target_coords} (distance: {min_distance:.1f}px)")
+
+                        # Trace the coordinate fix
+                        from ..debug.coordinate_tracer import coord_tracer
+                        coord_tracer.log_event('fixed', actual_target_coords, 'coordinate_fix', {
+                            'original_number_coords': selected_number_coords,
+                            'fixed_word_coords': actual_target_coords,
+                            'word_text': closest_word['text'],
+                            'distance': min_distance
+                        })
+
+                        finish_text_lookup(restore_text)
+                        return actual_target_coords
+
+                    # Fallback to chosen match if something goes wrong
+                    print("COORDINATE FIX: Warning - couldn't find closest word, using selected match")
+                    finish_text_lookup(restore_text)
+                    return chosen_match['coords']
+
+                # Multiple matches but no disambiguation - use closest to cursor
+                cursor_pos = actions.user.find_cursor_flexible()
+                if cursor_pos:
+                    match, min_distance = closest_match(text_matches, cursor_pos)
+                    print(f"Selected closest '{target_text}' at {match['coords']} (distance: {min_distance:.1f}px)")
+                else:
+                    # No cursor found, use first match
+                    match = text_matches[0]
+                    print(f"No cursor found, using first '{target_text}' at {match['coords']}")
+                finish_text_lookup(restore_text)
+                return match['coords']
+
+            if lookup:
                 print(f"Text '{target_text}' not found in OCR results")
-            else:
-                print("Could not find gaze_ocr_controller via any method")
-
-            # Restore HUD command echo after OCR
-            restore_hud_command_echo(restore_text)
-
-            # Reconnect eye tracker
-            actions.user.connect_ocr_eye_tracker()
+            finish_text_lookup(restore_text)
             return None
 
         except Exception as e:
             print(f"Error getting text coordinates: {str(e)}")
             # Restore HUD command echo even on error
-            restore_hud_command_echo(restore_text)
-            actions.user.connect_ocr_eye_tracker()
+            finish_text_lookup(restore_text)
             return None
 
     def check_if_disambiguation_needed(target_text: str, source_command: str = None) -> bool:
@@ -813,78 +932,19 @@ class OCRTextDetectionActions:
             # Always clear HUD logs before OCR scan to prevent command echo false matches
             clear_hud_event_log()
 
-            # Try different approaches to access the OCR controller
-            import sys
-            gaze_ocr_controller = None
-            
-            # Method 1: Check sys.modules for loaded gaze_ocr_talon
-            for module_name, module in sys.modules.items():
-                if 'gaze_ocr' in module_name and hasattr(module, 'gaze_ocr_controller'):
-                    gaze_ocr_controller = module.gaze_ocr_controller
-                    break
-            
-            if gaze_ocr_controller:
-                # Trigger OCR scan without overlay
-                gaze_ocr_controller.read_nearby()
-                
-                # Get the latest screen contents
-                contents = gaze_ocr_controller.latest_screen_contents()
-                
-                # Count matches
-                text_matches = []
-                all_words = []
-                
-                for line_idx, line in enumerate(contents.result.lines):
-                    for word_idx, word in enumerate(line.words):
-                        # Store word for potential fuzzy matching
-                        word_info = {
-                            'coords': (word.left, word.top + word.height // 2),
-                            'text': word.text,
-                            'width': word.width,
-                            'height': word.height,
-                            'line': line_idx,
-                            'word': word_idx
-                        }
-                        all_words.append(word_info)
-                        
-                        # Try exact matching first
-                        if target_text.lower() in word.text.lower():
-                            text_matches.append(word_info)
-                
-                # Check fuzzy matching if no exact matches
-                if not text_matches and settings.get("user.menu_enable_fuzzy_matching") and RAPIDFUZZ_AVAILABLE and all_words:
-                    fuzzy_threshold = settings.get("user.menu_fuzzy_threshold")
-
-                    for word_info in all_words:
-                        score = score_word_fuzzy(word_info['text'], target_text, fuzzy_threshold)
-                        if score >= fuzzy_threshold:
-                            text_matches.append(word_info)
-
-                # Filter out results in the HUD log region
-                if text_matches:
-                    text_matches = filter_hud_log_results(text_matches)
-
-                # Restore HUD command echo after OCR check
-                restore_hud_command_echo(restore_text)
-
-                # Reconnect eye tracker
-                actions.user.connect_ocr_eye_tracker()
-
-                # Return True if more than one match
-                result = len(text_matches) > 1
-                print(f"Disambiguation check for '{target_text}': {len(text_matches)} matches found, needs_disambiguation={result}")
-                return result
-            else:
-                print("Could not find gaze_ocr_controller for disambiguation check")
-                # Restore HUD command echo even on failure
-                restore_hud_command_echo(restore_text)
-                # Reconnect eye tracker
-                actions.user.connect_ocr_eye_tracker()
+            lookup = find_text_matches(target_text)
+            finish_text_lookup(restore_text)
+            if not lookup:
                 return False
 
+            # Return True if more than one match
+            tier, text_matches = lookup
+            result = len(text_matches) > 1
+            print(f"Disambiguation check for '{target_text}': {len(text_matches)} {tier or ''} matches found, needs_disambiguation={result}")
+            return result
+
         except Exception as e:
             print(f"Error checking disambiguation need: {str(e)}")
             # Restore HUD command echo even on error
-            restore_hud_command_echo(restore_text)
-            actions.user.connect_ocr_eye_tracker()
+            finish_text_lookup(restore_text)
             return False
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Inverted token index over OCR words for pathfinding system.
+
+Maps each lowercased OCR token to the (line, word) positions it appears at, so
+phrase search can start only from positions where a target token fuzzily
+matches instead of sliding a window over every word of every line.
+"""
+
+import string
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Punctuation OCR tends to attach to menu words ("Fire:", "Items.")
+OCR_TOKEN_STRIP = string.punctuation + "’"
+
+def normalize_token(text: str) -> str:
+    """Lowercase a token and strip surrounding punctuation"""
+    return text.lower().strip(OCR_TOKEN_STRIP)
+
+class TokenIndex:
+    """Token -> [(line_idx, word_idx)] postings for one set of OCR lines"""
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.postings = {}
+        for line_idx, line in enumerate(lines):
+            for word_idx, word in enumerate(line.words):
+                self.postings.setdefault(word.text.lower(), []).append((line_idx, word_idx))
+        self.vocabulary = list(self.postings)
+        self.fuzzy_cache = {}
+        self.normalized_postings = None
+
+    def normalized_positions(self, token: str) -> list:
+        """Positions of OCR words equal to token once both are normalized (O(1) after first use)"""
+        if self.normalized_postings is None:
+            self.normalized_postings = {}
+            for ocr_token, positions in self.postings.items():
+                self.normalized_postings.setdefault(normalize_token(ocr_token), []).extend(positions)
+        return self.normalized_postings.get(normalize_token(token), [])
+
+    def fuzzy_positions(self, token: str, cutoff: float) -> list:
+        """Positions of every OCR token whose fuzz.ratio with token is at least cutoff (0.0-1.0)"""
+        key = (token, cutoff)
+        if key not in self.fuzzy_cache:
+            matches = process.extract(
+                token, self.vocabulary, scorer=fuzz.ratio, score_cutoff=cutoff * 100, limit=None
+            )
+            positions = []
+            for matched_token, _, _ in matches:
+                positions.extend(self.postings[matched_token])
+            self.fuzzy_cache[key] = positions
+        return self.fuzzy_cache[key]
+
+    def seed_windows(self, target_words: list, cutoff: float) -> list:
+        """Sorted (line_idx, start_idx) windows anchored wherever any target word matches"""
+        window_size = len(target_words)
+        hits = [self.fuzzy_positions(word, cutoff) for word in target_words]
+
+        # Seed from every word, so misread words (even the first and the rarest) cannot hide the phrase
+        windows = set()
+        for position in range(window_size):
+            for line_idx, word_idx in hits[position]:
+                start_idx = word_idx - position
+                if 0 <= start_idx <= len(self.lines[line_idx].words) - window_size:
+                    windows.add((line_idx, start_idx))
+        return sorted(windows)
+
+# Index for the most recently searched OCR lines, reused by relaxed-gap retries and later phases
+cached_token_index = None
+
+def get_token_index(lines) -> TokenIndex:
+    """Return the token index for these OCR lines, building it only when the lines change"""
+    global cached_token_index
+    if cached_token_index is None or cached_token_index.lines is not lines:
+        cached_token_index = TokenIndex(lines)
+    return cached_token_index
+
+def seed_token_cutoff(fuzzy_threshold: float) -> float:
+    """Per-word similarity needed to seed a window that could still reach fuzzy_threshold as a phrase"""
+    return max(0.5, 2 * fuzzy_threshold - 1)
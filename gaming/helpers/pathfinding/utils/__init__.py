@@ -6,8 +6,16 @@ Contains helper functions, geometry calculations, and common utilities.
 
 from . import geometry
 from . import action_helpers
+from . import screen_capture
+from . import integrations
+from . import worker_pool
+from . import pathfinding_log
 
 __all__ = [
     'geometry',
-    'action_helpers'
+    'action_helpers',
+    'screen_capture',
+    'integrations',
+    'worker_pool',
+    'pathfinding_log'
 ]
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Integration registry for pathfinding system.
+
+Resolves other user-script integrations (talon-gaze-ocr, talon-hud, flex-mouse-grid)
+once and caches the handles instead of scanning sys.modules on every call. A handle
+is re-resolved when its module object is replaced (Talon reloaded the file) or when
+a caller reports it failed. An override controller (see ocr/backends.py) can stand
+in for gaze-ocr, e.g. to replay recorded OCR without a screen.
+"""
+
+from talon import settings
+from .worker_pool import main_thread_value
+import sys
+
+class IntegrationHandle:
+    """Cached lookup of a module-level attribute exported by another user script"""
+
+    def __init__(self, name: str, module_fragments: tuple, attribute: str, builtins_fallback: bool = False):
+        self.name = name
+        self.module_fragments = module_fragments
+        self.attribute = attribute
+        self.builtins_fallback = builtins_fallback
+        self.module_name = None
+        self.module = None
+        self.override = None
+        self.resolve_count = 0
+        # Objects looked up inside the integration, dropped when it is re-resolved
+        self.children = {}
+
+    def resolve(self):
+        """Scan sys.modules for the integration, caching the module that exports it"""
+        self.resolve_count += 1
+        self.module_name = None
+        self.module = None
+        self.children = {}
+        for module_name, module in list(sys.modules.items()):
+            if all(fragment in module_name for fragment in self.module_fragments) and hasattr(module, self.attribute):
+                self.module_name = module_name
+                self.module = module
+                print(f"Resolved {self.name} integration via {module_name}")
+                return getattr(module, self.attribute)
+
+        if self.builtins_fallback:
+            import builtins
+            if hasattr(builtins, self.attribute):
+                print(f"Resolved {self.name} integration via builtins")
+                return getattr(builtins, self.attribute)
+        return None
+
+    def get(self):
+        """Return the integration object, re-resolving only after a reload or failure"""
+        if self.override is not None:
+            return self.override
+        # A reload replaces the module object under the same name
+        if self.module is not None and sys.modules.get(self.module_name) is self.module:
+            value = getattr(self.module, self.attribute, None)
+            if value is not None:
+                return value
+        return self.resolve()
+
+    def invalidate(self, reason: str = "call failed"):
+        """Forget the cached module so the next get() rescans"""
+        if self.module is not None:
+            print(f"Invalidated {self.name} integration ({reason})")
+        self.module_name = None
+        self.module = None
+        self.children = {}
+
+    def install_override(self, value):
+        """Use value instead of the real integration (None restores the real one)"""
+        self.override = value
+
+gaze_ocr = IntegrationHandle("gaze-ocr", ("gaze_ocr",), "gaze_ocr_controller", builtins_fallback=True)
+talon_hud = IntegrationHandle("talon-hud", ("talon_hud", "display"), "hud")
+flex_mouse_grid = IntegrationHandle("flex-mouse-grid", ("flex_mouse_grid",), "mg")
+
+def get_gaze_ocr_controller():
+    """talon-gaze-ocr's controller, or the controller for another user.ocr_backend; None if unavailable"""
+    return main_thread_value("ocr_controller", resolve_gaze_ocr_controller)
+
+def resolve_gaze_ocr_controller():
+    """Look up the OCR controller for user.ocr_backend; main thread only"""
+    if gaze_ocr.override is None and settings.get("user.ocr_backend") != "gaze":
+        # Imported here: the ocr package imports this module while it loads
+        from ..ocr.backends import get_backend_controller
+        return get_backend_controller()
+    return gaze_ocr.get()
+
+def get_hud_widget(widget_id: str):
+    """The talon-hud widget with this id, or None; cached until talon-hud reloads"""
+    hud = talon_hud.get()
+    if hud is None or not hasattr(hud, 'widget_manager'):
+        return None
+
+    cached = talon_hud.children.get(widget_id)
+    if cached is not None and cached[0] is hud:
+        return cached[1]
+
+    try:
+        for widget in hud.widget_manager.widgets:
+            if getattr(widget, 'id', None) == widget_id:
+                talon_hud.children[widget_id] = (hud, widget)
+                return widget
+    except Exception as e:
+        talon_hud.invalidate(str(e))
+    return None
+
+def get_flex_grid_controller():
+    """flex-mouse-grid's controller, or None"""
+    return flex_mouse_grid.get()
+
+def invalidate_integrations(reason: str = "reload requested"):
+    """Force every integration to be resolved again on next use"""
+    for handle in (gaze_ocr, talon_hud, flex_mouse_grid):
+        handle.invalidate(reason)
@@ -0,0 +1,93 @@
+"""
+Level-gated logging for pathfinding system.
+
+Messages use %-style arguments and are only formatted when they are printed or
+dumped, so trace calls in per-word and per-candidate loops cost a level check
+when trace is off. Recent events at debug level and above (and trace events while
+trace is on) are kept unformatted in a ring buffer that can be dumped after a
+failure.
+"""
+
+from talon import Module, settings
+from collections import deque
+import time
+
+mod = Module()
+
+ERROR, WARN, INFO, DEBUG, TRACE = 0, 1, 2, 3, 4
+LEVEL_NAMES = {"error": ERROR, "warn": WARN, "info": INFO, "debug": DEBUG, "trace": TRACE}
+LEVEL_LABELS = {level: name.upper() for name, level in LEVEL_NAMES.items()}
+
+class PathfindingLog:
+    """Printing threshold plus a ring buffer of recent unformatted events"""
+
+    def __init__(self, buffer_size: int = 500):
+        self.level = INFO
+        self.buffer_level = DEBUG
+        self.events = deque(maxlen=buffer_size)
+
+    def refresh(self):
+        """Re-read user.pathfinding_log_level; called once per lookup or tick, not per message"""
+        self.level = LEVEL_NAMES.get(str(settings.get("user.pathfinding_log_level")).lower(), INFO)
+        self.buffer_level = max(self.level, DEBUG)
+        buffer_size = settings.get("user.pathfinding_log_buffer_size")
+        if buffer_size != self.events.maxlen:
+            self.events = deque(self.events, maxlen=max(1, buffer_size))
+
+    def enabled(self, level: int) -> bool:
+        """True when messages at level are recorded; hoist this out of hot loops"""
+        return level <= self.buffer_level
+
+    def log(self, level: int, message: str, *args):
+        if level > self.buffer_level:
+            return
+        self.events.append((time.time(), level, message, args))
+        if level <= self.level:
+            print(message % args if args else message)
+
+    def error(self, message: str, *args):
+        self.log(ERROR, message, *args)
+
+    def warn(self, message: str, *args):
+        self.log(WARN, message, *args)
+
+    def info(self, message: str, *args):
+        self.log(INFO, message, *args)
+
+    def debug(self, message: str, *args):
+        self.log(DEBUG, message, *args)
+
+    def trace(self, message: str, *args):
+        self.log(TRACE, message, *args)
+
+    def recent(self, count: int) -> list:
+        """The last count events as formatted lines, oldest first"""
+        lines = []
+        for timestamp, level, message, args in list(self.events)[-count:]:
+            try:
+                text = message % args if args else message
+            except Exception as e:
+                text = f"{message} {args} (format error: {e})"
+            clock = time.strftime("%H:%M:%S", time.localtime(timestamp)) + f".{int(timestamp * 1000) % 1000:03d}"
+            lines.append(f"{clock} {LEVEL_LABELS[level]:5} {text}")
+        return lines
+
+    def dump(self, reason: str, count: int = 40):
+        """Print the most recent events, e.g. after navigation gives up"""
+        print(f"=== PATHFINDING LOG: last {min(count, len(self.events))} events ({reason}) ===")
+        for line in self.recent(count):
+            print(line)
+        print("=== END PATHFINDING LOG ===")
+
+# Shared logger for every pathfinding module
+log = PathfindingLog()
+
+@mod.action_class
+class PathfindingLogActions:
+    def dump_pathfinding_log(count: int = 100) -> None:
+        """Print the most recent pathfinding log events from the ring buffer"""
+        log.dump("requested", count)
+
+    def clear_pathfinding_log() -> None:
+        """Empty the pathfinding log ring buffer"""
+        log.events.clear()
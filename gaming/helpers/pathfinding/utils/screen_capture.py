@@ -0,0 +1,109 @@
+"""
+Screen capture helpers for pathfinding system.
+
+Captures screen regions as NumPy arrays and reduces them to cheap frame hashes
+used to detect whether the screen has changed.
+"""
+
+from talon import screen, ui
+from talon.types import Rect as TalonRect
+from .worker_pool import main_thread_value
+import hashlib
+import os
+import tempfile
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    print("NumPy not available - frame hashing disabled")
+    NUMPY_AVAILABLE = False
+
+try:
+    from PIL import Image as PilImage
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+def rect_from_bounds(bounds: tuple) -> TalonRect:
+    """Convert (left_x, top_y, right_x, bottom_y) into a Talon Rect"""
+    left_x, top_y, right_x, bottom_y = bounds
+    return TalonRect(left_x, top_y, right_x - left_x, bottom_y - top_y)
+
+def main_screen_bounds() -> tuple:
+    """Return the main screen as (left_x, top_y, right_x, bottom_y)"""
+    return main_thread_value("screen_bounds", read_main_screen_bounds)
+
+def read_main_screen_bounds() -> tuple:
+    """Main screen bounds from Talon's ui; main thread only"""
+    rect = ui.main_screen().rect
+    return (int(rect.x), int(rect.y), int(rect.x + rect.width), int(rect.y + rect.height))
+
+def capture_screen_image(bounds: tuple = None):
+    """Capture the main screen, or (left_x, top_y, right_x, bottom_y) of it, as a Talon image"""
+    return screen.capture_rect(rect_from_bounds(bounds or main_screen_bounds()))
+
+def load_png_as_array(filepath: str):
+    """Load PNG file into numpy array using pypng (pure Python, no code signing issues)"""
+    import png
+    reader = png.Reader(filename=filepath)
+    w, h, pixels, metadata = reader.read()
+    pixel_array = np.array(list(pixels), dtype=np.uint8)
+    channels = metadata['planes']
+    return pixel_array.reshape(h, w, channels)
+
+def image_to_array(image):
+    """Convert a Talon image into an (height, width, channels) uint8 array"""
+    try:
+        array = np.asarray(image)
+        if array.ndim == 3:
+            return array
+    except Exception:
+        pass
+
+    # Fallback: round-trip through a temporary PNG
+    temp_path = os.path.join(tempfile.gettempdir(), "talon_pathfinding_capture.png")
+    image.save(temp_path)
+    try:
+        return load_png_as_array(temp_path)
+    finally:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+def capture_screen_array(bounds: tuple = None):
+    """Capture the main screen or a region as a NumPy array"""
+    return image_to_array(capture_screen_image(bounds))
+
+def array_to_pil_image(array, bounds: tuple):
+    """RGB PIL image of a captured array, resized from physical pixels to the bounds in screen points"""
+    image = PilImage.fromarray(np.ascontiguousarray(array[:, :, :3]))
+    size = (bounds[2] - bounds[0], bounds[3] - bounds[1])
+    return image if image.size == size else image.resize(size)
+
+def to_gray(array):
+    """Mean of the colour channels as a float32 (height, width) array"""
+    if array.ndim == 2:
+        return array.astype(np.float32)
+    return array[:, :, :3].mean(axis=2, dtype=np.float32)
+
+def downsample_gray(array, block: int = 4):
+    """Average (block x block) pixel blocks of the colour channels into a small greyscale frame"""
+    height = array.shape[0] // block * block
+    width = array.shape[1] // block * block
+    blocks = array[:height, :width, :3].reshape(height // block, block, width // block, block, 3)
+    # Integer sums avoid converting the whole frame to float
+    sums = blocks.sum(axis=(1, 3, 4), dtype=np.uint32)
+    return sums / float(block * block * 3)
+
+def quantized_thumbnail(array, block: int = 4, levels: int = 32):
+    """Block-averaged greyscale frame quantized to a few levels, insensitive to pixel noise"""
+    return (downsample_gray(array, block) * (levels / 256.0)).astype(np.uint8)
+
+def frame_hash(array, block: int = 4, levels: int = 32) -> str:
+    """Perceptual-ish hash: block-averaged greyscale quantized to a few levels, then digested"""
+    quantized = quantized_thumbnail(array, block, levels)
+    digest = hashlib.blake2b(quantized.tobytes(), digest_size=16)
+    digest.update(str(quantized.shape).encode())
+    return digest.hexdigest()
@@ -0,0 +1,165 @@
+"""
+Background workers for pathfinding system.
+
+Runs screen capture and recognition off Talon's main thread. One job runs at a
+time: submitting while a job is still in flight is refused, so callers drop that
+tick instead of queueing work for a screen that has already moved on. Results are
+handed back on the main thread through cron, where keys are pressed and canvases
+drawn. A separate pool fans independent jobs (one per cursor template) out across
+threads and keeps the first result.
+
+Jobs never call Talon actions or read settings themselves. The main thread reads
+those values before submitting and the job installs them with main_thread_values,
+so the helpers it shares with the synchronous path read plain values instead.
+"""
+
+from talon import cron, settings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+import threading
+import time
+
+class MainThreadValues(threading.local):
+    """Settings and Talon state read on the main thread for the job running on this thread"""
+
+    values = None
+
+    @contextmanager
+    def use(self, values: dict):
+        """Serve main_thread_value() from values until the block exits"""
+        self.values = values
+        try:
+            yield
+        finally:
+            self.values = None
+
+# Values installed by the job running on the current worker thread (None on the main thread)
+main_thread_values = MainThreadValues()
+
+def main_thread_value(key: str, read):
+    """read() on the main thread; inside a worker job, the value read for key before it was submitted"""
+    values = main_thread_values.values
+    if values is None:
+        return read()
+    if key not in values:
+        raise KeyError(f"'{key}' was not read on the main thread before the worker job was submitted")
+    return values[key]
+
+def setting(name: str, default=None):
+    """settings.get(name) that worker jobs answer from the values read on the main thread"""
+    return main_thread_value(name, lambda: settings.get(name) if default is None else settings.get(name, default))
+
+class PathfindingWorker:
+    """Single-slot worker thread whose results are delivered back through cron"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.executor = None
+        self.lock = threading.Lock()
+        self.busy = False
+        self.submitted = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_job_ms = 0.0
+
+    def submit_if_idle(self, job, on_result, on_error=None) -> bool:
+        """Run job() on the worker and on_result(result) on the main thread; False if still busy"""
+        with self.lock:
+            if self.busy:
+                self.dropped += 1
+                return False
+            self.busy = True
+            self.submitted += 1
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+
+        start = time.perf_counter()
+
+        def job_finished(future):
+            self.last_job_ms = (time.perf_counter() - start) * 1000
+            cron.after("0ms", lambda: self.deliver(future, on_result, on_error))
+
+        self.executor.submit(job).add_done_callback(job_finished)
+        return True
+
+    def deliver(self, future, on_result, on_error):
+        """Main-thread half of a job: hand over the result, then accept new work"""
+        try:
+            error = future.exception()
+            if error is None:
+                on_result(future.result())
+            else:
+                self.failed += 1
+                print(f"{self.name} job failed: {error}")
+                if on_error:
+                    on_error(error)
+        finally:
+            with self.lock:
+                self.busy = False
+
+    def shutdown(self):
+        """Let the worker thread exit once its current job finishes"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+# Worker for continuous navigation's OCR and cursor detection
+navigation_worker = PathfindingWorker("pathfinding-navigation")
+
+# Worker for the background OCR prefetch
+prefetch_worker = PathfindingWorker("pathfinding-prefetch")
+
+class FirstResultPool:
+    """Thread pool running one job per item; the first accepted result wins and the rest are cancelled"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.executor = None
+        self.workers = 0
+        self.runs = 0
+        self.cancelled = 0
+        self.last_run_ms = 0.0
+
+    def first_result(self, items: list, job, workers: int, accept=bool) -> tuple:
+        """(item, result, completed) for the first job(item, stop) whose result passes accept
+
+        completed maps every item whose job finished to its result. Jobs that have
+        not started when an accepted result lands are cancelled; running jobs should
+        return early once stop is set. item and result are None when nothing passed.
+        """
+        if self.executor is None or self.workers != workers:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.name)
+            self.workers = workers
+
+        start = time.perf_counter()
+        self.runs += 1
+        stop = threading.Event()
+        futures = {self.executor.submit(job, item, stop): item for item in items}
+        completed = {}
+        try:
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    completed[item] = future.result()
+                except Exception as e:
+                    print(f"{self.name} job for {item} failed: {e}")
+                    continue
+                if accept(completed[item]):
+                    return item, completed[item], completed
+            return None, None, completed
+        finally:
+            stop.set()
+            self.cancelled += sum(1 for future in futures if future.cancel())
+            self.last_run_ms = (time.perf_counter() - start) * 1000
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+            self.workers = 0
+
+# Pool for matching several cursor templates against the same capture at once
+template_sweep_pool = FirstResultPool("pathfinding-template-sweep")